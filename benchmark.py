@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the parsing, scoring and report hot paths.
+
+Generates synthetic corpora (text resumes, multi-page PDFs, large HTML job
+pages served from a local HTTP server), measures throughput and peak Python
+memory of each stage, and compares the results against a JSON baseline so
+regressions fail loudly. End-to-end crew runs use a stubbed LLM, so the
+whole suite runs offline.
+
+    python benchmark.py                   # compare with benchmarks/baseline.json
+    python benchmark.py --save-baseline   # record a new baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from crewai import BaseLLM
+
+from fixtures import make_pdf
+from main import generate_markdown_report, save_results
+from src.resume_crew import runner
+from src.resume_crew.instrumentation import Tracer, configure_tracer
+from src.resume_crew.profiles import JobProfile, configure_profile_cache
+from src.resume_crew.reports import export_reports
+from src.resume_crew.results import DEFAULT_WRITE_BATCH, ResultsStore, match_row
+from src.resume_crew.scoring import MatchScorer
+from src.resume_crew.semantic import HashingEmbedder, SemanticIndex
+from src.resume_crew.tools import JobAnalysisTools, ResumeAnalysisTools
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "benchmarks" / "baseline.json"
+DEFAULT_RESULTS_PATH = "output/bench_results.json"
+
+# Timed passes repeat the corpus until they take at least this long, to keep timer noise down
+MIN_PASS_SECONDS = 0.5
+
+# A benchmark regresses when its throughput drops, or its peak memory grows, by more than this fraction
+DEFAULT_TOLERANCE = 0.25
+
+# Corpus sizes at --scale 1
+CORPUS_SIZES = {
+    "text_resumes": 200,
+    "pdf_resumes": 20,
+    "pdf_pages": 4,
+    "job_pages": 8,
+    "job_page_kb": 256,
+    "reports": 50,
+    "report_records": 1000,
+    "result_rows": 20000,
+    "semantic_resumes": 1000,
+    "crew_runs": 10,
+}
+
+SKILLS = [
+    "Python", "Java", "Go", "Kubernetes", "Docker", "AWS", "Google Cloud Platform", "Azure", "SQL",
+    "PostgreSQL", "Kafka", "Spark", "Terraform", "React", "TypeScript", "Machine Learning",
+    "TensorFlow", "PyTorch", "Airflow", "Linux", "CI/CD", "GraphQL", "Redis", "Snowflake",
+]
+VERBS = ["Built", "Led", "Designed", "Migrated", "Scaled", "Automated", "Owned", "Shipped"]
+NOUNS = ["data pipelines", "microservices", "a billing platform", "ML models", "the CI system",
+         "customer dashboards", "a search service", "internal tooling"]
+
+JOB_ANALYSIS = {
+    "job_title": "Senior Platform Engineer",
+    "required_skills": ["Python", "Kubernetes", "AWS", "Terraform", "SQL"],
+    "preferred_skills": ["Go", "Kafka", "Machine Learning"],
+    "required_experience": "5+ years of backend or platform engineering",
+    "key_responsibilities": ["Operate cloud infrastructure", "Build data pipelines"],
+    "company_culture": "Remote-first, written communication",
+}
+
+RESUME_OPTIMIZATION = {
+    "match_scores": {"technical_skills": 78, "experience_relevance": 70, "education_requirements": 90, "overall_fit": 76},
+    "skill_gaps": ["Terraform", "Kafka"],
+    "optimization_suggestions": ["Quantify the impact of the Kubernetes migration"],
+    "action_items": ["Add a skills section listing cloud tooling"],
+    "ats_optimization": ["Use standard section headings"],
+}
+
+
+def text_resume(rng: random.Random, index: int) -> str:
+    """
+    A synthetic resume of a few hundred words with the usual sections.
+    """
+    skills = rng.sample(SKILLS, 8)
+    jobs = []
+    for job in range(rng.randint(2, 4)):
+        start = rng.randint(2008, 2020)
+        bullets = "\n".join(
+            f"- {rng.choice(VERBS)} {rng.choice(NOUNS)} with {rng.choice(skills)} and {rng.choice(skills)}"
+            for _ in range(rng.randint(3, 6))
+        )
+        jobs.append(f"Engineer, Company {index}-{job}, {start}-{start + rng.randint(1, 4)}\n{bullets}")
+    return (
+        f"Candidate {index}\nSoftware Engineer\ncandidate{index}@example.com\n\n"
+        f"SUMMARY\n{rng.randint(3, 15)} years of experience building {rng.choice(NOUNS)}.\n\n"
+        f"SKILLS\n{', '.join(skills)}\n\n"
+        f"EXPERIENCE\n" + "\n\n".join(jobs) + "\n\n"
+        f"EDUCATION\nB.Sc. Computer Science, {rng.randint(2000, 2016)}\n"
+    )
+
+
+def job_page(rng: random.Random, index: int, size_kb: int) -> bytes:
+    """
+    A job posting padded to size_kb with the scripts, styles and navigation of a real careers page.
+    """
+    description = "".join(
+        f"<li>{rng.choice(VERBS)} {rng.choice(NOUNS)} using {rng.choice(SKILLS)}</li>" for _ in range(30)
+    )
+    head = f"<html><head><title>Job {index}</title><style>{'.c{color:red}' * 200}</style></head><body>"
+    body = f"<nav>{'<a href=/x>Link</a>' * 50}</nav><main><h1>Senior Engineer {index}</h1><ul>{description}</ul></main>"
+    filler = "<script>var tracking = {};</script><div class='footer'>Careers footer text</div>"
+    page = head + body
+    while len(page) < size_kb * 1024:
+        page += filler
+    return (page + "</body></html>").encode("utf-8")
+
+
+class StubLLM(BaseLLM):
+    """
+    Offline LLM returning canned task outputs, so crew runs exercise the
+    real agent executor and output parsing without network calls.
+    """
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, **kwargs) -> str:
+        prompt = messages if isinstance(messages, str) else json.dumps(messages)
+        output = RESUME_OPTIMIZATION if "match score" in prompt.lower() else JOB_ANALYSIS
+        return json.dumps(output)
+
+
+class JobPageHandler(BaseHTTPRequestHandler):
+    """Serves the synthetic job pages at /jobs/<n>."""
+
+    pages: List[bytes] = []
+
+    def do_GET(self):
+        page = self.pages[int(self.path.rsplit("/", 1)[-1])]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(name: str, func: Callable[[Any], Any], items: List[Any], item_bytes: int = 0,
+            repeat: int = 3) -> Dict[str, Any]:
+    """
+    Run func over items: a warm-up pass sizes the timed passes to at least
+    MIN_PASS_SECONDS (cycling through the corpus), the fastest of repeat
+    timed passes is kept, and a final pass runs under tracemalloc for peak
+    Python memory (tracing slows allocation, so it is kept out of the timing).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        rounds = max(1, math.ceil(MIN_PASS_SECONDS / (time.perf_counter() - start)))
+
+        seconds = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for item in items:
+                    func(item)
+            seconds = min(seconds, time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            for item in items:
+                func(item)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    result = {
+        "items": len(items),
+        "rounds": rounds,
+        "seconds": round(seconds, 4),
+        "items_per_second": round(len(items) * rounds / seconds, 2),
+        "peak_memory_mb": round(peak / (1024 * 1024), 3)
+    }
+    if item_bytes:
+        result["mb_per_second"] = round(item_bytes * rounds / (1024 * 1024) / seconds, 3)
+    print(f"   {name:<20} {result['items']:>6} items {result['items_per_second']:>10.1f}/s "
+          f"{result['peak_memory_mb']:>9.2f} MB peak")
+    return result
+
+
+def run_benchmarks(scale: float = 1.0, only: Optional[List[str]] = None, seed: int = 7) -> Dict[str, Any]:
+    """
+    Generate the corpora at the given scale and run every benchmark (or the named ones).
+    Caches are disabled so every item does the full work.
+    """
+    sizes = {key: max(1, int(value * scale)) for key, value in CORPUS_SIZES.items()}
+    sizes["pdf_pages"] = CORPUS_SIZES["pdf_pages"]
+    sizes["job_page_kb"] = CORPUS_SIZES["job_page_kb"]
+    rng = random.Random(seed)
+
+    ResumeAnalysisTools.configure_parse_cache(None)
+    JobAnalysisTools.configure_fetch_cache(None)
+    runner.configure_task_cache(None)
+    configure_profile_cache(None)
+    configure_tracer(Tracer())
+
+    selected = lambda name: only is None or name in only
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        resumes = [text_resume(rng, i) for i in range(sizes["text_resumes"])]
+        text_paths = []
+        for i, content in enumerate(resumes):
+            path = tmp / f"resume_{i}.txt"
+            path.write_text(content, encoding="utf-8")
+            text_paths.append(str(path))
+
+        if selected("parse_text"):
+            results["parse_text"] = measure(
+                "parse_text", ResumeAnalysisTools.analyze_resume, text_paths,
+                sum(len(content.encode("utf-8")) for content in resumes)
+            )
+
+        if selected("parse_pdf"):
+            pdf_paths, pdf_bytes = [], 0
+            for i in range(sizes["pdf_resumes"]):
+                lines = resumes[i % len(resumes)].splitlines()
+                pages = [" ".join(lines[page::sizes["pdf_pages"]]).replace("(", "").replace(")", "")
+                         for page in range(sizes["pdf_pages"])]
+                data = make_pdf(pages)
+                path = tmp / f"resume_{i}.pdf"
+                path.write_bytes(data)
+                pdf_paths.append(str(path))
+                pdf_bytes += len(data)
+            results["parse_pdf"] = measure("parse_pdf", ResumeAnalysisTools.analyze_resume, pdf_paths, pdf_bytes)
+
+        if selected("fetch_job_page"):
+            JobPageHandler.pages = [job_page(rng, i, sizes["job_page_kb"]) for i in range(sizes["job_pages"])]
+            server = ThreadingHTTPServer(("127.0.0.1", 0), JobPageHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                urls = [f"http://127.0.0.1:{server.server_port}/jobs/{i}" for i in range(sizes["job_pages"])]
+                results["fetch_job_page"] = measure(
+                    "fetch_job_page", JobAnalysisTools.extract_job_details, urls,
+                    sum(len(page) for page in JobPageHandler.pages)
+                )
+            finally:
+                server.shutdown()
+                server.server_close()
+
+        if selected("match_scoring"):
+            scorer = MatchScorer(JOB_ANALYSIS)
+            results["match_scoring"] = measure(
+                "match_scoring", scorer.score, resumes, sum(len(content.encode("utf-8")) for content in resumes)
+            )
+
+        if selected("report"):
+            result_data = {"tasks_output": [
+                {"agent": "Job Requirements Analyst", "raw": json.dumps(JOB_ANALYSIS), "parsed": JOB_ANALYSIS},
+                {"agent": "Resume Optimization Specialist", "raw": json.dumps(RESUME_OPTIMIZATION),
+                 "parsed": RESUME_OPTIMIZATION},
+            ]}
+            report_dir = tmp / "reports"
+            report_dir.mkdir()
+            results["report"] = measure(
+                "report", lambda _: generate_markdown_report(result_data, report_dir), range(sizes["reports"])
+            )
+            results["save_results"] = measure(
+                "save_results", lambda _: save_results(result_data, report_dir), range(sizes["reports"])
+            )
+
+        if selected("report_export"):
+            records = [
+                match_row(f"https://example.com/jobs/{index % 10}", f"resumes/Candidate_{index}.pdf",
+                          RESUME_OPTIMIZATION, company_name="Example", job_title=JOB_ANALYSIS["job_title"])
+                for index in range(sizes["report_records"])
+            ]
+            # Each item is an export of 50 records in both formats plus their summary.csv
+            chunks = [records[start:start + 50] for start in range(0, len(records), 50)]
+            job_analyses = {record["job_url"]: JOB_ANALYSIS for record in records}
+            results["report_export"] = measure(
+                "report_export", lambda chunk: export_reports(chunk, tmp / "export", job_analyses=job_analyses), chunks
+            )
+
+        if selected("semantic_index") or selected("semantic_search"):
+            pool = [(f"resumes/{index}.txt", text_resume(rng, index)) for index in range(sizes["semantic_resumes"])]
+            with SemanticIndex(str(tmp / "embeddings"), HashingEmbedder()) as index:
+                if selected("semantic_index"):
+                    # Each item is a 50-resume batch: the warm-up pass embeds it, the timed passes
+                    # re-index the unchanged pool and must embed nothing
+                    batches = [pool[start:start + 50] for start in range(0, len(pool), 50)]
+                    results["semantic_index"] = measure("semantic_index", index.add_many, batches)
+                else:
+                    index.add_many(pool)
+                if selected("semantic_search"):
+                    results["semantic_search"] = measure(
+                        "semantic_search", lambda _: index.search_job(JOB_ANALYSIS, top_k=10), range(20)
+                    )
+
+        if selected("results_store") or selected("results_query"):
+            job_urls = [f"https://example.com/jobs/{index}" for index in range(max(1, sizes["result_rows"] // 500))]
+            rows = [
+                match_row(job_urls[index % len(job_urls)], f"resumes/{index}.pdf",
+                          {**RESUME_OPTIMIZATION, "match_scores": {"overall_fit": rng.randint(0, 100)}}, mode="batch")
+                for index in range(sizes["result_rows"])
+            ]
+            chunks = [rows[start:start + DEFAULT_WRITE_BATCH] for start in range(0, len(rows), DEFAULT_WRITE_BATCH)]
+            with ResultsStore(str(tmp / "results.sqlite")) as store:
+                if selected("results_store"):
+                    # Each item is one bulk transaction of DEFAULT_WRITE_BATCH upserts
+                    results["results_store"] = measure("results_store", store.save_many, chunks)
+                else:
+                    for chunk in chunks:
+                        store.save_many(chunk)
+                if selected("results_query"):
+                    results["results_query"] = measure(
+                        "results_query", lambda job_url: store.top_for_job(job_url, 50), job_urls
+                    )
+
+        if selected("crew_end_to_end"):
+            from src.resume_crew.agents import JobAnalyzer, ResumeAnalyzer
+            job_agent, resume_agent = JobAnalyzer(), ResumeAnalyzer()
+            for agent in (job_agent, resume_agent):
+                agent.llm = StubLLM(model="stub")
+                agent.verbose = False
+
+            def crew_run(index):
+                job = runner.run_job_analysis("https://example.com/job", "Example", job_text=f"Posting {index}",
+                                              agent=job_agent)
+                profile = JobProfile.from_analysis(job["parsed"], "https://example.com/job", str(index))
+                runner.run_resume_optimization("https://example.com/job", "Example",
+                                               text_paths[index % len(text_paths)], profile, agent=resume_agent)
+
+            results["crew_end_to_end"] = measure("crew_end_to_end", crew_run, list(range(sizes["crew_runs"])))
+
+    return {"version": BASELINE_VERSION, "scale": scale, "sizes": sizes, "results": results}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Regressions of current against baseline: throughput more than tolerance
+    below, or peak memory more than tolerance above the baseline.
+    Baselines recorded at a different scale are not comparable.
+    """
+    if baseline.get("version") != BASELINE_VERSION or baseline.get("scale") != current["scale"]:
+        raise ValueError("Baseline was recorded with a different benchmark version or scale")
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        if result["items_per_second"] < base["items_per_second"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['items_per_second']}/s vs baseline {base['items_per_second']}/s")
+        if result["peak_memory_mb"] > base["peak_memory_mb"] * (1 + tolerance) + 0.1:
+            regressions.append(f"{name}: {result['peak_memory_mb']} MB peak vs baseline {base['peak_memory_mb']} MB")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the parsing, scoring and report hot paths")
+    parser.add_argument("--scale", type=float, default=1.0, help="Corpus size multiplier")
+    parser.add_argument("--only", nargs="+", default=None, help="Benchmarks to run (default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Record the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed fractional regression")
+    parser.add_argument("--output", default=DEFAULT_RESULTS_PATH, help="Where to write this run's results")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+    print(f"⏱️ Running benchmarks at scale {args.scale}...")
+    current = run_benchmarks(args.scale, args.only)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(current, f, indent=2)
+    print(f"📁 Results saved in: {Path(args.output).absolute()}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"📌 Baseline saved in: {baseline_path.absolute()}")
+        return 0
+    if not baseline_path.exists():
+        print(f"❌ No baseline at {baseline_path}; run with --save-baseline to record one")
+        return 1
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    try:
+        regressions = compare(current, baseline, args.tolerance)
+    except ValueError as e:
+        print(f"❌ {e} (baseline scale {baseline.get('scale')}, this run {args.scale}); "
+              f"run with --save-baseline to record one")
+        return 1
+    if regressions:
+        print(f"❌ {len(regressions)} performance regressions (tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+    print("✅ No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""
+Shared pytest setup for the test scripts
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated
+
+@pytest.fixture(autouse=True)
+def isolated_singletons():
+    """
+    Run every test without the on-disk caches it does not configure itself,
+    and restore the from-env singletons (caches, stores, tracer) afterwards.
+    """
+    with isolated():
+        yield
@@ -0,0 +1,114 @@
+"""
+Fixtures shared by the test scripts and the benchmark suite (not part of the package)
+"""
+
+import json
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator, Optional, Union
+
+from src.resume_crew.registry import preserved
+
+# Disk caches and stores a test only gets by configuring its own
+DISK_STORE_ENV = (
+    "RESUME_PARSE_CACHE_DIR", "JOB_FETCH_CACHE_DIR", "LLM_CACHE_DIR",
+    "JOB_PROFILE_CACHE_DIR", "ARTIFACT_CACHE_DIR", "RESULTS_DB_PATH",
+)
+
+
+@contextmanager
+def isolated() -> Iterator[None]:
+    """
+    Disable the disk caches and stores (DISK_STORE_ENV) and restore every
+    from-env singleton on exit, so whatever a test configures stays with it.
+    """
+    saved = {name: os.environ.get(name) for name in DISK_STORE_ENV}
+    os.environ.update({name: "" for name in DISK_STORE_ENV})
+    try:
+        with preserved():
+            yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+
+
+class FakeCrew:
+    """
+    Stands in for crewai.Crew while used as a context manager: each kickoff
+    answers with respond(role, description) instead of calling an LLM.
+
+    respond may also be a fixed answer; dict answers are sent as JSON. The
+    fake counts kickoffs per agent role, keeps every task description and
+    reports token_usage (usage metrics) when given.
+    """
+
+    def __init__(self, respond: Union[Callable[[str, str], Any], Any],
+                 token_usage: Optional[dict] = None):
+        self.respond = respond if callable(respond) else (lambda role, description: respond)
+        self.token_usage = SimpleNamespace(**token_usage) if token_usage else None
+        self.kickoffs = Counter()
+        self.descriptions = []
+        self._lock = threading.Lock()
+
+    def __call__(self, agents, tasks, **kwargs) -> SimpleNamespace:
+        role, description = agents[0].role, tasks[0].description
+        return SimpleNamespace(kickoff=lambda: self._kickoff(role, description))
+
+    def _kickoff(self, role: str, description: str) -> SimpleNamespace:
+        with self._lock:
+            self.kickoffs[role] += 1
+            self.descriptions.append(description)
+        raw = self.respond(role, description)
+        if not isinstance(raw, str):
+            raw = json.dumps(raw)
+        return SimpleNamespace(tasks_output=[SimpleNamespace(raw=raw)], raw=raw, token_usage=self.token_usage)
+
+    def __enter__(self) -> "FakeCrew":
+        import crewai
+
+        self._original = crewai.Crew
+        crewai.Crew = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        import crewai
+
+        crewai.Crew = self._original
+
+
+def make_pdf(pages_text):
+    """
+    Build a minimal PDF with one line of Helvetica text per page.
+    """
+    page_count = len(pages_text)
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(page_count))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(pages_text):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    return out
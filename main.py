@@ -6,26 +6,116 @@ Main application file that orchestrates the AI agents for resume optimization.
 
 import os
 import json
+import argparse
 from pathlib import Path
-from datetime import datetime
 from dotenv import load_dotenv
-from crewai import Crew, Process
-from src.resume_crew.agents import JobAnalyzer, ResumeAnalyzer
-from src.resume_crew.tasks import create_job_analysis_task, create_resume_optimization_task
+from src.resume_crew.instrumentation import DEFAULT_TRACE_PATH, Tracer, configure_tracer, span
+from src.resume_crew.runner import cache_summary
 
 # Load environment variables
 load_dotenv()
 
-def main():
+# Configuration
+DEFAULT_JOB_URL = "https://jobs.weekday.works/google-director%2C-customer-engineering%2C-india%2C-google-cloud?utm_campaign=google_jobs_apply&utm_source=google_jobs_apply&utm_medium=organic"
+DEFAULT_COMPANY_NAME = "Google Cloud"
+
+# Resume configuration - using the PDF resume
+DEFAULT_RESUME_PATH = "knowledge/Abhishek_Sharma_Resume.pdf"
+
+def parse_args(argv=None):
     """
-    Main function to run the resume optimization crew.
+    Parse command line arguments.
+    Without a subcommand a single job/resume pair is analyzed.
     """
-    # Configuration
-    job_url = "https://jobs.weekday.works/google-director%2C-customer-engineering%2C-india%2C-google-cloud?utm_campaign=google_jobs_apply&utm_source=google_jobs_apply&utm_medium=organic"
-    company_name = "Google Cloud"
+    parser = argparse.ArgumentParser(description="Resume optimization with CrewAI")
+    parser.add_argument("--job-url", default=DEFAULT_JOB_URL, help="Job posting URL")
+    parser.add_argument("--company", default=DEFAULT_COMPANY_NAME, help="Company name")
+    parser.add_argument("--resume", default=DEFAULT_RESUME_PATH, help="Resume file (.pdf, .txt, .md)")
+    parser.add_argument("--trace", default=None, help=f"Trace file for stage spans (default: TRACE_PATH or {DEFAULT_TRACE_PATH}; empty disables it)")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    batch_parser = subparsers.add_parser("batch", help="Score one job posting against many resumes")
+    batch_parser.add_argument("resumes", help="Directory of resumes or manifest file (JSON list or one path per line)")
+    batch_parser.add_argument("--workers", type=int, default=4, help="Number of concurrent resume workers")
+    batch_parser.add_argument("--output-dir", default="output", help="Directory for batch results")
+    
+    pipeline_parser = subparsers.add_parser("pipeline", help="Score resumes locally, then run the LLM only on a shortlist")
+    pipeline_parser.add_argument("resumes", help="Directory of resumes or manifest file (JSON list or one path per line)")
+    pipeline_parser.add_argument("--top-k", type=int, default=10, help="Number of resumes sent to the LLM stage")
+    pipeline_parser.add_argument("--min-score", type=float, default=0, help="Minimum local overall fit (0-100) for the LLM stage")
+    pipeline_parser.add_argument("--workers", type=int, default=4, help="Number of concurrent resume workers")
+    pipeline_parser.add_argument("--semantic-weight", type=float, default=0.0, help="Share (0-1) of the embedding-based semantic fit in the local overall fit (0 disables the semantic stage)")
+    pipeline_parser.add_argument("--output-dir", default="output", help="Directory for pipeline results")
+    
+    roles_parser = subparsers.add_parser("roles", help="Rank the resume against many job postings")
+    roles_parser.add_argument("jobs", help="Job manifest (JSON list of URLs or {job_url, company_name} objects, or one '<url> [company]' per line)")
+    roles_parser.add_argument("--top-k", type=int, default=3, help="Number of best roles sent to the LLM stage")
+    roles_parser.add_argument("--min-score", type=float, default=0, help="Minimum local overall fit (0-100) for the LLM stage")
+    roles_parser.add_argument("--workers", type=int, default=4, help="Number of concurrent job analyses and LLM reviews")
+    roles_parser.add_argument("--output-dir", default="output", help="Directory for role results")
+    
+    ingest_parser = subparsers.add_parser("ingest", help="Parse a directory tree of resumes into a JSONL store")
+    ingest_parser.add_argument("resumes", help="Directory of resumes (.pdf, .txt, .md), searched recursively")
+    ingest_parser.add_argument("--store", default="output/resumes.jsonl", help="JSONL store for parsed resumes")
+    ingest_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    
+    serve_parser = subparsers.add_parser("serve", help="Run the HTTP matching service (POST /match)")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    serve_parser.add_argument("--pool-size", type=int, default=4, help="Warm agents per role (concurrent LLM runs)")
     
-    # Resume configuration - using the PDF resume
-    resume_path = "knowledge/Abhishek_Sharma_Resume.pdf"
+    index_parser = subparsers.add_parser("index", help="Incrementally index a resume directory and query it")
+    index_parser.add_argument("resumes", help="Directory of resumes to index")
+    index_parser.add_argument("--index-path", default=None, help="SQLite index file (default: RESUME_INDEX_PATH or .cache/resume_index.sqlite)")
+    index_parser.add_argument("--job-analysis", default=None, help="Job analysis JSON to retrieve the top candidates for")
+    index_parser.add_argument("--top-k", type=int, default=10, help="Number of candidates to return")
+    index_parser.add_argument("--semantic", action="store_true", help="Also sync the embedding index and rank by semantic fit")
+    
+    report_parser = subparsers.add_parser("report", help="Render reports for the matches in the results store")
+    report_parser.add_argument("--job", default=None, help="Only report on this job URL (default: every job)")
+    report_parser.add_argument("--formats", nargs="+", choices=["md", "html"], default=["md", "html"], help="Report formats to render")
+    report_parser.add_argument("--job-analysis", default=None, help="Job analysis JSON for the job sections (with --job)")
+    report_parser.add_argument("--no-summary", action="store_true", help="Skip the summary.csv of all matches")
+    report_parser.add_argument("--output-dir", default="output/reports", help="Directory for the rendered reports")
+    
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Main function to run the resume optimization crew.
+    """
+    args = parse_args(argv)
+    modes = {
+        "batch": run_batch_mode,
+        "pipeline": run_pipeline_mode,
+        "roles": run_roles_mode,
+        "ingest": run_ingest_mode,
+        "serve": run_serve_mode,
+        "index": run_index_mode,
+        "report": run_report_mode
+    }
+    # Command line runs keep a trace file; library callers opt in through TRACE_PATH
+    trace_path = args.trace if args.trace is not None else os.getenv("TRACE_PATH", DEFAULT_TRACE_PATH)
+    tracer = Tracer(trace_path or None)
+    configure_tracer(tracer)
+    try:
+        modes.get(args.command, run_single_mode)(args)
+    finally:
+        # Per-stage timings, sizes and tokens; every span is also in the trace file
+        if tracer.totals:
+            print("\n⏱️ Stage summary:")
+            print(tracer.summary_table())
+            if tracer.path:
+                print(f"📈 Trace written to: {tracer.path.absolute()}")
+        tracer.close()
+
+def run_single_mode(args):
+    """
+    Analyze one job posting and one resume.
+    """
+    job_url = args.job_url
+    company_name = args.company
+    resume_path = args.resume
     
     # Create output directory if it doesn't exist
     output_dir = Path("output")
@@ -42,252 +132,306 @@ def main():
     print(f"🏢 Analyzing job at: {company_name}")
     print(f"🔗 Job URL: {job_url}")
     
-    # Initialize agents
-    job_analyzer = JobAnalyzer()
-    resume_analyzer = ResumeAnalyzer()
-    
-    # Create tasks
-    job_analysis_task = create_job_analysis_task(job_analyzer, job_url, company_name)
-    resume_optimization_task = create_resume_optimization_task(resume_analyzer, job_url, company_name, resume_path)
-    
-    # Create crew (without company researcher)
-    crew = Crew(
-        agents=[job_analyzer, resume_analyzer],
-        tasks=[job_analysis_task, resume_optimization_task],
-        process=Process.sequential,
-        verbose=True,
-        debug=True
-    )
-    
-    # Run the crew
+    # Walk the artifact graph: job page -> job profile, resume file -> parsed
+    # text -> match scores. Only stages whose inputs changed are recomputed,
+    # so a revised resume re-scores without re-analyzing the job.
     print("🚀 Starting Resume Optimization Crew...")
-    result = crew.kickoff()
+    from src.resume_crew.artifacts import (
+        ArtifactGraph, build_job_profile, build_resume_match, get_artifact_cache
+    )
+    graph = ArtifactGraph(get_artifact_cache())
+    job_record = build_job_profile(graph, job_url, company_name, verbose=True)
+    profile = job_record.pop("profile")
+    if profile is not None:
+        job_analysis = profile
+    else:
+        job_analysis = job_record["parsed"] if job_record["parsed"] is not None else job_record["raw"]
+    resume_record = build_resume_match(graph, job_url, company_name, resume_path, job_analysis, verbose=True)
+    result = {"tasks_output": [job_record, resume_record]}
     
-    # Save results
-    save_results(result)
+    # The report is the sink: it also depends on the company name, the
+    # candidate and the templates, and rendering costs far less than a
+    # lookup worth getting wrong, so it is written on every run
+    save_results(result, output_dir, resume_path, job_url, company_name)
+    from src.resume_crew.results import get_results_store, match_row, run_fields
+    store = get_results_store()
+    if store is not None:
+        store.save(match_row(
+            job_url, resume_path, resume_record["parsed"], seconds=resume_record.get("seconds"),
+            total_tokens=resume_record.get("total_tokens"), **run_fields("single", company_name, job_analysis)
+        ))
     
     print("✅ Resume optimization completed!")
+    print(f"🧠 {cache_summary()}")
+    print(f"♻️ {graph.summary()}")
     print(f"📁 Results saved in: {output_dir.absolute()}")
+    if store is not None:
+        print(f"🗄️ Match stored in: {store.db_path.absolute()}")
 
-def save_results(result):
+def run_batch_mode(args):
     """
-    Save the crew results to JSON and Markdown files.
+    Run the batch entry point: one job analysis fanned out to many resumes.
     """
-    output_dir = Path("output")
-    try:
-        # Try to convert result to dict if possible
-        if hasattr(result, 'dict'):
-            result_data = result.dict()
-        elif hasattr(result, '__dict__'):
-            result_data = result.__dict__
-        else:
-            result_data = str(result)
-        
-        # Save JSON file
-        with open(output_dir / "complete_analysis.json", "w") as f:
-            json.dump(result_data, f, indent=2)
-        print("✅ Results saved to output/complete_analysis.json")
-        
-        # Generate and save Markdown report
-        generate_markdown_report(result_data, output_dir)
-        print("✅ Markdown report saved to output/final_report.md")
-        
-    except Exception as e:
-        print(f"Error saving results: {e}")
+    from src.resume_crew.batch import collect_resumes, overall_fit, run_batch
+    
+    resume_paths = collect_resumes(args.resumes)
+    if not resume_paths:
+        print(f"❌ No resumes found in: {args.resumes}")
+        print("Supported formats: .pdf, .txt, .md")
+        return
+    
+    print(f"📄 Found {len(resume_paths)} resumes in: {args.resumes}")
+    print(f"🏢 Analyzing job at: {args.company}")
+    print(f"🔗 Job URL: {args.job_url}")
+    
+    ranking = run_batch(args.job_url, args.company, resume_paths, Path(args.output_dir), max_workers=args.workers)
+    
+    print("✅ Batch scoring completed!")
+    print(f"🧠 {cache_summary()}")
+    print(f"📁 Ranked results saved in: {Path(args.output_dir).absolute() / 'batch_ranking.json'}")
+    for rank, record in enumerate(ranking[:10], start=1):
+        print(f"   {rank}. {record['resume_path']} - overall fit: {overall_fit(record)}")
 
-def generate_markdown_report(result_data, output_dir):
+def run_pipeline_mode(args):
     """
-    Generate a comprehensive markdown report from the analysis results.
+    Run the two-stage pipeline: local scoring for everyone, LLM review for the shortlist.
     """
-    import json
+    from src.resume_crew.batch import collect_resumes, run_pipeline
     
-    # Extract data from tasks_output
-    job_analysis = {}
-    resume_optimization = {}
+    resume_paths = collect_resumes(args.resumes)
+    if not resume_paths:
+        print(f"❌ No resumes found in: {args.resumes}")
+        print("Supported formats: .pdf, .txt, .md")
+        return
     
-    if 'tasks_output' in result_data:
-        for task in result_data['tasks_output']:
-            agent_name = task.get('agent', '')
-            raw_output = task.get('raw', '')
-            
-            # Parse JSON from raw output
-            try:
-                if raw_output.startswith('```json'):
-                    # Remove markdown code blocks
-                    json_str = raw_output.replace('```json', '').replace('```', '').strip()
-                    parsed_data = json.loads(json_str)
-                elif raw_output.startswith('{'):
-                    # Direct JSON
-                    parsed_data = json.loads(raw_output)
-                else:
-                    continue
-                
-                # Assign data based on agent
-                if 'Job Requirements Analyst' in agent_name:
-                    job_analysis = parsed_data
-                elif 'Resume Optimization Specialist' in agent_name:
-                    resume_optimization = parsed_data
-                
-            except json.JSONDecodeError:
-                print(f"Warning: Could not parse JSON for {agent_name}")
-                continue
+    print(f"📄 Found {len(resume_paths)} resumes in: {args.resumes}")
+    print(f"🏢 Analyzing job at: {args.company}")
+    print(f"🔗 Job URL: {args.job_url}")
     
-    # Get current date
-    current_date = datetime.now().strftime("%B %d, %Y")
+    summary = run_pipeline(
+        args.job_url, args.company, resume_paths, Path(args.output_dir),
+        top_k=args.top_k, min_score=args.min_score, max_workers=args.workers,
+        semantic_weight=args.semantic_weight
+    )
+    if not summary:
+        return
     
-    # Generate markdown content
-    markdown_content = f"""# Resume Analysis Report: Abhishek Sharma vs Google Cloud Director Position
-
-## 📊 Executive Summary
-
-**Candidate:** Abhishek Sharma  
-**Target Position:** Director, Customer Engineering, Google Cloud  
-**Analysis Date:** {current_date}  
-**Overall Match Score:** {resume_optimization.get('match_scores', {}).get('overall_fit', 'N/A')}/100
-
----
-
-## 🎯 Job Analysis
-
-### Position Details
-- **Title:** {job_analysis.get('job_title', 'Director, Customer Engineering, Google Cloud')}
-- **Location:** Bengaluru, Karnataka, India
-- **Experience Required:** {job_analysis.get('required_experience', '10+ years in technology and cloud computing')}
-
-### Key Requirements
-
-#### Required Skills
-{format_skills_list(job_analysis.get('required_skills', []))}
-
-#### Preferred Skills
-{format_skills_list(job_analysis.get('preferred_skills', []))}
-
-### Key Responsibilities
-{format_responsibilities(job_analysis.get('key_responsibilities', []))}
-
-### Company Culture
-{job_analysis.get('company_culture', 'Information not available')}
-
-### Benefits
-{format_skills_list(job_analysis.get('benefits', []))}
-
----
-
-## 📈 Resume Match Analysis
-
-### Match Scores
-| Category | Score | Status |
-|----------|-------|--------|
-| **Technical Skills** | {resume_optimization.get('match_scores', {}).get('technical_skills', 'N/A')}/100 | {get_status_emoji(resume_optimization.get('match_scores', {}).get('technical_skills', 0))} |
-| **Experience Relevance** | {resume_optimization.get('match_scores', {}).get('experience_relevance', 'N/A')}/100 | {get_status_emoji(resume_optimization.get('match_scores', {}).get('experience_relevance', 0))} |
-| **Education Requirements** | {resume_optimization.get('match_scores', {}).get('education_requirements', 'N/A')}/100 | {get_status_emoji(resume_optimization.get('match_scores', {}).get('education_requirements', 0))} |
-| **Overall Fit** | {resume_optimization.get('match_scores', {}).get('overall_fit', 'N/A')}/100 | {get_status_emoji(resume_optimization.get('match_scores', {}).get('overall_fit', 0))} |
-
-### Skill Gaps Identified
-{format_skill_gaps_simple(resume_optimization.get('skill_gaps', []))}
-
----
-
-## 🔧 Optimization Recommendations
-
-### Keywords to Add
-{format_keywords(resume_optimization.get('skill_gaps', []))}
-
-### Experience Descriptions to Improve
-{format_improvements_simple(resume_optimization.get('optimization_suggestions', []))}
-
-### ATS Optimization
-{format_ats_tips(resume_optimization.get('ats_optimization', []))}
-
----
-
-## 🎯 Action Items (Prioritized)
-
-### High Priority
-{format_action_items_simple(resume_optimization.get('action_items', []))}
-
----
-
-## 📋 Next Steps
-
-1. **Immediate (1-2 weeks):**
-   - Revise resume with identified keywords and improvements
-   - Add Google Cloud Platform experience or certifications
-   - Update experience descriptions with quantifiable achievements
-
-2. **Short-term (2-4 weeks):**
-   - Research Google Cloud products and services
-   - Practice interview questions using STAR method
-   - Network with Google Cloud professionals
-
-3. **Long-term (1-3 months):**
-   - Consider Google Cloud certifications
-   - Build experience with enterprise customers
-   - Develop leadership and sales skills
-
----
-
-*This analysis was generated using AI-powered resume optimization tools. The recommendations are based on the job requirements and industry best practices for ATS optimization and interview preparation.*
-"""
+    print("✅ Pipeline completed!")
+    print(f"🧠 {cache_summary()}")
+    print(f"🤖 LLM calls made: {summary['llm_calls_made']}, avoided: {summary['llm_calls_avoided']}")
+    print(f"📁 Ranked results saved in: {Path(args.output_dir).absolute() / 'pipeline_ranking.json'}")
+    for entry in summary["ranking"][:10]:
+        print(f"   {entry['rank']}. {entry['resume_path']} - overall fit: {entry['overall_fit']} "
+              f"(local: {entry['local_overall_fit']})")
+
+def run_roles_mode(args):
+    """
+    Rank one resume against many postings: local scores for every role, LLM review for the best few.
+    """
+    from src.resume_crew.roles import collect_jobs, run_role_matching
     
-    # Save markdown file
-    with open(output_dir / "final_report.md", "w", encoding="utf-8") as f:
-        f.write(markdown_content)
-
-def format_skills_list(skills):
-    """Format skills list for markdown."""
-    if not skills:
-        return "- Information not available"
-    return "\n".join([f"- {skill}" for skill in skills])
-
-def format_responsibilities(responsibilities):
-    """Format responsibilities for markdown."""
-    if not responsibilities:
-        return "Information not available"
-    return "\n".join([f"{i+1}. {resp}" for i, resp in enumerate(responsibilities)])
-
-def format_skill_gaps_simple(gaps):
-    """Format skill gaps for markdown (simple list)."""
-    if not gaps:
-        return "No specific gaps identified"
-    return "\n".join([f"{i+1}. **{gap}**" for i, gap in enumerate(gaps)])
-
-def format_keywords(keywords):
-    """Format keywords for markdown."""
-    if not keywords:
-        return "- Information not available"
-    return "\n".join([f"- {keyword}" for keyword in keywords])
-
-def format_improvements_simple(improvements):
-    """Format improvements for markdown (simple list)."""
-    if not improvements:
-        return "Information not available"
-    return "\n".join([f"{i+1}. {imp}" for i, imp in enumerate(improvements)])
+    if not Path(args.resume).exists():
+        print(f"❌ Resume file not found: {args.resume}")
+        return
+    jobs = collect_jobs(args.jobs)
+    if not jobs:
+        print(f"❌ No job postings found in: {args.jobs}")
+        return
+    
+    print(f"📄 Using resume: {args.resume}")
+    print(f"🏢 Matching against {len(jobs)} job postings from: {args.jobs}")
+    
+    summary = run_role_matching(
+        args.resume, jobs, Path(args.output_dir),
+        top_k=args.top_k, min_score=args.min_score, max_workers=args.workers
+    )
+    if not summary:
+        return
+    
+    print("✅ Role matching completed!")
+    print(f"🧠 {cache_summary()}")
+    print(f"🤖 LLM calls made: {summary['llm_calls_made']}, avoided: {summary['llm_calls_avoided']} "
+          f"({summary['profiles_reused']} stored job profiles reused)")
+    print(f"📁 Ranked roles saved in: {Path(args.output_dir).absolute() / 'role_ranking.json'}")
+    for entry in summary["ranking"][:10]:
+        review = entry["llm_review"] or {}
+        llm_fit = f"overall fit: {review['overall_fit']}, " if review.get("overall_fit") is not None else ""
+        gaps = ", ".join(entry.get("skill_gaps", [])[:5]) or "none"
+        print(f"   {entry['rank']}. {entry.get('job_title') or entry['job_url']} ({entry['company_name']}) - "
+              f"{llm_fit}local: {entry['local_overall_fit']} - gaps: {gaps}")
+
+def run_ingest_mode(args):
+    """
+    Bulk-parse a resume archive; re-running resumes an interrupted ingestion.
+    """
+    from src.resume_crew.ingest import ingest_directory
+    
+    stats = ingest_directory(args.resumes, args.store, workers=args.workers)
+    print(f"✅ Ingested {stats['ingested']} resumes ({stats['errors']} errors, {stats['skipped']} skipped) "
+          f"in {stats['elapsed_seconds']}s - {stats['files_per_second']} files/sec")
+    print(f"📁 Parsed resumes stored in: {Path(args.store).absolute()}")
 
-def format_ats_tips(tips):
-    """Format ATS tips for markdown."""
-    if not tips:
-        return "- Information not available"
-    return "\n".join([f"- {tip}" for tip in tips])
+def run_serve_mode(args):
+    """
+    Start the HTTP matching service and keep agents and caches warm until interrupted.
+    """
+    from src.resume_crew.service import MatchService, create_server
+    
+    service = MatchService(pool_size=args.pool_size)
+    server = create_server(service, args.host, args.port)
+    print(f"🌐 Serving POST /match on http://{args.host}:{server.server_port} ({args.pool_size} agents per role)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("👋 Shutting down")
+    finally:
+        server.server_close()
 
-def format_action_items_simple(actions):
-    """Format action items for markdown (simple list)."""
-    if not actions:
-        return "No specific actions identified"
-    return "\n".join([f"{i+1}. {action}" for i, action in enumerate(actions)])
+def run_index_mode(args):
+    """
+    Sync the resume index with a directory and optionally query it with a job analysis.
+    """
+    import time
+    from src.resume_crew.index import ResumeIndex
+    
+    with ResumeIndex(args.index_path) as index:
+        stats = index.update_directory(args.resumes)
+        print(f"📚 Indexed {len(index)} resumes "
+              f"({stats['added']} added, {stats['updated']} updated, "
+              f"{stats['unchanged']} unchanged, {stats['removed']} removed)")
+        for error in stats["errors"]:
+            print(f"⚠️ {error['resume_path']}: {error['error']}")
+        
+        if args.job_analysis:
+            with open(args.job_analysis, "r", encoding="utf-8") as f:
+                job_analysis = json.load(f)
+            start = time.perf_counter()
+            results = index.search_job(job_analysis, top_k=args.top_k)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"🔎 Top {len(results)} candidates ({elapsed_ms:.1f} ms):")
+            for rank, (path, score) in enumerate(results, start=1):
+                print(f"   {rank}. {path} - BM25 {score:.2f}")
+    
+    if args.semantic:
+        from src.resume_crew.semantic import SemanticIndex
+        
+        with SemanticIndex() as semantic_index:
+            stats = semantic_index.update_directory(args.resumes)
+            print(f"🧭 Semantic index: {len(semantic_index)} resumes "
+                  f"({stats['added']} added, {stats['updated']} updated, {stats['unchanged']} unchanged, "
+                  f"{stats['removed']} removed, {stats['embedded']} new chunk embeddings)")
+            if args.job_analysis:
+                start = time.perf_counter()
+                results = semantic_index.search_job(job_analysis, top_k=args.top_k)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"🔎 Top {len(results)} candidates by semantic fit ({elapsed_ms:.1f} ms):")
+                for rank, (path, score) in enumerate(results, start=1):
+                    print(f"   {rank}. {path} - semantic fit {score:.1f}")
+
+def run_report_mode(args):
+    """
+    Render reports for stored matches, e.g. after a template change.
+    """
+    import time
+    from src.resume_crew.reports import export_reports
+    from src.resume_crew.results import get_results_store
+    
+    store = get_results_store()
+    if store is None:
+        print("❌ The results store is disabled (RESULTS_DB_PATH is empty)")
+        return
+    job_analyses = {}
+    if args.job_analysis:
+        if not args.job:
+            print("❌ --job-analysis needs --job")
+            return
+        with open(args.job_analysis, "r", encoding="utf-8") as f:
+            job_analyses[args.job] = json.load(f)
+    
+    start = time.perf_counter()
+    with span("export_reports") as stage:
+        stats = export_reports(store.iter_results(args.job), args.output_dir, formats=tuple(args.formats),
+                               summary=not args.no_summary, job_analyses=job_analyses)
+        stage["reports"] = stats["reports"]
+    elapsed = time.perf_counter() - start
+    print(f"✅ Rendered {stats['reports']} reports ({stats['files']} files) in {elapsed:.2f}s")
+    print(f"📁 Reports saved in: {Path(args.output_dir).absolute()}")
+    if stats["summary"]:
+        print(f"📋 Summary: {Path(stats['summary']).absolute()}")
+
+def save_results(result, output_dir="output", candidate="", job_url="", company_name=None):
+    """
+    Save the crew results to JSON and Markdown files.
+    Returns the paths written (empty when saving failed).
+    """
+    output_dir = Path(output_dir)
+    with span("save_results") as stage:
+        try:
+            # Only task records are saved; anything else keeps just its raw text
+            if isinstance(result, dict):
+                result_data = result
+            elif hasattr(result, 'model_dump'):
+                result_data = result.model_dump(mode="json", include={"raw", "tasks_output", "token_usage"})
+            else:
+                result_data = {"raw": str(result)}
+            
+            # Save JSON file
+            with open(output_dir / "complete_analysis.json", "w") as f:
+                json.dump(result_data, f, indent=2)
+            print(f"✅ Results saved to {output_dir / 'complete_analysis.json'}")
+            
+            # Generate and save Markdown report
+            generate_markdown_report(result_data, output_dir, candidate, job_url, company_name)
+            print(f"✅ Markdown report saved to {output_dir / 'final_report.md'}")
+            files = [output_dir / "complete_analysis.json", output_dir / "final_report.md"]
+            stage["bytes"] = sum(path.stat().st_size for path in files)
+            return [str(path) for path in files]
+            
+        except Exception as e:
+            stage["status"] = "error"
+            print(f"Error saving results: {e}")
+            return []
 
-def get_status_emoji(score):
-    """Get status emoji based on score."""
-    if isinstance(score, (int, float)):
-        if score >= 80:
-            return "✅ Excellent"
-        elif score >= 70:
-            return "✅ Strong"
-        elif score >= 60:
-            return "⚠️ Good"
-        else:
-            return "❌ Needs Improvement"
-    return "N/A"
+def generate_markdown_report(result_data, output_dir, candidate="", job_url="", company_name=None):
+    """
+    Render final_report.md for a single run from the report template.
+    """
+    from src.resume_crew.models import JobAnalysis, ResumeOptimization, parse_output
+    from src.resume_crew.reports import render_report
+    from src.resume_crew.results import match_row
+    
+    # Validated task outputs are passed on as they are (the report validates
+    # them once); results saved without "parsed" go through the repair path
+    job_analysis = None
+    resume_optimization = None
+    
+    if isinstance(result_data, dict):
+        for task in result_data.get('tasks_output', []):
+            agent_name = task.get('agent', '')
+            if 'Job Requirements Analyst' in agent_name:
+                model = JobAnalysis
+            elif 'Resume Optimization Specialist' in agent_name:
+                model = ResumeOptimization
+            else:
+                continue
+            
+            output = task.get('parsed')
+            if output is None:
+                parsed = parse_output(task.get('raw', ''), model)
+                output = parsed.model_dump() if parsed is not None else None
+            if output is None:
+                print(f"Warning: Could not parse output for {agent_name}")
+            elif model is JobAnalysis:
+                job_analysis = output
+            else:
+                resume_optimization = output
+    
+    record = match_row(
+        job_url, candidate, resume_optimization, company_name=company_name,
+        job_title=(job_analysis or {}).get("job_title")
+    )
+    with open(Path(output_dir) / "final_report.md", "w", encoding="utf-8") as f:
+        f.write(render_report(record, "md", job_analysis=job_analysis))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
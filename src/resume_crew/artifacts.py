@@ -0,0 +1,205 @@
+"""
+Artifact dependency graph: rebuild only the pipeline stages whose inputs changed
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from src.resume_crew.cache import ArtifactCache
+from src.resume_crew.registry import Singleton
+
+# Bump whenever a stage's output format changes so stored artifacts are rebuilt
+ARTIFACT_VERSION = 1
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Content fingerprint of a JSON-serializable value.
+    """
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Content fingerprint of a file.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ArtifactGraph:
+    """
+    Build graph over the pipeline artifacts, in the style of a build system.
+
+    Sources (the fetched job page, a resume file) are registered with the
+    fingerprint of their content. A derived artifact is built from named
+    inputs: its store key is the stage plus its inputs' fingerprints, so it
+    is rebuilt only when an input changed, and its own fingerprint is that
+    of its value. An input rebuilt to an identical value therefore leaves
+    everything downstream untouched.
+
+    Artifact names are "<stage>" or "<stage>:<instance>" ("match_scores:
+    resume.pdf"); the key depends on the stage only, so the same inputs
+    reuse the artifact whatever the instance is called.
+    """
+
+    def __init__(self, cache: Optional[ArtifactCache] = None):
+        self.cache = cache
+        self.fingerprints: Dict[str, str] = {}
+        self.rebuilt: List[str] = []
+        self.reused: List[str] = []
+        self._lock = threading.Lock()
+
+    def source(self, name: str, value_fingerprint: str) -> None:
+        """
+        Register a source artifact by the fingerprint of its content.
+        """
+        with self._lock:
+            self.fingerprints[name] = value_fingerprint
+
+    def build(self, name: str, inputs: List[str], build: Callable[[], Any],
+              version: int = ARTIFACT_VERSION,
+              is_current: Optional[Callable[[Any], bool]] = None,
+              identity: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Return the artifact built from inputs, calling build() only when no
+        artifact exists for the current input fingerprints. is_current can
+        reject a stored artifact (a failed parse or resume read);
+        identity picks the part of the value that downstream stages depend
+        on (default: all of it). The value must be JSON-serializable.
+        """
+        stage = name.split(":", 1)[0]
+        key = ArtifactCache.key_for(stage, version, [self.fingerprints[input_name] for input_name in inputs])
+        entry = self.cache.get(key) if self.cache else None
+        if entry is not None and (is_current is None or is_current(entry["value"])):
+            value, value_fingerprint, log = entry["value"], entry["fingerprint"], self.reused
+        else:
+            value = build()
+            value_fingerprint, log = fingerprint(identity(value) if identity else value), self.rebuilt
+            if self.cache:
+                self.cache.put(key, {"value": value, "fingerprint": value_fingerprint})
+        with self._lock:
+            self.fingerprints[name] = value_fingerprint
+            log.append(name)
+        return value
+
+    def summary(self) -> str:
+        """
+        One-line rebuilt/reused summary for run reports.
+        """
+        if self.cache is None:
+            return "Artifact store disabled, every stage rebuilt"
+        rebuilt = ", ".join(self.rebuilt) or "nothing"
+        return f"Artifacts: rebuilt {rebuilt}; {len(self.reused)} up to date"
+
+
+def settings_fingerprint() -> str:
+    """
+    Fingerprint of the settings the LLM stages depend on besides their inputs.
+    """
+    return fingerprint([os.getenv("OPENAI_MODEL", ""), os.getenv("RESUME_TOKEN_BUDGET", "")])
+
+
+def job_identity(job_analysis: Any) -> Any:
+    """
+    The part of a job analysis the scores depend on: a profile without its
+    posting hash, so an edit that compiles to the same profile re-scores nothing.
+    """
+    if hasattr(job_analysis, "model_dump"):
+        job_analysis = job_analysis.model_dump()
+    if isinstance(job_analysis, dict) and "content_hash" in job_analysis:
+        return {key: value for key, value in job_analysis.items() if key != "content_hash"}
+    return job_analysis
+
+
+def build_job_profile(graph: ArtifactGraph, job_url: str, company_name: str,
+                      job_text: Optional[str] = None, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Job side of the graph: job page -> job analysis -> job profile.
+
+    Returns the load_job_profile record ("profile" is a JobProfile or None).
+    The analysis is rebuilt only when the posting text changed, and
+    downstream stages are only invalidated when the compiled profile did.
+    """
+    from src.resume_crew.profiles import PROFILE_VERSION, JobProfile, load_job_profile
+    from src.resume_crew.tools import JobAnalysisTools
+
+    if not job_text and job_url:
+        details = JobAnalysisTools.extract_job_details(job_url)
+        if details["status"] == "success":
+            job_text = details["content"]
+    graph.source("job_page", fingerprint([job_url, company_name, job_text]))
+    graph.source("settings", settings_fingerprint())
+
+    def analyze() -> Dict[str, Any]:
+        record = load_job_profile(job_url, company_name, job_text=job_text, verbose=verbose)
+        profile = record.pop("profile")
+        record.pop("cached")
+        return {**record, "profile": profile.model_dump() if profile is not None else None}
+
+    value = graph.build(
+        "job_profile", ["job_page", "settings"], analyze, version=PROFILE_VERSION,
+        # Unparsed analyses are retried on the next run instead of being kept
+        is_current=lambda stored: stored["profile"] is not None,
+        identity=lambda built: job_identity(built["profile"] or built["raw"])
+    )
+    profile = JobProfile.model_validate(value["profile"]) if value["profile"] is not None else None
+    return {**value, "cached": "job_profile" in graph.reused, "profile": profile}
+
+
+def build_resume_match(graph: ArtifactGraph, job_url: str, company_name: str, resume_path: str,
+                       job_analysis: Any, verbose: bool = False, agent=None,
+                       resume: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Resume side of the graph: resume file -> parsed text -> match scores,
+    against the "job_profile" artifact already in the graph.
+
+    Returns the run_resume_optimization record for the resume, rebuilt only
+    when the resume content or the job profile changed. Artifacts are named
+    per resume path, so resumes in one graph are tracked independently.
+    A resume already parsed in this run (the analyze_resume record) can be
+    passed as resume so the parsed text stage does not parse it again.
+    """
+    from src.resume_crew.runner import run_resume_optimization
+    from src.resume_crew.tools import ResumeAnalysisTools, pdf_parser_version
+
+    if "resume_parser" not in graph.fingerprints:
+        graph.source("resume_parser", fingerprint([
+            pdf_parser_version(), os.getenv("PDF_MAX_PAGES"), os.getenv("PDF_MAX_CHARS")
+        ]))
+    if "settings" not in graph.fingerprints:
+        graph.source("settings", settings_fingerprint())
+    graph.source(f"resume_file:{resume_path}", fingerprint([os.path.splitext(resume_path)[1].lower(),
+                                                            file_fingerprint(resume_path)]))
+
+    parsed = resume
+    resume = graph.build(
+        f"resume_text:{resume_path}", [f"resume_file:{resume_path}", "resume_parser"],
+        lambda: parsed if parsed is not None else ResumeAnalysisTools.analyze_resume(resume_path),
+        is_current=lambda stored: stored["status"] == "success",
+        identity=lambda built: built.get("content") or built.get("error")
+    )
+
+    def optimize() -> Dict[str, Any]:
+        record = run_resume_optimization(job_url, company_name, resume_path, job_analysis,
+                                         verbose=verbose, agent=agent, resume={**resume, "resume_path": resume_path})
+        record.pop("cached")
+        return record
+
+    record = graph.build(
+        f"match_scores:{resume_path}", [f"resume_text:{resume_path}", "job_profile", "settings"], optimize,
+        is_current=lambda stored: stored["parsed"] is not None
+    )
+    return {**record, "cached": f"match_scores:{resume_path}" in graph.reused}
+
+
+# Artifact store, configured from the environment on first use (None disables it)
+_artifact_cache = Singleton(ArtifactCache.from_env)
+configure_artifact_cache = _artifact_cache.configure
+get_artifact_cache = _artifact_cache.get
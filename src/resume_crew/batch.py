@@ -0,0 +1,384 @@
+"""
+Batch mode: score one job posting against a pool of resumes
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.resume_crew.artifacts import ArtifactGraph, build_resume_match, fingerprint, get_artifact_cache, job_identity
+from src.resume_crew.tools import ResumeAnalysisTools, find_resume_files
+from src.resume_crew.profiles import load_job_profile
+from src.resume_crew.results import ResultsWriter, get_results_store, match_row, run_fields
+from src.resume_crew.runner import estimate_optimization_tokens, task_counts
+from src.resume_crew.scheduler import CrewScheduler
+from src.resume_crew.scoring import MatchScorer
+from src.resume_crew.skill_matrix import SkillMatrix
+
+
+def collect_resumes(source: str) -> List[str]:
+    """
+    Collect resume paths from a directory or a manifest file.
+
+    A manifest is either a JSON list of paths or a text file with one
+    path per line. Relative manifest entries resolve against the
+    manifest's directory.
+    """
+    source_path = Path(source)
+
+    if source_path.is_dir():
+        return find_resume_files(source)
+
+    if not source_path.is_file():
+        raise FileNotFoundError(f"Resume source not found: {source}")
+
+    if source_path.suffix.lower() == '.json':
+        entries = json.loads(source_path.read_text(encoding='utf-8'))
+    else:
+        entries = [
+            line.strip() for line in source_path.read_text(encoding='utf-8').splitlines()
+            if line.strip() and not line.strip().startswith('#')
+        ]
+
+    resumes = []
+    for entry in entries:
+        path = Path(entry)
+        if not path.is_absolute():
+            path = source_path.parent / path
+        resumes.append(str(path))
+    return resumes
+
+
+def overall_fit(record: Dict[str, Any]) -> float:
+    """
+    Get the overall fit score of a batch record, -1 when unavailable.
+    """
+    score = (record.get("resume_optimization") or {}).get("match_scores", {}).get("overall_fit")
+    return score if isinstance(score, (int, float)) else -1
+
+
+def analyze_job(job_url: str, company_name: str, output_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load the posting's job profile, running the job analysis only when no
+    profile is stored for the current posting text. The analysis and the
+    profile are saved to job_analysis.json and job_profile.json.
+    Returns the load_job_profile record, None when the analysis output
+    cannot be parsed.
+    """
+    print("🔎 Loading the job profile for the whole pool...")
+    job_record = load_job_profile(job_url, company_name)
+    profile = job_record["profile"]
+    if profile is None:
+        print("❌ Could not parse the job analysis output")
+        return None
+    if job_record["cached"]:
+        print("♻️ Reusing the stored job profile, no job analysis call needed")
+
+    with open(output_dir / "job_analysis.json", "w") as f:
+        json.dump(profile.analysis, f, indent=2)
+    with open(output_dir / "job_profile.json", "w") as f:
+        json.dump(profile.model_dump(exclude={"analysis"}), f, indent=2)
+    return job_record
+
+
+def parse_resumes(resume_paths: List[str], max_workers: int = 4) -> List[Dict[str, Any]]:
+    """
+    Parse every resume with up to max_workers threads, in input order.
+    The records are shared by the local stages and the artifact graph, so
+    each resume is parsed once per run.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(ResumeAnalysisTools.analyze_resume, resume_paths))
+
+
+def write_skill_matrix(job_analysis: Dict[str, Any], resume_paths: List[str],
+                       parsed: List[Dict[str, Any]], output_dir: Path) -> SkillMatrix:
+    """
+    Build the pool's skill matrix and save its summary to skill_matrix.json.
+    """
+    matrix = SkillMatrix.build(
+        job_analysis,
+        (resume.get("content", "") for resume in parsed),
+        candidate_ids=resume_paths
+    )
+    with open(output_dir / "skill_matrix.json", "w") as f:
+        json.dump(matrix.summary(), f, indent=2)
+    return matrix
+
+
+def optimize_resumes(job_url: str, company_name: str, job_analysis: Any,
+                     resume_paths: List[str], stream_path: Path,
+                     max_workers: int = 4, mode: str = "batch",
+                     parsed: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """
+    Run the resume optimization task for each resume concurrently,
+    appending every finished record to stream_path as it completes.
+    parsed maps resume paths the run already parsed to their analyze_resume
+    records, so the artifact graph does not parse them again.
+
+    Crews run on a CrewScheduler capped at max_workers concurrent crews,
+    with the request/token rate limits and 429 retries configured in the
+    environment; each call is charged the job analysis plus a full resume
+    token budget and settled with its reported usage. Each resume goes through the artifact graph, so re-running
+    a batch only re-scores resumes whose content (or the job profile) changed;
+    reused scores report 0 tokens and give their estimate back.
+    Records are also written to the results store in bulk transactions.
+    """
+    graph = ArtifactGraph(get_artifact_cache())
+    graph.source("job_profile", fingerprint(job_identity(job_analysis)))
+    parsed = parsed or {}
+    
+    def score_resume(resume_path: str) -> Dict[str, Any]:
+        record = build_resume_match(graph, job_url, company_name, resume_path, job_analysis,
+                                    resume=parsed.get(resume_path))
+        # A reused artifact cost this run nothing; its stored time and tokens belong to the run that built it
+        return {
+            "resume_path": resume_path,
+            "resume_optimization": record["parsed"],
+            "raw": record["raw"],
+            "compaction": record.get("compaction"),
+            "cached": record["cached"],
+            "seconds": None if record["cached"] else record.get("seconds"),
+            "total_tokens": 0 if record["cached"] else record.get("total_tokens"),
+            "status": "success" if record["parsed"] is not None else "unparsed"
+        }
+
+    results = []
+    writer = ResultsWriter(get_results_store())
+    fields = run_fields(mode, company_name, job_analysis)
+    scheduler = CrewScheduler.from_env(max_concurrency=max_workers)
+    print(f"🚀 Scoring {len(resume_paths)} resumes with up to {scheduler.max_concurrency} concurrent crews...")
+    with open(stream_path, "w") as stream:
+        def on_result(resume_path, record, error):
+            if error is not None:
+                record = {
+                    "resume_path": resume_path,
+                    "error": str(error),
+                    "status": "error"
+                }
+            results.append(record)
+            stream.write(json.dumps(record) + "\n")
+            stream.flush()
+            writer.add(match_row(
+                job_url, resume_path, record.get("resume_optimization"), status=record["status"],
+                seconds=record.get("seconds"), total_tokens=record.get("total_tokens"), **fields
+            ))
+            print(f"   [{len(results)}/{len(resume_paths)}] {record['resume_path']}: {record['status']}")
+
+        estimate = estimate_optimization_tokens(job_analysis)
+        scheduler.run(score_resume, resume_paths, on_result=on_result, estimate_tokens=lambda _: estimate)
+    writer.flush()
+
+    if scheduler.stats["rate_limited"]:
+        print(f"⏳ Rate limited {scheduler.stats['rate_limited']} times, all retried with backoff")
+    if graph.cache is not None:
+        rescored = sum(name.startswith("match_scores:") for name in graph.rebuilt)
+        print(f"♻️ Re-scored {rescored} resumes, {len(resume_paths) - rescored} unchanged")
+    compacted = [record["compaction"] for record in results if record.get("compaction")]
+    if compacted:
+        print(f"📉 Resume compaction saved {sum(stats['tokens_saved'] for stats in compacted)} of "
+              f"{sum(stats['original_tokens'] for stats in compacted)} prompt tokens")
+    return results
+
+
+def run_batch(job_url: str, company_name: str, resume_paths: List[str],
+              output_dir: Path, max_workers: int = 4) -> List[Dict[str, Any]]:
+    """
+    Analyze the job once, then score every resume against it with a
+    bounded worker pool.
+
+    The pool's skill coverage and per-candidate gaps are written to
+    skill_matrix.json before scoring starts. Each finished resume is appended
+    to batch_results.jsonl as soon as it completes; the ranked list is
+    written to batch_ranking.json at the end.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    job_record = analyze_job(job_url, company_name, output_dir)
+    if job_record is None:
+        return []
+    profile = job_record["profile"]
+
+    # Pool-wide skill coverage and gaps, available before any per-candidate LLM work
+    parsed = parse_resumes(resume_paths, max_workers)
+    write_skill_matrix(profile.to_job_analysis(), resume_paths, parsed, output_dir)
+
+    results = optimize_resumes(
+        job_url, company_name, profile, resume_paths,
+        output_dir / "batch_results.jsonl", max_workers=max_workers, parsed=dict(zip(resume_paths, parsed))
+    )
+
+    ranking = sorted(results, key=overall_fit, reverse=True)
+    with open(output_dir / "batch_ranking.json", "w") as f:
+        json.dump({
+            "job_url": job_url,
+            "company_name": company_name,
+            "job_analysis": profile.analysis,
+            "ranking": [
+                {
+                    "rank": rank,
+                    "resume_path": record["resume_path"],
+                    "overall_fit": overall_fit(record),
+                    "status": record["status"]
+                }
+                for rank, record in enumerate(ranking, start=1)
+            ]
+        }, f, indent=2)
+
+    return ranking
+
+
+def shortlist(local_results: List[Dict[str, Any]], top_k: Optional[int],
+              min_score: float = 0) -> List[Dict[str, Any]]:
+    """
+    Keep the best locally scored resumes: overall fit at least min_score, at most top_k.
+    """
+    candidates = [
+        record for record in local_results
+        if record["status"] == "success" and record["match_scores"]["overall_fit"] >= min_score
+    ]
+    candidates.sort(key=lambda record: record["match_scores"]["overall_fit"], reverse=True)
+    return candidates if top_k is None else candidates[:top_k]
+
+
+def blend_semantic_fit(local_results: List[Dict[str, Any]], parsed: List[Dict[str, Any]],
+                       job_analysis: Any, semantic_weight: float) -> None:
+    """
+    Add each resume's semantic fit to its local match scores and blend it
+    into overall_fit; the keyword-only value is kept as keyword_fit.
+    """
+    from src.resume_crew.semantic import SemanticIndex
+
+    documents = [
+        (record["resume_path"], resume["content"])
+        for record, resume in zip(local_results, parsed) if record["status"] == "success"
+    ]
+    with SemanticIndex() as index:
+        stats = index.add_many(documents)
+        semantic = index.score_job(job_analysis, [path for path, _ in documents])
+    print(f"🧭 Semantic stage: {len(documents)} resumes, {stats['embedded']} new chunk embeddings")
+
+    for record in local_results:
+        if record["status"] != "success":
+            continue
+        scores = record["match_scores"]
+        semantic_fit = semantic.get(record["resume_path"], 0.0)
+        scores["keyword_fit"] = scores["overall_fit"]
+        scores["semantic_fit"] = semantic_fit
+        scores["overall_fit"] = round((1 - semantic_weight) * scores["overall_fit"] + semantic_weight * semantic_fit, 1)
+
+
+def run_pipeline(job_url: str, company_name: str, resume_paths: List[str],
+                 output_dir: Path, top_k: Optional[int] = 10, min_score: float = 0,
+                 max_workers: int = 4, semantic_weight: float = 0.0) -> Dict[str, Any]:
+    """
+    Two-stage retrieve-then-rerank run.
+
+    Stage one scores every resume locally with MatchScorer against the
+    job profile and keeps the top_k resumes whose overall fit is at
+    least min_score. With a semantic_weight above 0, the local overall fit
+    blends in that share of the embedding-based semantic fit (see
+    semantic.SemanticIndex), so resumes that paraphrase the requirements
+    are not ranked out by keyword matching. Stage two runs the resume
+    optimization LLM task only for that shortlist. The summary, including
+    how many LLM calls were avoided, is written to pipeline_ranking.json.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    counts_before = task_counts()
+    job_record = analyze_job(job_url, company_name, output_dir)
+    if job_record is None:
+        return {}
+    profile = job_record["profile"]
+
+    print(f"⚡ Stage 1: scoring {len(resume_paths)} resumes locally...")
+    scorer = MatchScorer.from_profile(profile)
+    parsed = parse_resumes(resume_paths, max_workers)
+    write_skill_matrix(profile.to_job_analysis(), resume_paths, parsed, output_dir)
+
+    local_results = []
+    for resume_path, resume in zip(resume_paths, parsed):
+        if resume["status"] != "success":
+            local_results.append({
+                "resume_path": resume_path,
+                "error": resume["error"],
+                "status": "error"
+            })
+            continue
+        scored = scorer.score(resume["content"])
+        local_results.append({
+            "resume_path": resume_path,
+            "match_scores": scored["match_scores"],
+            "skill_gaps": scored["skill_gaps"],
+            "status": "success"
+        })
+
+    if semantic_weight > 0:
+        blend_semantic_fit(local_results, parsed, profile, semantic_weight)
+
+    selected = shortlist(local_results, top_k, min_score)
+    print(f"🎯 Stage 2: {len(selected)} of {len(resume_paths)} resumes shortlisted for LLM review")
+
+    # Local scores are stored for every resume, LLM scores for the shortlist
+    writer = ResultsWriter(get_results_store())
+    fields = run_fields("pipeline", company_name, profile)
+    for record in local_results:
+        writer.add(match_row(job_url, record["resume_path"], record if record["status"] == "success" else None,
+                             scored_by="local", status=record["status"], **fields))
+    writer.flush()
+
+    llm_results = optimize_resumes(
+        job_url, company_name, profile, [record["resume_path"] for record in selected],
+        output_dir / "pipeline_results.jsonl", max_workers=max_workers, mode="pipeline",
+        parsed=dict(zip(resume_paths, parsed))
+    )
+    llm_by_path = {record["resume_path"]: record for record in llm_results}
+    local_by_path = {record["resume_path"]: record for record in selected}
+
+    ranking = sorted(llm_results, key=overall_fit, reverse=True)
+    counts = task_counts()
+    summary = {
+        "job_url": job_url,
+        "company_name": company_name,
+        "job_analysis": profile.analysis,
+        "top_k": top_k,
+        "min_score": min_score,
+        "resumes_total": len(resume_paths),
+        "shortlisted": len(selected),
+        # Crews the runner actually kicked off; avoided are the tasks answered by the
+        # stored job profile, the task cache or a reused match, and the readable
+        # resumes the local stage kept out of the shortlist
+        "llm_calls_made": counts["kickoffs"] - counts_before["kickoffs"],
+        "llm_calls_avoided": (
+            int(job_record["cached"]) + counts["cache_hits"] - counts_before["cache_hits"]
+            + sum(1 for record in llm_results if record.get("cached"))
+            + sum(1 for record in local_results if record["status"] == "success") - len(selected)
+        ),
+        "ranking": [
+            {
+                "rank": rank,
+                "resume_path": record["resume_path"],
+                "overall_fit": overall_fit(record),
+                "local_overall_fit": local_by_path[record["resume_path"]]["match_scores"]["overall_fit"],
+                "status": record["status"]
+            }
+            for rank, record in enumerate(ranking, start=1)
+        ],
+        "local_scores": [
+            {
+                "resume_path": record["resume_path"],
+                "match_scores": record.get("match_scores"),
+                "skill_gaps": record.get("skill_gaps", []),
+                "shortlisted": record["resume_path"] in llm_by_path,
+                "status": record["status"]
+            }
+            for record in local_results
+        ]
+    }
+    with open(output_dir / "pipeline_ranking.json", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    return summary
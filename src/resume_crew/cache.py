@@ -0,0 +1,311 @@
+"""
+On-disk caches for parsed resumes, fetched job pages, LLM task outputs, job profiles and pipeline artifacts
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_PARSE_CACHE_DIR = ".cache/resume_parse"
+DEFAULT_PARSE_CACHE_MAX_MB = 256
+DEFAULT_FETCH_CACHE_DIR = ".cache/job_pages"
+DEFAULT_FETCH_CACHE_MAX_MB = 256
+DEFAULT_FETCH_CACHE_TTL = 3600
+DEFAULT_TASK_CACHE_DIR = ".cache/llm_outputs"
+DEFAULT_TASK_CACHE_MAX_MB = 256
+DEFAULT_TASK_CACHE_TTL = 7 * 24 * 3600
+DEFAULT_PROFILE_CACHE_DIR = ".cache/job_profiles"
+DEFAULT_PROFILE_CACHE_MAX_MB = 64
+DEFAULT_ARTIFACT_CACHE_DIR = ".cache/artifacts"
+DEFAULT_ARTIFACT_CACHE_MAX_MB = 256
+
+
+class DiskCache:
+    """
+    Size-bounded store of zlib-compressed JSON entries.
+
+    File mtimes track recency: hits touch the entry and writes evict the
+    least recently used entries once the cache exceeds max_bytes.
+    """
+
+    SUFFIX = ".json.z"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._size = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached entry for key, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            entry = json.loads(zlib.decompress(path.read_bytes()))
+            os.utime(path)
+            return entry
+        except (OSError, zlib.error, ValueError):
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry and evict old entries if the cache is over budget.
+        An entry replacing an existing one only adds the size difference.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = zlib.compress(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(payload)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(payload) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield path, stat
+
+    def _scan_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache is back under budget.
+        """
+        entries = sorted(self._entries(), key=lambda item: item[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                size -= stat.st_size
+            except OSError:
+                continue
+        self._size = size
+
+
+class ParseCache(DiskCache):
+    """
+    Content-addressed cache of parsed resume text.
+
+    Entries are keyed by the SHA-256 of the parser version plus the raw
+    file bytes, so an unchanged file always maps to the same entry and a
+    parser upgrade invalidates everything.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_PARSE_CACHE_DIR,
+                 max_bytes: int = DEFAULT_PARSE_CACHE_MAX_MB * 1024 * 1024):
+        super().__init__(cache_dir, max_bytes)
+
+    @classmethod
+    def from_env(cls) -> Optional["ParseCache"]:
+        """
+        Build the cache from RESUME_PARSE_CACHE_DIR / RESUME_PARSE_CACHE_MAX_MB.
+        An empty RESUME_PARSE_CACHE_DIR disables caching.
+        """
+        cache_dir = os.getenv("RESUME_PARSE_CACHE_DIR", DEFAULT_PARSE_CACHE_DIR)
+        if not cache_dir:
+            return None
+        max_mb = float(os.getenv("RESUME_PARSE_CACHE_MAX_MB", DEFAULT_PARSE_CACHE_MAX_MB))
+        return cls(cache_dir, max_bytes=int(max_mb * 1024 * 1024))
+
+    @staticmethod
+    def key_for(data: bytes, parser_version: str) -> str:
+        """
+        Compute the cache key for raw file bytes and a parser version.
+        """
+        digest = hashlib.sha256(parser_version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+
+class FetchCache(DiskCache):
+    """
+    Cache of fetched job pages keyed by URL.
+
+    Entries hold the raw body, the ETag/Last-Modified validators, the
+    extracted text and the time of the last successful fetch, so a stale
+    entry can be revalidated with a conditional request.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_FETCH_CACHE_DIR,
+                 max_bytes: int = DEFAULT_FETCH_CACHE_MAX_MB * 1024 * 1024,
+                 ttl: float = DEFAULT_FETCH_CACHE_TTL):
+        super().__init__(cache_dir, max_bytes)
+        self.ttl = ttl
+
+    @classmethod
+    def from_env(cls) -> Optional["FetchCache"]:
+        """
+        Build the cache from JOB_FETCH_CACHE_DIR / JOB_FETCH_CACHE_MAX_MB /
+        JOB_FETCH_CACHE_TTL. An empty JOB_FETCH_CACHE_DIR disables caching.
+        """
+        cache_dir = os.getenv("JOB_FETCH_CACHE_DIR", DEFAULT_FETCH_CACHE_DIR)
+        if not cache_dir:
+            return None
+        max_mb = float(os.getenv("JOB_FETCH_CACHE_MAX_MB", DEFAULT_FETCH_CACHE_MAX_MB))
+        ttl = float(os.getenv("JOB_FETCH_CACHE_TTL", DEFAULT_FETCH_CACHE_TTL))
+        return cls(cache_dir, max_bytes=int(max_mb * 1024 * 1024), ttl=ttl)
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """
+        Compute the cache key for a job posting URL.
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def is_fresh(self, entry: Dict[str, Any], now: float) -> bool:
+        """
+        Check whether an entry is still within its TTL.
+        """
+        return now - entry.get("fetched_at", 0) < self.ttl
+
+
+class TaskOutputCache(DiskCache):
+    """
+    Cache of LLM task outputs.
+
+    Entries are keyed by everything that determines the prompt and the model
+    answering it: the rendered task description and expected output, the
+    agent's role, goal and backstory, and the model name. Entries older than
+    ttl seconds are treated as misses. Hit and miss counts are kept for the
+    run summary.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_TASK_CACHE_DIR,
+                 max_bytes: int = DEFAULT_TASK_CACHE_MAX_MB * 1024 * 1024,
+                 ttl: float = DEFAULT_TASK_CACHE_TTL):
+        super().__init__(cache_dir, max_bytes)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["TaskOutputCache"]:
+        """
+        Build the cache from LLM_CACHE_DIR / LLM_CACHE_MAX_MB / LLM_CACHE_TTL.
+        An empty LLM_CACHE_DIR disables caching.
+        """
+        cache_dir = os.getenv("LLM_CACHE_DIR", DEFAULT_TASK_CACHE_DIR)
+        if not cache_dir:
+            return None
+        max_mb = float(os.getenv("LLM_CACHE_MAX_MB", DEFAULT_TASK_CACHE_MAX_MB))
+        ttl = float(os.getenv("LLM_CACHE_TTL", DEFAULT_TASK_CACHE_TTL))
+        return cls(cache_dir, max_bytes=int(max_mb * 1024 * 1024), ttl=ttl)
+
+    @staticmethod
+    def key_for(description: str, expected_output: str, role: str, goal: str,
+                backstory: str, model: str) -> str:
+        """
+        Compute the cache key for a rendered task and the agent/model running it.
+        """
+        parts = (description, expected_output, role, goal, backstory, model)
+        return hashlib.sha256("\0".join(part or "" for part in parts).encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a fresh cached output for key and count the hit or miss.
+        """
+        entry = self.get(key)
+        fresh = entry is not None and time.time() - entry.get("created_at", 0) < self.ttl
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry if fresh else None
+
+    def store(self, key: str, output: Dict[str, Any]) -> None:
+        """
+        Store a task output with its creation time.
+        """
+        self.put(key, {**output, "created_at": time.time()})
+
+
+class JobProfileCache(DiskCache):
+    """
+    Store of compiled job profiles keyed by job URL and posting content hash.
+
+    A changed posting hashes to a new key, so entries never go stale and
+    need no TTL.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_PROFILE_CACHE_DIR,
+                 max_bytes: int = DEFAULT_PROFILE_CACHE_MAX_MB * 1024 * 1024):
+        super().__init__(cache_dir, max_bytes)
+
+    @classmethod
+    def from_env(cls) -> Optional["JobProfileCache"]:
+        """
+        Build the store from JOB_PROFILE_CACHE_DIR / JOB_PROFILE_CACHE_MAX_MB.
+        An empty JOB_PROFILE_CACHE_DIR disables it.
+        """
+        cache_dir = os.getenv("JOB_PROFILE_CACHE_DIR", DEFAULT_PROFILE_CACHE_DIR)
+        if not cache_dir:
+            return None
+        max_mb = float(os.getenv("JOB_PROFILE_CACHE_MAX_MB", DEFAULT_PROFILE_CACHE_MAX_MB))
+        return cls(cache_dir, max_bytes=int(max_mb * 1024 * 1024))
+
+    @staticmethod
+    def key_for(job_url: str, content_hash: str) -> str:
+        """
+        Compute the store key for a job URL and the hash of its posting text.
+        """
+        return hashlib.sha256(f"{job_url}\0{content_hash}".encode("utf-8")).hexdigest()
+
+
+class ArtifactCache(DiskCache):
+    """
+    Store of built pipeline artifacts keyed by stage and input fingerprints.
+
+    Changed inputs produce a new key, so entries never go stale and need
+    no TTL; unused ones age out through LRU eviction.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_ARTIFACT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_ARTIFACT_CACHE_MAX_MB * 1024 * 1024):
+        super().__init__(cache_dir, max_bytes)
+
+    @classmethod
+    def from_env(cls) -> Optional["ArtifactCache"]:
+        """
+        Build the store from ARTIFACT_CACHE_DIR / ARTIFACT_CACHE_MAX_MB.
+        An empty ARTIFACT_CACHE_DIR disables it.
+        """
+        cache_dir = os.getenv("ARTIFACT_CACHE_DIR", DEFAULT_ARTIFACT_CACHE_DIR)
+        if not cache_dir:
+            return None
+        max_mb = float(os.getenv("ARTIFACT_CACHE_MAX_MB", DEFAULT_ARTIFACT_CACHE_MAX_MB))
+        return cls(cache_dir, max_bytes=int(max_mb * 1024 * 1024))
+
+    @staticmethod
+    def key_for(stage: str, version: int, input_fingerprints: List[str]) -> str:
+        """
+        Compute the store key for a stage run on the given input fingerprints.
+        """
+        return hashlib.sha256("\0".join([stage, str(version)] + input_fingerprints).encode("utf-8")).hexdigest()
@@ -0,0 +1,288 @@
+"""
+Token-budgeted resume compaction before the resume optimization task
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from src.resume_crew.scoring import _as_list, content_tokens, tokenize
+from src.resume_crew.taxonomy import get_taxonomy
+from src.resume_crew.tools import PDF_PAGE_SEPARATOR
+
+DEFAULT_RESUME_TOKEN_BUDGET = 2000
+
+# Rough size of an LLM token in characters of English text
+CHARS_PER_TOKEN = 4
+
+# A section is cut to its first lines rather than dropped when at least this many tokens are left
+MIN_PARTIAL_TOKENS = 60
+
+# Lines this close to a page edge are checked for repeated headers and footers
+PAGE_EDGE_LINES = 3
+
+KNOWN_HEADINGS = frozenset("""
+summary|profile|professional summary|career summary|objective|about me|experience|work experience|
+professional experience|employment|employment history|work history|career history|skills|technical skills|
+key skills|core competencies|competencies|expertise|technologies|education|academic background|
+qualifications|projects|key projects|certifications|certificates|licenses and certifications|awards|
+achievements|accomplishments|publications|languages|interests|hobbies|references|volunteering|
+volunteer experience|training|courses|leadership|contact|contact information|contact details|personal details
+""".replace("\n", "").split("|"))
+
+# Sections always kept ahead of ranked ones, besides the unheaded preamble (the candidate's name)
+PINNED_HEADING_WORDS = ("contact", "personal", "summary")
+
+# Share of the budget the pinned sections may use; beyond it they are cut to their leading lines
+PINNED_BUDGET_SHARE = 0.25
+
+# Relevance bonus by section kind, on top of the overlap with the job
+SECTION_PRIORS = {
+    "experience": 2.0, "employment": 2.0, "work": 2.0, "skills": 2.0, "competencies": 2.0,
+    "summary": 1.0, "profile": 1.0, "projects": 1.0, "education": 1.0, "certifications": 1.0,
+    "interests": -1.0, "hobbies": -1.0, "references": -2.0,
+}
+
+MARKDOWN_HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$")
+PAGE_NUMBER_RE = re.compile(r"^(?:page\s*)?\d+(?:\s*(?:/|of)\s*\d+)?$", re.IGNORECASE)
+DIGITS_RE = re.compile(r"\d+")
+ALL_CAPS_HEADING_RE = re.compile(r"^[A-Z][A-Z&/,' -]*:?$")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the LLM token count of a text (about four characters per token).
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def resume_token_budget() -> int:
+    """
+    Token budget of a compacted resume (RESUME_TOKEN_BUDGET).
+    """
+    return int(os.getenv("RESUME_TOKEN_BUDGET", DEFAULT_RESUME_TOKEN_BUDGET))
+
+
+def _line_key(line: str) -> str:
+    """
+    Normalized form of a line for duplicate detection.
+    """
+    return " ".join(line.lower().split())
+
+
+def _edge_key(line: str) -> str:
+    """
+    Normalized form of a page edge line, ignoring numbers that change per page.
+    """
+    return DIGITS_RE.sub("#", _line_key(line))
+
+
+def strip_page_furniture(text: str) -> str:
+    """
+    Remove page numbers, and header/footer lines repeated near the edges of
+    most pages of a PDF (pages are separated by PDF_PAGE_SEPARATOR); the
+    first copy of a repeated header is kept.
+    """
+    pages = []
+    for page in text.split(PDF_PAGE_SEPARATOR):
+        lines = [line for line in page.splitlines() if line.strip() and not PAGE_NUMBER_RE.match(line.strip())]
+        edges = set(range(min(PAGE_EDGE_LINES, len(lines)))) | set(range(max(0, len(lines) - PAGE_EDGE_LINES), len(lines)))
+        pages.append((lines, edges))
+
+    repeated = set()
+    if len(pages) > 1:
+        edge_counts = Counter()
+        for lines, edges in pages:
+            edge_counts.update({_edge_key(lines[index]) for index in edges})
+        threshold = max(2, math.ceil(len(pages) / 2))
+        repeated = {key for key, count in edge_counts.items() if count >= threshold}
+
+    kept, emitted = [], set()
+    for lines, edges in pages:
+        for index, line in enumerate(lines):
+            key = _edge_key(line)
+            if index in edges and key in repeated:
+                # The first header stays: on page one it usually carries the candidate's name
+                if key in emitted or index >= PAGE_EDGE_LINES:
+                    continue
+                emitted.add(key)
+            kept.append(line)
+    return "\n".join(kept)
+
+
+def _heading(line: str) -> Optional[str]:
+    """
+    Section title if the line is a heading, else None.
+    """
+    stripped = line.strip()
+    match = MARKDOWN_HEADING_RE.match(stripped)
+    if match:
+        return match.group(1).strip()
+    if not stripped or len(stripped) > 40:
+        return None
+    normalized = " ".join(re.sub(r"[^a-z ]", " ", stripped.lower()).split())
+    if normalized in KNOWN_HEADINGS:
+        return stripped.rstrip(":")
+    words = stripped.rstrip(":").split()
+    if stripped.isupper() and len(words) <= 4 and ALL_CAPS_HEADING_RE.match(stripped):
+        return stripped.rstrip(":")
+    return None
+
+
+def split_sections(text: str) -> List[Dict[str, Any]]:
+    """
+    Split resume text into sections at detected headings. Text before the
+    first heading (name and contact details) becomes an untitled section.
+    Repeated non-empty lines are kept only at their first occurrence.
+    """
+    sections = [{"title": None, "lines": []}]
+    seen = set()
+    for line in text.splitlines():
+        title = _heading(line)
+        if title is not None:
+            sections.append({"title": title, "lines": [line.strip()]})
+            continue
+        stripped = line.strip()
+        if not stripped:
+            continue
+        key = _line_key(stripped)
+        if len(key) > 2 and key in seen:
+            continue
+        seen.add(key)
+        sections[-1]["lines"].append(stripped)
+    return [section for section in sections if section["lines"]]
+
+
+def job_terms(job_analysis: Any) -> Dict[str, Any]:
+    """
+    Terms used to rank sections: content tokens of the job's skills and
+    responsibilities, and the canonical skills they name.
+    """
+    if hasattr(job_analysis, "to_job_analysis"):
+        synonyms = job_analysis.synonyms
+        job_analysis = job_analysis.to_job_analysis()
+    else:
+        synonyms = {}
+    if not isinstance(job_analysis, dict):
+        return {"tokens": frozenset(), "skills": frozenset()}
+
+    skills = _as_list(job_analysis.get("required_skills")) + _as_list(job_analysis.get("preferred_skills"))
+    skills += [alias for skill in skills for alias in synonyms.get(skill, [])]
+    texts = skills + _as_list(job_analysis.get("key_responsibilities"))
+    taxonomy = get_taxonomy()
+    return {
+        "tokens": frozenset(token for text in texts for token in content_tokens(text)),
+        "skills": frozenset(filter(None, map(taxonomy.canonical, skills))) if taxonomy else frozenset()
+    }
+
+
+def _relevance(section: Dict[str, Any], terms: Dict[str, Any]) -> float:
+    """
+    Relevance of a section to the job: canonical skill and term overlap per
+    square root of its length, plus a prior for the section kind.
+    """
+    text = "\n".join(section["lines"])
+    tokens = tokenize(text)
+    overlap = len(terms["tokens"].intersection(tokens))
+    taxonomy = get_taxonomy()
+    if taxonomy is not None and terms["skills"]:
+        overlap += 3 * len(terms["skills"] & taxonomy.extract_tokens(tokens))
+    title = (section["title"] or "").lower()
+    prior = max((value for word, value in SECTION_PRIORS.items() if word in title), default=0.0)
+    return overlap / math.sqrt(len(tokens) + 1) + prior
+
+
+def _fit(section: Dict[str, Any], available: int, min_partial: int = MIN_PARTIAL_TOKENS) -> Optional[int]:
+    """
+    Fit a section into the available tokens, cutting it to its leading
+    lines when it is too long; a first line that alone is too long is cut
+    to the characters that fit. Returns the tokens used, or None when the
+    section is dropped (less than min_partial tokens are available, or not
+    even part of a line fits).
+    """
+    if section["tokens"] <= available:
+        return section["tokens"]
+    if available < min_partial:
+        return None
+    lines, used = [], 0
+    for line in section["lines"]:
+        cost = estimate_tokens(line) + 1
+        if used + cost > available:
+            if not lines and available > 1:
+                line = line[:(available - 1) * CHARS_PER_TOKEN]
+                lines.append(line)
+                used = estimate_tokens(line) + 1
+            break
+        lines.append(line)
+        used += cost
+    if not lines:
+        return None
+    section["lines"] = lines
+    return used
+
+
+def compact_resume(text: str, job_analysis: Any = None, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compact resume text to fit a token budget.
+
+    Page headers/footers and duplicate lines are removed, then sections are
+    ranked by relevance to the job (a JobProfile or job analysis dict) and
+    added best first until the budget (RESUME_TOKEN_BUDGET by default) is
+    used up. The unheaded preamble (name and headline) and the contact and
+    summary sections are always kept first, within a quarter of the budget
+    (PINNED_BUDGET_SHARE), and the last section that does not fit is cut to
+    its leading lines. Kept sections stay in document order.
+    """
+    if max_tokens is None:
+        max_tokens = resume_token_budget()
+    original_tokens = estimate_tokens(text)
+    sections = split_sections(strip_page_furniture(text))
+    for section in sections:
+        section["tokens"] = estimate_tokens("\n".join(section["lines"])) + 1
+
+    terms = job_terms(job_analysis)
+    # A resume without headings is all preamble: it is cut to the budget, not pinned
+    pinned = [
+        section for index, section in enumerate(sections)
+        if (index == 0 and section["title"] is None and len(sections) > 1)
+        or (section["title"] and any(word in section["title"].lower() for word in PINNED_HEADING_WORDS))
+    ]
+    pinned_ids = {id(section) for section in pinned}
+    ranked = sorted(
+        (section for section in sections if id(section) not in pinned_ids),
+        key=lambda section: _relevance(section, terms), reverse=True
+    )
+
+    remaining = max_tokens
+    pinned_remaining = int(max_tokens * PINNED_BUDGET_SHARE)
+    kept, dropped = set(), []
+    for section in pinned:
+        used = _fit(section, min(remaining, pinned_remaining), min_partial=0)
+        if used:
+            kept.add(id(section))
+            remaining -= used
+            pinned_remaining -= used
+        else:
+            dropped.append(section["title"])
+    for section in ranked:
+        used = _fit(section, remaining)
+        if used is None:
+            dropped.append(section["title"])
+        else:
+            kept.add(id(section))
+            remaining -= used
+
+    content = "\n\n".join(
+        "\n".join(section["lines"]) for section in sections if id(section) in kept and section["lines"]
+    )
+    compacted_tokens = estimate_tokens(content)
+    return {
+        "content": content,
+        "original_tokens": original_tokens,
+        "compacted_tokens": compacted_tokens,
+        "tokens_saved": max(0, original_tokens - compacted_tokens),
+        "sections": [section["title"] for section in sections if section["title"] and id(section) in kept],
+        "sections_dropped": dropped
+    }
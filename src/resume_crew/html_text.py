@@ -0,0 +1,197 @@
+"""
+Lean HTML-to-text extraction for job postings
+"""
+
+import os
+import re
+from typing import Any, Dict, Optional, Union
+
+import lxml.html
+from lxml import etree
+
+# Bump whenever lean extraction changes so cached pages are re-extracted
+LEAN_EXTRACTOR_VERSION = 1
+
+EXTRACTION_MODES = ("lean", "full")
+
+# Elements that never hold posting text
+BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "template", "nav", "aside", "iframe", "svg",
+    "button", "input", "select", "textarea", "dialog"
+)
+
+# Page headers and footers, kept when they belong to an article or section
+PAGE_CHROME_TAGS = ("header", "footer")
+CONTENT_TAGS = frozenset({"article", "main", "section"})
+
+# ARIA landmarks of page chrome rather than content
+BOILERPLATE_ROLES = frozenset({"navigation", "banner", "contentinfo", "complementary", "dialog", "alertdialog"})
+
+# class/id tokens of cookie banners, menus, share bars and the like
+BOILERPLATE_HINT_RE = re.compile(
+    r"(?:^|[-_])(?:cookies?|consent|gdpr|navbar|navigation|menu|breadcrumbs?|footer|"
+    r"sidebar|newsletter|share|social|modal|popup|subscribe)(?:$|[-_])",
+    re.IGNORECASE
+)
+
+# class/id tokens of the container job boards put the posting in
+JOB_BODY_HINT_RE = re.compile(r"job[-_]?(?:description|details|posting|body|content)|posting[-_]?(?:body|content)",
+                              re.IGNORECASE)
+
+# A candidate container must hold this share of the page's words to be trusted
+MIN_MAIN_SHARE = 0.25
+
+BLOCK_TAGS = frozenset({
+    "address", "article", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption", "h1", "h2", "h3",
+    "h4", "h5", "h6", "hr", "li", "main", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul"
+})
+
+_CHARSET_RE = re.compile(rb"charset\s*=", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def extraction_mode() -> str:
+    """
+    Job page extraction mode from JOB_PAGE_EXTRACTION: "lean" (default) keeps
+    only the posting body, "full" keeps all the text of the page.
+    """
+    mode = os.getenv("JOB_PAGE_EXTRACTION", "lean").strip().lower() or "lean"
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"JOB_PAGE_EXTRACTION must be one of {', '.join(EXTRACTION_MODES)}, got {mode!r}")
+    return mode
+
+
+def extractor_tag(mode: str) -> str:
+    """
+    Tag stored with cached pages, so a page extracted another way is re-extracted.
+    """
+    return f"lean/{LEAN_EXTRACTOR_VERSION}" if mode == "lean" else mode
+
+
+def _is_boilerplate(element) -> bool:
+    if element.get("role", "").lower() in BOILERPLATE_ROLES:
+        return True
+    if element.get("aria-hidden") == "true" or element.get("hidden") is not None:
+        return True
+    hints = f"{element.get('class', '')} {element.get('id', '')}".split()
+    return any(BOILERPLATE_HINT_RE.search(hint) for hint in hints)
+
+
+def _is_main_candidate(element) -> bool:
+    if element.tag in ("main", "article") or element.get("role") == "main":
+        return True
+    return bool(JOB_BODY_HINT_RE.search(f"{element.get('class', '')} {element.get('id', '')}"))
+
+
+def _word_count(element) -> int:
+    return len("".join(element.itertext()).split())
+
+
+def _strip_page_chrome(document) -> None:
+    """
+    Drop scripts, styles, navigation and form controls everywhere, and the
+    headers and footers of the page itself.
+    """
+    etree.strip_elements(document, *BOILERPLATE_TAGS, with_tail=False)
+    for element in list(document.iter(*PAGE_CHROME_TAGS)):
+        if not any(ancestor.tag in CONTENT_TAGS for ancestor in element.iterancestors()):
+            element.drop_tree()
+
+
+def _main_body(document):
+    """
+    The element holding the posting: the largest <main>, <article> or
+    job-description container with a fair share of the page's words, else <body>.
+    """
+    body = document.find("body")
+    if body is None:
+        body = document
+    total = _word_count(body)
+    candidates = [element for element in body.iter(etree.Element) if _is_main_candidate(element)]
+    if candidates and total:
+        words, element = max(((_word_count(element), element) for element in candidates), key=lambda item: item[0])
+        if words >= total * MIN_MAIN_SHARE:
+            return element
+    return body
+
+
+def _strip_boilerplate(root) -> None:
+    """
+    Drop cookie banners, menus and share bars below root. Hint-matched
+    elements holding most of root's words are kept: a wrapper called
+    "has-sidebar" is layout, not chrome.
+    """
+    total = _word_count(root)
+    for element in [element for element in root.iter(etree.Element) if element is not root and _is_boilerplate(element)]:
+        # Skip elements already dropped with a boilerplate ancestor
+        if not any(ancestor is root for ancestor in element.iterancestors()):
+            continue
+        if _word_count(element) * 2 < total:
+            element.drop_tree()
+
+
+def _block_text(root) -> str:
+    """
+    Text of root with block elements on their own lines and whitespace collapsed.
+    """
+    parts = []
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        block = element.tag in BLOCK_TAGS
+        if event == "start":
+            if block:
+                parts.append("\n- " if element.tag == "li" else "\n")
+            if element.text:
+                parts.append(_WHITESPACE_RE.sub(" ", element.text))
+        else:
+            if block:
+                parts.append("\n")
+            if element.tail and element is not root:
+                parts.append(_WHITESPACE_RE.sub(" ", element.tail))
+    lines = (line.strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line and line != "-")
+
+
+def _parse(content: bytes, encoding: Optional[str]):
+    if encoding is None and not _CHARSET_RE.search(content[:4096]):
+        # Undeclared pages are almost always UTF-8; libxml2 would assume Latin-1
+        try:
+            content.decode("utf-8")
+            encoding = "utf-8"
+        except UnicodeDecodeError:
+            pass
+    parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True, remove_pis=True)
+    return lxml.html.document_fromstring(content, parser=parser)
+
+
+def extract_page_text(content: Union[bytes, str], encoding: Optional[str] = None,
+                      mode: str = "lean") -> Dict[str, Any]:
+    """
+    Extract the text of an HTML job page.
+
+    "lean" parses with lxml, drops scripts, styles, navigation, cookie
+    banners and footers, isolates the posting body and collapses whitespace.
+    "full" is the whole page text as BeautifulSoup's html.parser sees it.
+
+    Returns the text with the raw and extracted sizes in bytes.
+    """
+    if isinstance(content, str):
+        content, encoding = content.encode("utf-8"), "utf-8"
+
+    if mode == "full":
+        from bs4 import BeautifulSoup
+        text = BeautifulSoup(content, "html.parser", from_encoding=encoding).get_text()
+    elif not content.strip():
+        text = ""
+    else:
+        document = _parse(content, encoding)
+        _strip_page_chrome(document)
+        root = _main_body(document)
+        _strip_boilerplate(root)
+        text = _block_text(root)
+
+    return {
+        "content": text,
+        "raw_bytes": len(content),
+        "text_bytes": len(text.encode("utf-8")),
+        "extractor": extractor_tag(mode)
+    }
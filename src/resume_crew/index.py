@@ -0,0 +1,206 @@
+"""
+Incremental inverted index over resume files with BM25 retrieval
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.resume_crew.scoring import _as_list, content_tokens
+from src.resume_crew.tools import ResumeAnalysisTools, find_resume_files
+
+DEFAULT_INDEX_PATH = ".cache/resume_index.sqlite"
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Query term weights by job analysis field
+QUERY_FIELD_WEIGHTS = (
+    ("required_skills", 1.0),
+    ("preferred_skills", 0.5),
+    ("key_responsibilities", 0.25),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (doc_id);
+"""
+
+
+def job_query_terms(job_analysis: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Build weighted query terms from a job analysis.
+    """
+    terms = Counter()
+    for field, weight in QUERY_FIELD_WEIGHTS:
+        for item in _as_list(job_analysis.get(field)):
+            for token in set(content_tokens(item)):
+                terms[token] += weight
+    return dict(terms)
+
+
+class ResumeIndex:
+    """
+    Inverted index of resumes persisted in SQLite.
+
+    Stores postings (term, document, term frequency) and document lengths.
+    Files are re-indexed only when their size or mtime changed and their
+    parsed content hash differs from the indexed one.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or os.getenv("RESUME_INDEX_PATH", DEFAULT_INDEX_PATH))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def update(self, paths: Iterable[str], prune: bool = False) -> Dict[str, Any]:
+        """
+        Index new and changed files. With prune, documents not in paths are removed.
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "errors": []}
+        known = {
+            path: (doc_id, mtime, size, content_hash)
+            for doc_id, path, mtime, size, content_hash in self.conn.execute(
+                "SELECT doc_id, path, mtime, size, content_hash FROM documents"
+            )
+        }
+        seen = set()
+
+        with self.conn:
+            for path in paths:
+                path = str(path)
+                seen.add(path)
+                try:
+                    stat = os.stat(path)
+                except OSError as e:
+                    stats["errors"].append({"resume_path": path, "error": str(e)})
+                    continue
+
+                existing = known.get(path)
+                if existing and existing[1] == stat.st_mtime and existing[2] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+
+                parsed = ResumeAnalysisTools.analyze_resume(path)
+                if parsed["status"] != "success":
+                    stats["errors"].append({"resume_path": path, "error": parsed["error"]})
+                    continue
+                content_hash = hashlib.sha256(parsed["content"].encode("utf-8")).hexdigest()
+
+                if existing and existing[3] == content_hash:
+                    self.conn.execute(
+                        "UPDATE documents SET mtime = ?, size = ? WHERE doc_id = ?",
+                        (stat.st_mtime, stat.st_size, existing[0])
+                    )
+                    stats["unchanged"] += 1
+                    continue
+
+                if existing:
+                    self._delete(existing[0])
+                self._insert(path, stat, content_hash, parsed["content"])
+                stats["updated" if existing else "added"] += 1
+
+            if prune:
+                for path, (doc_id, *_) in known.items():
+                    if path not in seen:
+                        self._delete(doc_id)
+                        stats["removed"] += 1
+
+        return stats
+
+    def update_directory(self, directory: str) -> Dict[str, Any]:
+        """
+        Bring the index in sync with all resume files below a directory.
+        """
+        return self.update(find_resume_files(directory), prune=True)
+
+    def _insert(self, path: str, stat: os.stat_result, content_hash: str, content: str) -> None:
+        tokens = content_tokens(content)
+        cursor = self.conn.execute(
+            "INSERT INTO documents (path, mtime, size, content_hash, length) VALUES (?, ?, ?, ?, ?)",
+            (path, stat.st_mtime, stat.st_size, content_hash, len(tokens))
+        )
+        doc_id = cursor.lastrowid
+        self.conn.executemany(
+            "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+            ((term, doc_id, tf) for term, tf in Counter(tokens).items())
+        )
+
+    def _delete(self, doc_id: int) -> None:
+        self.conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def search(self, query_terms: Dict[str, float], top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Return the top-k (path, BM25 score) pairs for weighted query terms.
+        """
+        if not query_terms:
+            return []
+        doc_count, total_length = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM documents"
+        ).fetchone()
+        if not doc_count:
+            return []
+        avg_length = total_length / doc_count or 1
+
+        terms = list(query_terms)
+        placeholders = ",".join("?" * len(terms))
+        rows = self.conn.execute(
+            f"SELECT p.term, p.doc_id, p.tf, d.length FROM postings p "
+            f"JOIN documents d ON d.doc_id = p.doc_id WHERE p.term IN ({placeholders})",
+            terms
+        ).fetchall()
+
+        doc_freq = Counter(term for term, _, _, _ in rows)
+        scores = Counter()
+        for term, doc_id, tf, length in rows:
+            df = doc_freq[term]
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+            scores[doc_id] += query_terms[term] * idf * tf * (BM25_K1 + 1) / norm
+
+        top = scores.most_common(top_k)
+        if not top:
+            return []
+        paths = dict(self.conn.execute(
+            f"SELECT doc_id, path FROM documents WHERE doc_id IN ({','.join('?' * len(top))})",
+            [doc_id for doc_id, _ in top]
+        ))
+        return [(paths[doc_id], score) for doc_id, score in top]
+
+    def search_job(self, job_analysis: Dict[str, Any], top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Return the top-k candidates for a job analysis.
+        """
+        return self.search(job_query_terms(job_analysis), top_k=top_k)
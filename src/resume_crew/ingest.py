@@ -0,0 +1,126 @@
+"""
+Bulk resume ingestion into a JSONL store using a process pool
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.resume_crew.taxonomy import get_taxonomy
+from src.resume_crew.tools import ResumeAnalysisTools, find_resume_files, process_context
+
+DEFAULT_STORE_PATH = "output/resumes.jsonl"
+
+
+def ingest_file(path: str) -> Dict[str, Any]:
+    """
+    Parse one resume file into a store record with the canonical skills
+    it mentions. Errors are recorded, never raised.
+    """
+    try:
+        stat = os.stat(path)
+        record = ResumeAnalysisTools.analyze_resume(path)
+        record["resume_path"] = path
+        record["mtime"] = stat.st_mtime
+        record["size"] = stat.st_size
+        if record["status"] == "success":
+            record["content_hash"] = hashlib.sha256(record["content"].encode("utf-8")).hexdigest()
+            taxonomy = get_taxonomy()
+            if taxonomy is not None:
+                record["skills"] = sorted(taxonomy.extract(record["content"]))
+        return record
+    except Exception as e:
+        return {
+            "resume_path": path,
+            "error": str(e),
+            "status": "error"
+        }
+
+
+def load_store(store_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the latest record per resume path from a JSONL store.
+    A partially written last line (from an interrupted run) is ignored.
+    """
+    records = {}
+    if not store_path.exists():
+        return records
+    with open(store_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record["resume_path"]] = record
+    return records
+
+
+def _is_current(record: Optional[Dict[str, Any]], path: str) -> bool:
+    """
+    Check whether a stored record parsed and still matches the file on disk.
+    Failed parses are never current, so a transient failure is retried.
+    """
+    if record is None or record.get("status") != "success" or "mtime" not in record:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return record["mtime"] == stat.st_mtime and record["size"] == stat.st_size
+
+
+def ingest_directory(directory: str, store_path: str = DEFAULT_STORE_PATH,
+                     workers: Optional[int] = None, chunksize: int = 8,
+                     progress_every: int = 100) -> Dict[str, Any]:
+    """
+    Parse every .pdf/.txt/.md file below directory across a process pool.
+
+    Records are appended to the JSONL store as each file finishes, so an
+    interrupted run resumes where it stopped: files whose stored record
+    parsed and matches their current mtime and size are skipped, files
+    that failed are parsed again. Progress with files/sec is printed
+    every progress_every files.
+    """
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+
+    files = find_resume_files(directory)
+    stored = load_store(store_path)
+    pending = [path for path in files if not _is_current(stored.get(path), path)]
+    stats = {
+        "total": len(files),
+        "skipped": len(files) - len(pending),
+        "ingested": 0,
+        "errors": 0
+    }
+    print(f"📥 {len(files)} resume files found, {stats['skipped']} already ingested, {len(pending)} to parse")
+
+    # Terminate a partial last line left by an interrupted run before appending
+    if store_path.exists() and store_path.stat().st_size:
+        with open(store_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+        if needs_newline:
+            with open(store_path, "a", encoding="utf-8") as f:
+                f.write("\n")
+
+    start = time.perf_counter()
+    if pending:
+        with open(store_path, "a", encoding="utf-8") as store, process_context().Pool(processes=workers) as pool:
+            for done, record in enumerate(pool.imap_unordered(ingest_file, pending, chunksize), start=1):
+                store.write(json.dumps(record) + "\n")
+                if record["status"] == "success":
+                    stats["ingested"] += 1
+                else:
+                    stats["errors"] += 1
+                if done % progress_every == 0 or done == len(pending):
+                    store.flush()
+                    elapsed = time.perf_counter() - start
+                    print(f"   [{done}/{len(pending)}] {done / elapsed:.1f} files/sec, {stats['errors']} errors")
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    stats["files_per_second"] = round(len(pending) / stats["elapsed_seconds"], 1) if pending and stats["elapsed_seconds"] else 0.0
+    return stats
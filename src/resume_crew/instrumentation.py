@@ -0,0 +1,133 @@
+"""
+Per-stage timing, size and token instrumentation written as JSON lines
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from src.resume_crew.registry import Singleton
+
+# Trace file of the command line runs; library use keeps spans in memory unless TRACE_PATH is set
+DEFAULT_TRACE_PATH = "output/trace.jsonl"
+
+# Numeric span attributes added up per stage for the summary table
+TOTAL_FIELDS = ("bytes", "prompt_tokens", "completion_tokens", "total_tokens")
+
+
+class Tracer:
+    """
+    Records stage spans.
+
+    Every finished span is appended to the trace file as one JSON line
+    (run id, stage name, start time, wall seconds, status and the stage's
+    own attributes such as bytes read or LLM token counts) and added to
+    per-stage totals for the end-of-run summary. Spans from concurrent
+    crews may finish in any order; each line is written whole.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.run_id = f"{int(time.time())}-{os.getpid()}"
+        self.totals: Dict[str, Dict[str, float]] = {}
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """
+        Create a tracer writing to TRACE_PATH, or keeping spans in memory
+        only when it is unset or empty.
+        """
+        return cls(os.getenv("TRACE_PATH") or None)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a stage. The yielded dict holds the span attributes; the stage
+        adds its sizes and counts to it, and may set "status" itself when it
+        reports errors without raising.
+        """
+        started_at = time.time()
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield attributes
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, started_at, attributes.pop("status", status), attributes)
+
+    def record(self, name: str, seconds: float, started_at: float, status: str,
+               attributes: Dict[str, Any]) -> None:
+        """
+        Write one finished span and add it to the stage totals.
+        """
+        line = json.dumps({
+            "run_id": self.run_id,
+            "name": name,
+            "start": round(started_at, 6),
+            "seconds": round(seconds, 6),
+            "status": status,
+            **attributes
+        }, default=str)
+        with self._lock:
+            totals = self.totals.setdefault(name, {"count": 0, "errors": 0, "seconds": 0.0})
+            totals["count"] += 1
+            totals["errors"] += status != "ok"
+            totals["seconds"] += seconds
+            for field in TOTAL_FIELDS:
+                if isinstance(attributes.get(field), (int, float)):
+                    totals[field] = totals.get(field, 0) + attributes[field]
+            if self.path is not None:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def summary_table(self) -> str:
+        """
+        Per-stage totals as a fixed-width text table, slowest stage first.
+        """
+        header = f"{'Stage':<40} {'Count':>6} {'Errors':>6} {'Total s':>9} {'Mean s':>8} {'Bytes':>11} {'Tokens':>9}"
+        rows = [header, "-" * len(header)]
+        with self._lock:
+            stages = sorted(self.totals.items(), key=lambda item: item[1]["seconds"], reverse=True)
+            for name, totals in stages:
+                rows.append(
+                    f"{name[:40]:<40} {totals['count']:>6} {totals['errors']:>6} {totals['seconds']:>9.3f} "
+                    f"{totals['seconds'] / totals['count']:>8.3f} {int(totals.get('bytes', 0)):>11} "
+                    f"{int(totals.get('total_tokens', 0)):>9}"
+                )
+        return "\n".join(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# Tracer, configured from the environment on first use
+_tracer = Singleton(Tracer.from_env)
+get_tracer = _tracer.get
+
+
+def configure_tracer(tracer: Optional[Tracer] = None) -> None:
+    """
+    Set the tracer explicitly (None records spans in memory only).
+    """
+    _tracer.configure(tracer or Tracer())
+
+
+def span(name: str, **attributes: Any):
+    """
+    Time a stage with the configured tracer (see Tracer.span).
+    """
+    return get_tracer().span(name, **attributes)
@@ -0,0 +1,158 @@
+"""
+Typed output models for the crew tasks, with a validation and repair parse path
+"""
+
+import re
+from typing import Any, List, Optional, Type, TypeVar
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+SCORE_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _text_list(value: Any) -> List[str]:
+    """
+    Coerce an LLM list field to a list of strings: a bare string becomes a
+    one-item list and structured items are flattened to text.
+    """
+    if value is None:
+        return []
+    if isinstance(value, (str, dict)):
+        value = [value]
+    items = []
+    for item in value:
+        if isinstance(item, dict):
+            item = item.get("name") or item.get("skill") or "; ".join(str(v) for v in item.values())
+        if item not in (None, ""):
+            items.append(str(item))
+    return items
+
+
+def _text(value: Any) -> Optional[str]:
+    """
+    Coerce an LLM text field to a string, joining lists.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return "; ".join(_text_list(value))
+    return str(value)
+
+
+class TaskOutputModel(BaseModel):
+    """
+    Base for task outputs: unknown fields are kept, list fields accept a
+    bare string and structured items, text fields accept lists.
+    """
+
+    model_config = ConfigDict(extra="allow", populate_by_name=True)
+
+
+class JobAnalysis(TaskOutputModel):
+    """
+    Output of the job analysis task. required_skills is required (it may be
+    empty), so an object without it is not a successful analysis.
+    """
+
+    job_title: Optional[str] = None
+    required_skills: List[str]
+    preferred_skills: List[str] = Field(default_factory=list)
+    required_experience: Optional[str] = None
+    key_responsibilities: List[str] = Field(default_factory=list)
+    company_culture: Optional[str] = None
+    salary_range: Optional[str] = None
+    benefits: List[str] = Field(default_factory=list)
+
+    coerce_lists = field_validator(
+        "required_skills", "preferred_skills", "key_responsibilities", "benefits", mode="before"
+    )(_text_list)
+    coerce_texts = field_validator(
+        "job_title", "required_experience", "company_culture", "salary_range", mode="before"
+    )(_text)
+
+
+class MatchScores(TaskOutputModel):
+    """
+    Match scores from 0 to 100. The short names used in the task prompt
+    (technical, experience, education, overall) are accepted as aliases.
+    overall_fit, which results are ranked by, is required.
+    """
+
+    technical_skills: Optional[float] = Field(None, validation_alias=AliasChoices("technical_skills", "technical"))
+    experience_relevance: Optional[float] = Field(None, validation_alias=AliasChoices("experience_relevance", "experience"))
+    education_requirements: Optional[float] = Field(None, validation_alias=AliasChoices("education_requirements", "education"))
+    overall_fit: float = Field(validation_alias=AliasChoices("overall_fit", "overall"))
+
+    @field_validator("technical_skills", "experience_relevance", "education_requirements", "overall_fit", mode="before")
+    @classmethod
+    def coerce_score(cls, value: Any) -> Optional[float]:
+        """
+        Accept numbers and strings such as "85", "85%" or "85/100", clamped to 0-100.
+        """
+        if isinstance(value, str):
+            match = SCORE_RE.search(value)
+            value = float(match.group()) if match else None
+        if value is None:
+            return None
+        return min(100.0, max(0.0, float(value)))
+
+
+class ResumeOptimization(TaskOutputModel):
+    """
+    Output of the resume optimization task; match_scores is required.
+    """
+
+    match_scores: MatchScores
+    skill_gaps: List[str] = Field(default_factory=list)
+    optimization_suggestions: List[str] = Field(default_factory=list)
+    action_items: List[str] = Field(default_factory=list)
+    ats_optimization: List[str] = Field(default_factory=list)
+
+    coerce_lists = field_validator(
+        "skill_gaps", "optimization_suggestions", "action_items", "ats_optimization", mode="before"
+    )(_text_list)
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """
+    Find the JSON object in a raw output: a fenced code block, or the
+    outermost braces when the object is surrounded by prose.
+    """
+    match = FENCE_RE.search(text)
+    if match:
+        text = match.group(1).strip()
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    return text[start:end + 1]
+
+
+def parse_output(raw_output: str, model: Type[ModelT]) -> Optional[ModelT]:
+    """
+    Validate a raw task output against an output model.
+
+    Plain JSON is validated in a single pass. Otherwise the JSON object is
+    cut out of code fences or surrounding prose and trailing commas are
+    dropped before validating again. Returns None when nothing validates.
+    """
+    text = (raw_output or "").strip()
+    if not text:
+        return None
+    try:
+        return model.model_validate_json(text)
+    except ValidationError:
+        pass
+
+    candidate = _extract_json(text)
+    if candidate is None:
+        return None
+    for attempt in (candidate, TRAILING_COMMA_RE.sub(r"\1", candidate)):
+        try:
+            return model.model_validate_json(attempt)
+        except ValidationError:
+            continue
+    return None
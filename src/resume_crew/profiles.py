@@ -0,0 +1,188 @@
+"""
+Job profiles: a job analysis compiled once per posting and reused for every candidate
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.resume_crew.cache import JobProfileCache
+from src.resume_crew.registry import Singleton
+from src.resume_crew.runner import run_job_analysis
+from src.resume_crew.scoring import PREFERRED_SKILL_WEIGHT, _as_list, education_level, required_years, tokenize
+from src.resume_crew.taxonomy import get_taxonomy
+from src.resume_crew.tools import JobAnalysisTools
+
+# Bump whenever profile compilation changes so older profiles are rebuilt
+PROFILE_VERSION = 2
+
+# "Google Cloud Platform (GCP)", "Cloud platforms (e.g. AWS, Azure)"
+PARENTHESIZED_RE = re.compile(r"^(.*?)\s*\(([^()]+)\)\s*$")
+EXAMPLE_PREFIX_RE = re.compile(r"^(?:e\.g\.?|i\.e\.?|such as|like|incl\.?|including)\s*", re.IGNORECASE)
+
+
+def split_skill(skill: str) -> List[str]:
+    """
+    Split a skill into its name followed by any alternative names given in
+    parentheses; examples ("e.g. AWS, Azure") count as alternatives.
+    """
+    skill = " ".join(skill.split())
+    match = PARENTHESIZED_RE.match(skill)
+    if not match or not match.group(1):
+        return [skill]
+    alternatives = EXAMPLE_PREFIX_RE.sub("", match.group(2))
+    return [match.group(1)] + [name.strip() for name in re.split(r",|\bor\b", alternatives) if name.strip()]
+
+
+class JobProfile(BaseModel):
+    """
+    Normalized, persisted form of one job analysis.
+
+    Skill names are mapped to their canonical taxonomy name when the skill
+    taxonomy knows them ("k8s" becomes "Kubernetes") and deduplicated
+    case-insensitively, and their alternative names are collected as
+    synonyms. Weights hold each skill's share of the technical score
+    (required 1.0, preferred PREFERRED_SKILL_WEIGHT).
+    The full validated job analysis is kept under analysis.
+    """
+
+    job_url: str
+    content_hash: str
+    version: int = PROFILE_VERSION
+    job_title: Optional[str] = None
+    required_skills: List[str] = Field(default_factory=list)
+    preferred_skills: List[str] = Field(default_factory=list)
+    synonyms: Dict[str, List[str]] = Field(default_factory=dict)
+    weights: Dict[str, float] = Field(default_factory=dict)
+    required_experience: Optional[str] = None
+    min_years: Optional[int] = None
+    education_level: int = 0
+    key_responsibilities: List[str] = Field(default_factory=list)
+    analysis: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_analysis(cls, analysis: Dict[str, Any], job_url: str, content_hash: str) -> "JobProfile":
+        """
+        Compile a parsed job analysis into a profile.
+        """
+        taxonomy = get_taxonomy()
+        seen = {}
+        synonyms: Dict[str, List[str]] = {}
+        weights: Dict[str, float] = {}
+        skill_lists = {"required": [], "preferred": []}
+        for kind, skills, weight in (
+            ("required", analysis.get("required_skills") or analysis.get("skills"), 1.0),
+            ("preferred", analysis.get("preferred_skills"), PREFERRED_SKILL_WEIGHT),
+        ):
+            for skill in _as_list(skills):
+                name, *alternatives = split_skill(skill)
+                if taxonomy is not None:
+                    name = taxonomy.canonical(name) or name
+                key = name.lower()
+                if key not in seen:
+                    seen[key] = name
+                    skill_lists[kind].append(name)
+                    weights[name] = weight
+                name = seen[key]
+                for alternative in alternatives:
+                    if alternative.lower() != key and alternative not in synonyms.setdefault(name, []):
+                        synonyms[name].append(alternative)
+
+        required_experience = " ".join(_as_list(analysis.get("required_experience") or analysis.get("experience")))
+        education_text = " ".join(
+            _as_list(analysis.get("education")) + _as_list(analysis.get("required_qualifications"))
+            + [required_experience]
+        )
+        return cls(
+            job_url=job_url,
+            content_hash=content_hash,
+            job_title=analysis.get("job_title"),
+            required_skills=skill_lists["required"],
+            preferred_skills=skill_lists["preferred"],
+            synonyms={name: names for name, names in synonyms.items() if names},
+            weights=weights,
+            required_experience=required_experience or None,
+            min_years=required_years(required_experience),
+            education_level=education_level(tokenize(education_text)),
+            key_responsibilities=_as_list(analysis.get("key_responsibilities") or analysis.get("responsibilities")),
+            analysis=analysis
+        )
+
+    def to_job_analysis(self) -> Dict[str, Any]:
+        """
+        Job analysis dict with the normalized skill lists, for local scorers.
+        """
+        return {
+            **self.analysis,
+            "required_skills": self.required_skills,
+            "preferred_skills": self.preferred_skills
+        }
+
+    def prompt_context(self) -> str:
+        """
+        Compact, deterministic JSON of the profile for the optimization task.
+        The same profile always renders the same text, so repeated prompts
+        for one posting stay cacheable.
+        """
+        context = {
+            "job_title": self.job_title,
+            "required_skills": self.required_skills,
+            "preferred_skills": self.preferred_skills,
+            "skill_synonyms": self.synonyms,
+            "required_experience": self.required_experience,
+            "min_years_experience": self.min_years,
+            "key_responsibilities": self.key_responsibilities,
+            "company_culture": self.analysis.get("company_culture")
+        }
+        return json.dumps({key: value for key, value in context.items() if value}, indent=2)
+
+
+# Job profile store, configured from the environment on first use (None disables it)
+_profile_cache = Singleton(JobProfileCache.from_env)
+configure_profile_cache = _profile_cache.configure
+get_profile_cache = _profile_cache.get
+
+
+def load_job_profile(job_url: str, company_name: str, job_text: Optional[str] = None,
+                     verbose: bool = False, agent=None) -> Dict[str, Any]:
+    """
+    Return the job analysis record for a posting, backed by its job profile.
+
+    The posting text (fetched through the job page cache when only a URL is
+    given) is hashed; a stored profile for the URL and hash answers without
+    running the job analysis task. Otherwise the task runs on the posting
+    text and its parsed output is compiled and stored. The record has the
+    keys of run_job_analysis plus "profile" (None when the output could not
+    be parsed).
+    """
+    if not job_text and job_url:
+        details = JobAnalysisTools.extract_job_details(job_url)
+        if details["status"] == "success":
+            job_text = details["content"]
+
+    cache = get_profile_cache()
+    content_hash = hashlib.sha256(job_text.encode("utf-8")).hexdigest() if job_text else None
+    cache_key = JobProfileCache.key_for(job_url or "", content_hash) if cache and content_hash else None
+
+    entry = cache.get(cache_key) if cache_key else None
+    if entry is not None and entry.get("version") == PROFILE_VERSION:
+        profile = JobProfile.model_validate(entry)
+        return {
+            "agent": "Job Requirements Analyst",
+            "raw": json.dumps(profile.analysis),
+            "parsed": profile.analysis,
+            "cached": True,
+            "profile": profile
+        }
+
+    record = run_job_analysis(job_url, company_name, verbose=verbose, job_text=job_text, agent=agent)
+    record["profile"] = None
+    if record["parsed"] is not None:
+        profile = JobProfile.from_analysis(record["parsed"], job_url or "", content_hash or "")
+        if cache_key:
+            cache.put(cache_key, profile.model_dump())
+        record["profile"] = profile
+    return record
@@ -0,0 +1,66 @@
+"""
+Process-wide objects (caches, stores, the tracer) configured from the environment on first use
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List
+
+
+class Singleton:
+    """
+    One process-wide object built by from_env on first use, unless
+    configure() set it first; configure(None) disables it.
+
+    Every instance is registered, so preserved() can snapshot all of them
+    and put them back, e.g. around a test.
+    """
+
+    instances: List["Singleton"] = []
+
+    def __init__(self, from_env: Callable[[], Any]):
+        self.from_env = from_env
+        self.value = None
+        self.configured = False
+        self._lock = threading.Lock()
+        Singleton.instances.append(self)
+
+    def configure(self, value: Any = None) -> None:
+        """
+        Set the object explicitly.
+        """
+        self.value = value
+        self.configured = True
+
+    def get(self) -> Any:
+        """
+        Get the object, building it from the environment on first use.
+        """
+        if not self.configured:
+            with self._lock:
+                if not self.configured:
+                    self.configure(self.from_env())
+        return self.value
+
+    def reset(self) -> None:
+        """
+        Forget the object; the next get() reads the environment again.
+        """
+        self.value = None
+        self.configured = False
+
+
+@contextmanager
+def preserved() -> Iterator[None]:
+    """
+    Restore every singleton to its current state on exit. Singletons first
+    created inside the block (their module was imported there) are reset.
+    """
+    states = [(singleton, singleton.value, singleton.configured) for singleton in Singleton.instances]
+    try:
+        yield
+    finally:
+        for singleton in Singleton.instances[len(states):]:
+            singleton.reset()
+        for singleton, value, configured in states:
+            singleton.value, singleton.configured = value, configured
@@ -0,0 +1,210 @@
+"""
+Report rendering: compiled Jinja templates over match result records
+"""
+
+import csv
+import hashlib
+import os
+import re
+from contextlib import nullcontext
+from datetime import datetime
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.resume_crew.models import JobAnalysis, ResumeOptimization
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+REPORT_FORMATS = ("md", "html")
+
+CSV_COLUMNS = (
+    "candidate", "candidate_name", "job_url", "company_name", "job_title", "scored_by", "status",
+    "overall_fit", "technical_skills", "experience_relevance", "education_requirements", "skill_gaps"
+)
+
+# Minimum score for each status label, best first
+STATUS_LABELS = ((80, "✅ Excellent"), (70, "✅ Strong"), (60, "⚠️ Good"))
+
+# File name words that are not part of the candidate's name
+RESUME_WORDS = frozenset({"resume", "cv", "curriculum", "vitae", "final", "updated", "latest"})
+
+
+def format_score(score: Any) -> str:
+    """
+    Format a 0-100 match score, or N/A when the model gave none.
+    """
+    if not isinstance(score, (int, float)):
+        return "N/A"
+    return f"{score:g}"
+
+
+def status_label(score: Any) -> str:
+    """
+    Status label for a 0-100 match score.
+    """
+    if not isinstance(score, (int, float)):
+        return "N/A"
+    return next((label for minimum, label in STATUS_LABELS if score >= minimum), "❌ Needs Improvement")
+
+
+def candidate_name(candidate: str) -> str:
+    """
+    Readable candidate name from a resume path: "knowledge/Jane_Doe_Resume.pdf" -> "Jane Doe".
+    """
+    stem = Path(candidate).stem
+    words = [word for word in re.split(r"[\s_.-]+", stem) if word and word.lower() not in RESUME_WORDS]
+    return " ".join(words) or stem or "Candidate"
+
+
+def _slug(text: str, digest_of: str) -> str:
+    """
+    File-system safe name: the text's words plus a short digest that keeps distinct sources apart.
+    """
+    words = re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-").lower()[:60]
+    digest = hashlib.sha1(digest_of.encode("utf-8")).hexdigest()[:8]
+    return f"{words}-{digest}" if words else digest
+
+
+class ReportView:
+    """
+    Template context for one results record (a ResultsStore row or a
+    match_row). Derived values are computed on first access, so a template
+    only pays for what it uses: a summary template never validates the job
+    analysis.
+    """
+
+    def __init__(self, record: Dict[str, Any], job_analysis: Optional[Dict[str, Any]] = None,
+                 date: Optional[str] = None):
+        self.record = record
+        self._job_analysis = job_analysis if job_analysis is not None else record.get("job_analysis")
+        self._date = date
+
+    def __getattr__(self, name: str) -> Any:
+        # Plain row columns (job_url, company_name, scored_by, status, ...)
+        try:
+            return self.__dict__["record"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @cached_property
+    def candidate_name(self) -> str:
+        return candidate_name(self.record.get("candidate") or "")
+
+    @cached_property
+    def optimization(self) -> ResumeOptimization:
+        return ResumeOptimization.model_validate(self.record.get("details") or {})
+
+    @cached_property
+    def scores(self):
+        return self.optimization.match_scores
+
+    @cached_property
+    def job(self) -> Optional[JobAnalysis]:
+        if not self._job_analysis:
+            return None
+        return JobAnalysis.model_validate(self._job_analysis)
+
+    @cached_property
+    def position(self) -> str:
+        title = self.record.get("job_title") or (self.job.job_title if self.job else None)
+        return title or "the target role"
+
+    @cached_property
+    def location(self) -> Optional[str]:
+        return (self._job_analysis or {}).get("location")
+
+    @cached_property
+    def date(self) -> str:
+        return self._date or datetime.now().strftime("%B %d, %Y")
+
+
+@lru_cache(maxsize=None)
+def _environment(template_dir: str):
+    # Imported here: only rendering needs jinja2
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    environment = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(["html", "html.j2"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True
+    )
+    environment.filters["score"] = format_score
+    environment.filters["status"] = status_label
+    return environment
+
+
+def get_template(fmt: str):
+    """
+    The compiled report template for a format, from REPORT_TEMPLATE_DIR
+    (default: the packaged templates). Templates are compiled once per
+    process and recompiled when their file changes.
+    """
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unknown report format {fmt!r}, expected one of {', '.join(REPORT_FORMATS)}")
+    template_dir = os.getenv("REPORT_TEMPLATE_DIR") or str(DEFAULT_TEMPLATE_DIR)
+    return _environment(template_dir).get_template(f"report.{fmt}.j2")
+
+
+def render_report(record: Dict[str, Any], fmt: str = "md", job_analysis: Optional[Dict[str, Any]] = None,
+                  date: Optional[str] = None) -> str:
+    """
+    Render one results record as a Markdown or HTML report.
+    """
+    return get_template(fmt).render(report=ReportView(record, job_analysis, date))
+
+
+def report_path(record: Dict[str, Any], output_dir: Path, fmt: str) -> Path:
+    """
+    Where a record's report goes: one directory per job, one file per candidate.
+    """
+    job_dir = _slug(record.get("job_title") or "", record["job_url"])
+    candidate = record.get("candidate") or ""
+    return Path(output_dir) / job_dir / f"{_slug(candidate_name(candidate), candidate)}.{fmt}"
+
+
+def export_reports(records: Iterable[Dict[str, Any]], output_dir: Path,
+                   formats: Tuple[str, ...] = REPORT_FORMATS, summary: bool = True,
+                   job_analyses: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Render reports for a stream of results records (e.g. ResultsStore.iter_results).
+
+    Each record is rendered in every format and written as soon as it is
+    rendered, and its summary line is appended to summary.csv, so memory
+    stays flat however many records there are. job_analyses maps job URLs
+    to job analyses for the job sections of the reports.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    templates = {fmt: get_template(fmt) for fmt in formats}
+    job_analyses = job_analyses or {}
+    date = datetime.now().strftime("%B %d, %Y")
+    stats = {"reports": 0, "files": 0, "summary": str(output_dir / "summary.csv") if summary else None}
+    job_dirs = set()
+
+    with open(output_dir / "summary.csv", "w", newline="", encoding="utf-8") if summary else nullcontext() as f:
+        writer = csv.writer(f) if summary else None
+        if writer:
+            writer.writerow(CSV_COLUMNS)
+        for record in records:
+            view = ReportView(record, job_analyses.get(record["job_url"]), date)
+            for fmt, template in templates.items():
+                path = report_path(record, output_dir, fmt)
+                if path.parent not in job_dirs:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    job_dirs.add(path.parent)
+                path.write_text(template.render(report=view), encoding="utf-8")
+                stats["files"] += 1
+            if writer:
+                writer.writerow([
+                    record.get("candidate"), view.candidate_name, record["job_url"], record.get("company_name"),
+                    record.get("job_title"), record.get("scored_by"), record.get("status"),
+                    record.get("overall_fit"), record.get("technical_skills"),
+                    record.get("experience_relevance"), record.get("education_requirements"),
+                    "; ".join(record.get("skill_gaps") or [])
+                ])
+            stats["reports"] += 1
+    return stats
+
@@ -0,0 +1,264 @@
+"""
+SQLite results store: one row per (job, resume) match, kept across runs
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.resume_crew.instrumentation import get_tracer
+from src.resume_crew.registry import Singleton
+
+DEFAULT_RESULTS_DB_PATH = "output/results.sqlite"
+
+# Rows written per transaction by bulk writers
+DEFAULT_WRITE_BATCH = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    result_id INTEGER PRIMARY KEY,
+    job_url TEXT NOT NULL,
+    candidate TEXT NOT NULL,
+    scored_by TEXT NOT NULL,
+    company_name TEXT,
+    job_title TEXT,
+    mode TEXT,
+    run_id TEXT,
+    status TEXT NOT NULL,
+    overall_fit REAL,
+    technical_skills REAL,
+    experience_relevance REAL,
+    education_requirements REAL,
+    skill_gaps TEXT NOT NULL,
+    suggestions TEXT NOT NULL,
+    details TEXT,
+    seconds REAL,
+    total_tokens INTEGER,
+    updated_at REAL NOT NULL,
+    UNIQUE (job_url, candidate, scored_by)
+);
+CREATE INDEX IF NOT EXISTS idx_results_job_fit ON results (job_url, scored_by, overall_fit DESC);
+CREATE INDEX IF NOT EXISTS idx_results_candidate ON results (candidate);
+CREATE INDEX IF NOT EXISTS idx_results_fit ON results (overall_fit DESC);
+"""
+
+COLUMNS = (
+    "job_url", "candidate", "scored_by", "company_name", "job_title", "mode", "run_id", "status",
+    "overall_fit", "technical_skills", "experience_relevance", "education_requirements",
+    "skill_gaps", "suggestions", "details", "seconds", "total_tokens", "updated_at"
+)
+
+# Columns holding JSON text
+JSON_COLUMNS = ("skill_gaps", "suggestions", "details")
+
+UPSERT = (
+    f"INSERT INTO results ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)}) "
+    f"ON CONFLICT (job_url, candidate, scored_by) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in COLUMNS[3:])
+)
+
+
+def _score(match_scores: Dict[str, Any], name: str) -> Optional[float]:
+    value = match_scores.get(name)
+    return value if isinstance(value, (int, float)) else None
+
+
+def match_row(job_url: str, candidate: str, output: Optional[Dict[str, Any]], scored_by: str = "llm",
+              status: Optional[str] = None, **fields: Any) -> Dict[str, Any]:
+    """
+    Build a results row from a match output: a parsed resume optimization
+    (scored_by "llm") or a MatchScorer result (scored_by "local"). Extra
+    fields (company_name, job_title, mode, run_id, seconds, total_tokens)
+    are stored as given.
+    """
+    output = output or {}
+    match_scores = output.get("match_scores") or {}
+    row = {column: None for column in COLUMNS}
+    row.update(
+        job_url=job_url,
+        candidate=candidate,
+        scored_by=scored_by,
+        status=status or ("success" if output else "unparsed"),
+        overall_fit=_score(match_scores, "overall_fit"),
+        technical_skills=_score(match_scores, "technical_skills"),
+        experience_relevance=_score(match_scores, "experience_relevance"),
+        education_requirements=_score(match_scores, "education_requirements"),
+        skill_gaps=output.get("skill_gaps") or [],
+        suggestions=output.get("optimization_suggestions") or [],
+        details=output or None,
+        updated_at=time.time()
+    )
+    row.update(fields)
+    return row
+
+
+def run_fields(mode: str, company_name: Optional[str] = None, job_analysis: Any = None) -> Dict[str, Any]:
+    """
+    Row fields shared by every match of one run: the mode, the tracer's
+    run id, the company and the job title of the analysis (a JobProfile or dict).
+    """
+    job_title = getattr(job_analysis, "job_title", None)
+    if job_title is None and isinstance(job_analysis, dict):
+        job_title = job_analysis.get("job_title")
+    return {"mode": mode, "run_id": get_tracer().run_id, "company_name": company_name, "job_title": job_title}
+
+
+class ResultsStore:
+    """
+    Match results persisted in SQLite.
+
+    Each (job URL, candidate, scorer) pair has one row, updated in place when
+    it is scored again, so results accumulate across runs instead of each
+    run overwriting the last. Indexes on job and fit, candidate, and fit
+    answer "top N for a job" and "every job for a candidate" without a scan.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or os.getenv("RESULTS_DB_PATH") or DEFAULT_RESULTS_DB_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by the worker threads of a run; writes are serialized by the lock
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> Optional["ResultsStore"]:
+        """
+        Open the store at RESULTS_DB_PATH; set it empty to disable the store.
+        """
+        db_path = os.getenv("RESULTS_DB_PATH", DEFAULT_RESULTS_DB_PATH)
+        return cls(db_path) if db_path else None
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def save_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Upsert rows (see match_row) in a single transaction. Returns the row count.
+        """
+        values = [
+            tuple(
+                json.dumps(row[column]) if column in JSON_COLUMNS and row[column] is not None else row[column]
+                for column in COLUMNS
+            )
+            for row in rows
+        ]
+        with self._lock, self.conn:
+            self.conn.executemany(UPSERT, values)
+        return len(values)
+
+    def save(self, row: Dict[str, Any]) -> None:
+        """
+        Upsert one row.
+        """
+        self.save_many([row])
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+        row = dict(row)
+        for column in JSON_COLUMNS:
+            if row[column] is not None:
+                row[column] = json.loads(row[column])
+        return row
+
+    def _rows(self, query: str, params: tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            fetched = self.conn.execute(query, params).fetchall()
+        return [self._decode(row) for row in fetched]
+
+    def top_for_job(self, job_url: str, limit: int = 50, scored_by: str = "llm") -> List[Dict[str, Any]]:
+        """
+        Best scored candidates for a job, highest overall fit first.
+        """
+        return self._rows(
+            "SELECT * FROM results WHERE job_url = ? AND scored_by = ? AND overall_fit IS NOT NULL "
+            "ORDER BY overall_fit DESC LIMIT ?",
+            (job_url, scored_by, limit)
+        )
+
+    def for_candidate(self, candidate: str) -> List[Dict[str, Any]]:
+        """
+        Every stored result for a candidate, highest overall fit first.
+        """
+        return self._rows(
+            "SELECT * FROM results WHERE candidate = ? ORDER BY overall_fit DESC",
+            (candidate,)
+        )
+
+    def iter_results(self, job_url: Optional[str] = None, scored_by: str = "llm",
+                     chunk_size: int = DEFAULT_WRITE_BATCH) -> Iterator[Dict[str, Any]]:
+        """
+        Stream stored results (optionally for one job), ordered by job and
+        best overall fit, fetching chunk_size rows at a time so exporting a
+        large pool never holds it all in memory.
+        """
+        where, params = "scored_by = ?", [scored_by]
+        if job_url is not None:
+            where, params = where + " AND job_url = ?", params + [job_url]
+        # A cursor of its own: the rows are read while other queries run
+        cursor = self.conn.cursor()
+        with self._lock:
+            cursor.execute(f"SELECT * FROM results WHERE {where} ORDER BY job_url, scored_by, overall_fit DESC", params)
+        try:
+            while True:
+                with self._lock:
+                    chunk = cursor.fetchmany(chunk_size)
+                if not chunk:
+                    return
+                for row in chunk:
+                    yield self._decode(row)
+        finally:
+            cursor.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+class ResultsWriter:
+    """
+    Buffers rows and writes them to a store in bulk transactions of
+    batch_size rows; flush() writes the remainder. A None store discards rows.
+    """
+
+    def __init__(self, store: Optional[ResultsStore], batch_size: int = DEFAULT_WRITE_BATCH):
+        self.store = store
+        self.batch_size = batch_size
+        self.pending: List[Dict[str, Any]] = []
+        self.written = 0
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a row, writing the batch once it is full.
+        """
+        if self.store is None:
+            return
+        self.pending.append(row)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the queued rows.
+        """
+        if self.store is not None and self.pending:
+            self.written += self.store.save_many(self.pending)
+            self.pending = []
+
+
+# Results store, opened from the environment on first use (None disables it)
+_results_store = Singleton(ResultsStore.from_env)
+configure_results_store = _results_store.configure
+get_results_store = _results_store.get
@@ -0,0 +1,235 @@
+"""
+Role matching: rank one resume against many job postings
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.resume_crew.batch import shortlist
+from src.resume_crew.profiles import JobProfile, load_job_profile
+from src.resume_crew.results import ResultsWriter, get_results_store, match_row, run_fields
+from src.resume_crew.runner import (
+    estimate_analysis_tokens, estimate_optimization_tokens, run_resume_optimization, task_counts
+)
+from src.resume_crew.scheduler import DEFAULT_TOKENS_PER_CALL, CrewScheduler
+from src.resume_crew.scoring import MatchScorer, ResumeFeatures
+from src.resume_crew.tools import ResumeAnalysisTools
+
+
+def _job_entry(entry: Any) -> Dict[str, Any]:
+    if isinstance(entry, str):
+        entry = {"job_url": entry}
+    job_url = entry.get("job_url") or entry.get("url")
+    if not job_url:
+        raise ValueError(f"Job entry without a URL: {entry!r}")
+    return {
+        "job_url": job_url,
+        # The host stands in for a missing company name ("careers.example.com")
+        "company_name": entry.get("company_name") or entry.get("company") or urlparse(job_url).netloc,
+        "job_text": entry.get("job_text")
+    }
+
+
+def collect_jobs(source: str) -> List[Dict[str, Any]]:
+    """
+    Collect job postings from a manifest file.
+
+    A JSON manifest is a list of URLs or of objects with job_url (or url),
+    an optional company_name (or company) and optional job_text; a text
+    manifest has one "<url> [company name]" per line. Postings listed more
+    than once are kept once.
+    """
+    source_path = Path(source)
+    if not source_path.is_file():
+        raise FileNotFoundError(f"Job manifest not found: {source}")
+
+    if source_path.suffix.lower() == '.json':
+        entries = json.loads(source_path.read_text(encoding='utf-8'))
+    else:
+        entries = []
+        for line in source_path.read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                job_url, _, company_name = line.partition(' ')
+                entries.append({"job_url": job_url, "company_name": company_name.strip()})
+
+    jobs = {}
+    for entry in entries:
+        job = _job_entry(entry)
+        jobs.setdefault(job["job_url"], job)
+    return list(jobs.values())
+
+
+def load_profiles(jobs: List[Dict[str, Any]], max_workers: int = 4) -> List[Dict[str, Any]]:
+    """
+    Load or compute the job profile of every posting concurrently.
+
+    Stored profiles answer without an LLM call; the remaining postings run
+    the job analysis on a CrewScheduler capped at max_workers. Returns the
+    load_job_profile records in job order, with "error" set when a posting
+    could not be fetched or analyzed.
+    """
+    def load(job: Dict[str, Any]) -> Dict[str, Any]:
+        return load_job_profile(job["job_url"], job["company_name"], job_text=job["job_text"])
+
+    done = []
+
+    def on_result(job, record, error):
+        done.append(job)
+        status = "error" if error is not None else ("cached" if record["cached"] else "analyzed")
+        print(f"   [{len(done)}/{len(jobs)}] {job['job_url']}: {status}")
+
+    scheduler = CrewScheduler.from_env(max_concurrency=max_workers)
+    print(f"🔎 Loading {len(jobs)} job profiles with up to {scheduler.max_concurrency} concurrent analyses...")
+    results = scheduler.run(
+        load, jobs, on_result=on_result,
+        estimate_tokens=lambda job: estimate_analysis_tokens(job["job_text"]) or DEFAULT_TOKENS_PER_CALL
+    )
+    return [
+        {"error": str(result), "cached": False, "profile": None} if isinstance(result, Exception) else result
+        for result in results
+    ]
+
+
+def score_roles(resume_text: str, jobs: List[Dict[str, Any]],
+                records: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Optional[JobProfile]]]:
+    """
+    Score the resume locally against every job profile, best overall fit first.
+
+    The resume is tokenized once and its features shared by every job's
+    scorer. Returns (role record, profile) pairs; postings without a
+    profile are kept at the end with status "error" or "unparsed".
+    """
+    features = ResumeFeatures(resume_text)
+    scored, failed = [], []
+    for job, record in zip(jobs, records):
+        profile = record["profile"]
+        role = {"job_url": job["job_url"], "company_name": job["company_name"]}
+        if profile is None:
+            role.update(error=record.get("error", "Could not parse the job analysis output"),
+                        status="error" if "error" in record else "unparsed")
+            failed.append((role, None))
+            continue
+        result = MatchScorer.from_profile(profile, reference_year=features.reference_year).score_features(features)
+        role.update(
+            job_title=profile.job_title,
+            match_scores=result["match_scores"],
+            matched_skills=result["matched_skills"],
+            skill_gaps=result["skill_gaps"],
+            status="success"
+        )
+        scored.append((role, profile))
+    scored.sort(key=lambda pair: pair[0]["match_scores"]["overall_fit"], reverse=True)
+    return scored + failed
+
+
+def run_role_matching(resume_path: str, jobs: List[Dict[str, Any]], output_dir: Path,
+                      top_k: Optional[int] = 3, min_score: float = 0,
+                      max_workers: int = 4) -> Dict[str, Any]:
+    """
+    Rank one resume against many job postings.
+
+    The resume is parsed once. Every posting's job profile is loaded (or
+    computed) concurrently and the resume is scored locally against each;
+    only the top_k roles with a local overall fit of at least min_score get
+    the resume optimization LLM task. The ranking lists reviewed roles
+    first, by LLM overall fit, then the rest by local fit, each with its
+    skill gaps. The summary is written to role_ranking.json and every
+    local and LLM score to the results store.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    resume = ResumeAnalysisTools.analyze_resume(resume_path)
+    if resume["status"] != "success":
+        print(f"❌ Could not read the resume: {resume['error']}")
+        return {}
+
+    counts_before = task_counts()
+    records = load_profiles(jobs, max_workers=max_workers)
+    print(f"⚡ Scoring the resume locally against {len(jobs)} roles...")
+    roles = score_roles(resume["content"], jobs, records)
+
+    writer = ResultsWriter(get_results_store())
+    fields = run_fields("roles")
+
+    def role_fields(role: Dict[str, Any]) -> Dict[str, Any]:
+        return {**fields, "company_name": role["company_name"], "job_title": role.get("job_title")}
+
+    for role, _ in roles:
+        writer.add(match_row(role["job_url"], resume_path, role if role["status"] == "success" else None,
+                             scored_by="local", status=role["status"], **role_fields(role)))
+    writer.flush()
+
+    selected = shortlist([role for role, _ in roles], top_k, min_score)
+    profiles = {role["job_url"]: profile for role, profile in roles}
+    print(f"🎯 {len(selected)} of {len(jobs)} roles shortlisted for LLM review")
+
+    def review(role: Dict[str, Any]) -> Dict[str, Any]:
+        return run_resume_optimization(role["job_url"], role["company_name"], resume_path,
+                                       profiles[role["job_url"]], resume=resume)
+
+    reviews = {}
+
+    def on_result(role, record, error):
+        if error is not None:
+            reviews[role["job_url"]] = {"error": str(error), "status": "error"}
+        else:
+            parsed = record["parsed"]
+            reviews[role["job_url"]] = {
+                "overall_fit": ((parsed or {}).get("match_scores") or {}).get("overall_fit"),
+                "skill_gaps": (parsed or {}).get("skill_gaps", []),
+                "resume_optimization": parsed,
+                "status": "success" if parsed is not None else "unparsed"
+            }
+        writer.add(match_row(
+            role["job_url"], resume_path, (record or {}).get("parsed"), status=reviews[role["job_url"]]["status"],
+            seconds=(record or {}).get("seconds"), total_tokens=(record or {}).get("total_tokens"), **role_fields(role)
+        ))
+        print(f"   [{len(reviews)}/{len(selected)}] {role['job_url']}: {reviews[role['job_url']]['status']}")
+
+    CrewScheduler.from_env(max_concurrency=max_workers).run(
+        review, selected, on_result=on_result,
+        estimate_tokens=lambda role: estimate_optimization_tokens(profiles[role["job_url"]], resume["content"])
+    )
+    writer.flush()
+
+    def rank_key(role: Dict[str, Any]) -> Tuple[int, float, float]:
+        llm_fit = (reviews.get(role["job_url"]) or {}).get("overall_fit")
+        local_fit = role["match_scores"]["overall_fit"] if role["status"] == "success" else -1
+        reviewed = isinstance(llm_fit, (int, float))
+        return (1 if reviewed else 0, llm_fit if reviewed else -1, local_fit)
+
+    ranking = sorted((role for role, _ in roles), key=rank_key, reverse=True)
+    counts = task_counts()
+    profiles_reused = sum(1 for record in records if record["cached"])
+    summary = {
+        "resume_path": resume_path,
+        "top_k": top_k,
+        "min_score": min_score,
+        "roles_total": len(jobs),
+        "profiles_reused": profiles_reused,
+        "shortlisted": len(selected),
+        # Crews the runner actually kicked off; avoided are the tasks answered by a
+        # stored profile or the task cache, and the reviews skipped by the shortlist
+        "llm_calls_made": counts["kickoffs"] - counts_before["kickoffs"],
+        "llm_calls_avoided": (
+            profiles_reused + counts["cache_hits"] - counts_before["cache_hits"]
+            + sum(1 for role, _ in roles if role["status"] == "success") - len(selected)
+        ),
+        "ranking": [
+            {
+                "rank": rank,
+                **role,
+                "local_overall_fit": role["match_scores"]["overall_fit"] if role["status"] == "success" else None,
+                "llm_review": reviews.get(role["job_url"])
+            }
+            for rank, role in enumerate(ranking, start=1)
+        ]
+    }
+    with open(output_dir / "role_ranking.json", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    return summary
@@ -0,0 +1,241 @@
+"""
+Crew execution helpers shared by the single-run and batch entry points
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+from src.resume_crew.cache import TaskOutputCache
+from src.resume_crew.instrumentation import span
+from src.resume_crew.registry import Singleton
+from src.resume_crew.scheduler import RESERVED_TOKENS_PER_CALL
+
+# crewai and the agent/task modules that build on it are imported when a
+# task first runs, so importing this module (and main.py) stays cheap.
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from src.resume_crew.agents import JobAnalyzer, ResumeAnalyzer
+
+
+# LLM task output cache, configured from the environment on first use (None disables caching)
+_task_cache = Singleton(TaskOutputCache.from_env)
+configure_task_cache = _task_cache.configure
+get_task_cache = _task_cache.get
+
+# Task runs in this process: crews kicked off (LLM calls) and answers served from the task cache
+_task_counts = Counter()
+_task_counts_lock = threading.Lock()
+
+
+def task_counts() -> Dict[str, int]:
+    """
+    Crew kickoffs ("kickoffs") and task cache hits ("cache_hits") so far in
+    this process. Callers diff two snapshots to count the LLM calls of a run.
+    """
+    with _task_counts_lock:
+        return {"kickoffs": _task_counts["kickoffs"], "cache_hits": _task_counts["cache_hits"]}
+
+
+def _count_task(kind: str) -> None:
+    with _task_counts_lock:
+        _task_counts[kind] += 1
+
+
+def model_name(agent) -> str:
+    """
+    Name of the model an agent runs on.
+    """
+    llm = getattr(agent, "llm", None)
+    return getattr(llm, "model", None) or os.getenv("OPENAI_MODEL", "")
+
+
+def estimate_analysis_tokens(job_text: Optional[str]) -> Optional[int]:
+    """
+    Estimated tokens of a job analysis call on the posting text, None when
+    the text is not known before the call (only a URL was given).
+    """
+    from src.resume_crew.compaction import estimate_tokens
+
+    return estimate_tokens(job_text) + RESERVED_TOKENS_PER_CALL if job_text else None
+
+
+def estimate_optimization_tokens(job_analysis: Any, resume_text: Optional[str] = None) -> int:
+    """
+    Estimated tokens of a resume optimization call: the job analysis as the
+    task embeds it plus the compacted resume, which is at most the resume
+    token budget (the whole budget when the text is not read yet).
+    """
+    from src.resume_crew.compaction import estimate_tokens, resume_token_budget
+    from src.resume_crew.profiles import JobProfile
+
+    if isinstance(job_analysis, JobProfile):
+        job_text = job_analysis.prompt_context()
+    elif job_analysis is not None and not isinstance(job_analysis, str):
+        job_text = json.dumps(job_analysis, indent=2)
+    else:
+        job_text = job_analysis or ""
+    budget = resume_token_budget()
+    resume_tokens = min(estimate_tokens(resume_text), budget) if resume_text else budget
+    return estimate_tokens(job_text) + resume_tokens + RESERVED_TOKENS_PER_CALL
+
+
+def kickoff_task(agent, task, verbose: bool = False,
+                 output_model: Optional[Type["BaseModel"]] = None) -> Dict[str, Any]:
+    """
+    Run a single task in its own crew and return its output record.
+    Outputs are memoized in the task output cache, so an identical task on
+    the same agent and model is answered without an LLM call.
+    
+    With an output_model, the raw output is validated locally (see
+    models.parse_output) and stored under "parsed" as a plain dict (only
+    the fields the model returned), cached with the raw text so cache hits
+    are never parsed again. Tasks do not set crewai's output_pydantic,
+    which would make a hidden extra LLM call to convert output that is not
+    valid JSON. Output that fails to parse is returned but not cached, so
+    the next run asks the LLM again instead of replaying the failure.
+    
+    Each run is traced as a "task:<agent role>" span with the prompt size
+    and the token usage reported by the crew; the record keeps the wall
+    time ("seconds") and total tokens (0 for cache hits).
+    """
+    start = time.perf_counter()
+    with span(f"task:{agent.role}", bytes=len(task.description.encode("utf-8"))) as stage:
+        cache = get_task_cache()
+        cache_key = None
+        if cache:
+            cache_key = TaskOutputCache.key_for(
+                task.description, task.expected_output,
+                agent.role, agent.goal, agent.backstory, model_name(agent)
+            )
+            cached = cache.lookup(cache_key)
+            if cached is not None:
+                stage["cached"] = True
+                _count_task("cache_hits")
+                parsed = cached.get("parsed")
+                if parsed is None and output_model:
+                    parsed = _validated(cached["raw"], output_model)
+                return {
+                    "agent": agent.role,
+                    "raw": cached["raw"],
+                    "parsed": parsed,
+                    "cached": True,
+                    "seconds": round(time.perf_counter() - start, 3),
+                    "total_tokens": 0
+                }
+        
+        from crewai import Crew, Process
+        
+        crew = Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=verbose
+        )
+        _count_task("kickoffs")
+        result = crew.kickoff()
+        task_output = result.tasks_output[0] if result.tasks_output else None
+        raw_output = task_output.raw if task_output else result.raw
+        parsed = None
+        if output_model:
+            parsed = _validated(raw_output, output_model)
+        
+        usage = getattr(result, "token_usage", None)
+        stage.update(
+            cached=False,
+            prompt_tokens=getattr(usage, "prompt_tokens", None),
+            completion_tokens=getattr(usage, "completion_tokens", None),
+            total_tokens=getattr(usage, "total_tokens", None),
+            parsed=parsed is not None
+        )
+        
+        if cache and raw_output and (parsed is not None or not output_model):
+            cache.store(cache_key, {"raw": raw_output, "parsed": parsed})
+        
+        return {
+            "agent": agent.role,
+            "raw": raw_output,
+            "parsed": parsed,
+            "cached": False,
+            "seconds": round(time.perf_counter() - start, 3),
+            "total_tokens": stage["total_tokens"] or 0
+        }
+
+
+def _validated(raw_output: str, output_model: Type["BaseModel"]) -> Optional[Dict[str, Any]]:
+    """
+    Validate the raw output through the repair path, None when it does not validate.
+    """
+    from src.resume_crew.models import parse_output
+    
+    output = parse_output(raw_output, output_model)
+    return output.model_dump(exclude_unset=True) if output is not None else None
+
+
+def run_job_analysis(job_url: str, company_name: str, verbose: bool = False,
+                     job_text: Optional[str] = None, agent: Optional["JobAnalyzer"] = None) -> Dict[str, Any]:
+    """
+    Run the job analysis task once and return its output record
+    with the parsed analysis under "parsed".
+    An already constructed agent can be passed to skip agent setup.
+    """
+    from src.resume_crew.agents import JobAnalyzer
+    from src.resume_crew.models import JobAnalysis
+    from src.resume_crew.tasks import create_job_analysis_task
+    
+    job_analyzer = agent or JobAnalyzer()
+    task = create_job_analysis_task(job_analyzer, job_url, company_name, job_text=job_text)
+    return kickoff_task(job_analyzer, task, verbose=verbose, output_model=JobAnalysis)
+
+
+def run_resume_optimization(job_url: str, company_name: str, resume_path: str,
+                            job_analysis: Any, verbose: bool = False,
+                            agent: Optional["ResumeAnalyzer"] = None,
+                            resume: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run the resume optimization task for one resume against an
+    already computed job analysis (a JobProfile, a parsed dict, or raw text
+    when the analysis could not be parsed).
+    A passed agent must not be in use by another concurrent run.
+
+    The resume text is compacted to the RESUME_TOKEN_BUDGET, ranking its
+    sections against the job, and embedded in the task; the record gets
+    a "compaction" entry with the token counts (None when the resume could
+    not be read and the task only sees its path). An already parsed resume
+    (the analyze_resume record) can be passed as resume.
+    """
+    from src.resume_crew.agents import ResumeAnalyzer
+    from src.resume_crew.compaction import compact_resume
+    from src.resume_crew.models import ResumeOptimization
+    from src.resume_crew.tasks import create_resume_optimization_task
+    from src.resume_crew.tools import ResumeAnalysisTools
+    
+    if resume is None:
+        resume = ResumeAnalysisTools.analyze_resume(resume_path)
+    compaction = compact_resume(resume["content"], job_analysis) if resume["status"] == "success" else None
+    
+    # A fresh agent per resume keeps concurrent runs independent
+    resume_analyzer = agent or ResumeAnalyzer()
+    task = create_resume_optimization_task(
+        resume_analyzer, job_url, company_name, resume_path, job_analysis=job_analysis,
+        resume_text=compaction["content"] if compaction else None
+    )
+    record = kickoff_task(resume_analyzer, task, verbose=verbose, output_model=ResumeOptimization)
+    record["compaction"] = {key: value for key, value in compaction.items() if key != "content"} if compaction else None
+    if verbose and compaction:
+        print(f"📉 Resume compacted: {compaction['original_tokens']} → {compaction['compacted_tokens']} tokens "
+              f"({compaction['tokens_saved']} saved)")
+    return record
+
+
+def cache_summary() -> str:
+    """
+    One-line hit/miss summary of the task output cache for run reports.
+    """
+    cache = get_task_cache()
+    if cache is None:
+        return "LLM cache disabled"
+    return f"LLM cache: {cache.hits} hits, {cache.misses} misses"
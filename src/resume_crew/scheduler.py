@@ -0,0 +1,228 @@
+"""
+Asyncio scheduler for running many independent crews under provider rate limits
+"""
+
+import asyncio
+import inspect
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_TOKENS_PER_CALL = 3000
+
+# Task instructions and the expected answer, on top of the texts embedded in a prompt
+RESERVED_TOKENS_PER_CALL = 1000
+
+
+def reported_tokens(result: Any) -> Optional[float]:
+    """
+    Tokens a finished job actually used: 0 for cached records, the record's
+    total_tokens, or the token_usage (usage metrics) of a crew output.
+    None when the result does not say.
+    """
+    if isinstance(result, dict):
+        if result.get("cached"):
+            return 0
+        return result.get("total_tokens")
+    return getattr(getattr(result, "token_usage", None), "total_tokens", None)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Check whether an exception is a provider rate limit (HTTP 429) error.
+    Works for openai/litellm errors (status_code) and requests HTTPError (response).
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "ratelimit" in message or "too many requests" in message
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Read the Retry-After header of a rate limit error, if present.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after") or headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at rate_per_minute, holding at most capacity tokens.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        Wait until amount tokens are available and take them.
+        Requests larger than the capacity are clamped so they can still proceed.
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+    def adjust(self, amount: float) -> None:
+        """
+        Take amount more tokens (or return them when negative) once a call's
+        real usage is known. The balance can go negative, which delays the
+        next acquisitions until the refill pays it back.
+        """
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class CrewScheduler:
+    """
+    Runs many independent jobs (typically crew kickoffs) concurrently.
+
+    Concurrency is capped by a semaphore; optional token buckets enforce
+    requests-per-minute and tokens-per-minute limits; jobs that fail with a
+    rate limit error are retried with exponential backoff and jitter,
+    honouring Retry-After when the provider sends it. Synchronous jobs run
+    in worker threads, coroutine functions are awaited directly.
+
+    The token bucket is charged each job's estimated tokens up front and
+    reconciled with the tokens the job reports using once it finishes.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"completed": 0, "failed": 0, "retries": 0, "rate_limited": 0,
+                      "estimated_tokens": 0, "reported_tokens": 0}
+
+    @classmethod
+    def from_env(cls, max_concurrency: Optional[int] = None) -> "CrewScheduler":
+        """
+        Build a scheduler from LLM_MAX_CONCURRENCY, LLM_REQUESTS_PER_MINUTE,
+        LLM_TOKENS_PER_MINUTE and LLM_MAX_RETRIES. An explicit max_concurrency wins.
+        """
+        def env_float(name):
+            value = os.getenv(name)
+            return float(value) if value else None
+
+        return cls(
+            max_concurrency=max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+            requests_per_minute=env_float("LLM_REQUESTS_PER_MINUTE"),
+            tokens_per_minute=env_float("LLM_TOKENS_PER_MINUTE"),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        )
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _call(self, fn: Callable, item: Any, estimated_tokens: float,
+                    semaphore: asyncio.Semaphore, executor: ThreadPoolExecutor,
+                    request_bucket: Optional[TokenBucket],
+                    token_bucket: Optional[TokenBucket],
+                    actual_tokens: Optional[Callable[[Any], Optional[float]]]) -> Any:
+        async with semaphore:
+            attempt = 0
+            while True:
+                if request_bucket:
+                    await request_bucket.acquire(1)
+                if token_bucket:
+                    await token_bucket.acquire(estimated_tokens)
+                try:
+                    if inspect.iscoroutinefunction(fn):
+                        result = await fn(item)
+                    else:
+                        result = await asyncio.get_running_loop().run_in_executor(executor, fn, item)
+                except Exception as e:
+                    if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                        raise
+                    self.stats["rate_limited"] += 1
+                    self.stats["retries"] += 1
+                    await asyncio.sleep(self._backoff(attempt, e))
+                    attempt += 1
+                    continue
+
+                used = actual_tokens(result) if actual_tokens else None
+                if used is not None:
+                    self.stats["reported_tokens"] += used
+                    if token_bucket:
+                        token_bucket.adjust(used - min(estimated_tokens, token_bucket.capacity))
+                return result
+
+    async def run_async(self, fn: Callable, items: Iterable[Any],
+                        on_result: Optional[Callable[[Any, Any, Optional[BaseException]], None]] = None,
+                        estimate_tokens: Optional[Callable[[Any], float]] = None,
+                        actual_tokens: Optional[Callable[[Any], Optional[float]]] = reported_tokens) -> List[Any]:
+        """
+        Run fn over items and return results (or exceptions) in input order.
+        on_result(item, result, error) is called as each job finishes.
+
+        estimate_tokens(item) is charged to the token bucket before a job
+        runs (DEFAULT_TOKENS_PER_CALL without it); actual_tokens(result)
+        then refunds or charges the difference to what the job used.
+        """
+        items = list(items)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        request_bucket = TokenBucket(self.requests_per_minute) if self.requests_per_minute else None
+        token_bucket = TokenBucket(self.tokens_per_minute) if self.tokens_per_minute else None
+        results: List[Any] = [None] * len(items)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+        async def run_one(index: int, item: Any) -> None:
+            tokens = estimate_tokens(item) if estimate_tokens else DEFAULT_TOKENS_PER_CALL
+            self.stats["estimated_tokens"] += tokens
+            try:
+                result = await self._call(fn, item, tokens, semaphore, executor,
+                                          request_bucket, token_bucket, actual_tokens)
+                error = None
+                self.stats["completed"] += 1
+            except Exception as e:
+                result, error = e, e
+                self.stats["failed"] += 1
+            results[index] = result
+            if on_result:
+                on_result(item, None if error else result, error)
+
+        try:
+            await asyncio.gather(*(run_one(index, item) for index, item in enumerate(items)))
+        finally:
+            executor.shutdown(wait=False)
+        return results
+
+    def run(self, fn: Callable, items: Iterable[Any], **kwargs) -> List[Any]:
+        """
+        Synchronous wrapper around run_async.
+        """
+        return asyncio.run(self.run_async(fn, items, **kwargs))
@@ -0,0 +1,324 @@
+"""
+Deterministic local match scoring between resumes and job analyses
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years?|yrs?)\b")
+YEAR_RANGE_RE = re.compile(
+    r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|date)\b"
+)
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or our
+the their to with within will you your we this that across including using
+experience strong ability knowledge skills skill proven excellent good
+""".split())
+
+# Degree keywords by level: diploma < bachelor < master < doctorate
+EDUCATION_LEVELS = {
+    "diploma": 1, "associate": 1,
+    "bachelor": 2, "bachelors": 2, "b.s": 2, "bs": 2, "bsc": 2, "b.sc": 2,
+    "b.tech": 2, "btech": 2, "b.e": 2, "ba": 2, "b.a": 2, "undergraduate": 2,
+    "master": 3, "masters": 3, "m.s": 3, "msc": 3, "m.sc": 3,
+    "m.tech": 3, "mtech": 3, "mba": 3, "pgdm": 3, "postgraduate": 3,
+    "phd": 4, "ph.d": 4, "doctorate": 4, "doctoral": 4,
+}
+
+# Weights of the component scores in overall_fit
+OVERALL_WEIGHTS = {
+    "technical_skills": 0.5,
+    "experience_relevance": 0.3,
+    "education_requirements": 0.2,
+}
+
+PREFERRED_SKILL_WEIGHT = 0.5
+
+# Skills with more content tokens than this are scored by token coverage
+# rather than by exact phrase match
+MAX_PHRASE_TOKENS = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase and split text into tokens, keeping tech names like c++, c# and node.js.
+    """
+    return TOKEN_RE.findall(text.lower())
+
+
+def content_tokens(text: str) -> Tuple[str, ...]:
+    """
+    Tokenize text and drop stopwords.
+    """
+    return tuple(token for token in tokenize(text) if token not in STOPWORDS)
+
+
+def education_level(tokens) -> int:
+    """
+    Highest education level mentioned in a token sequence (0 when none).
+    """
+    return max((EDUCATION_LEVELS[token] for token in EDUCATION_LEVELS.keys() & set(tokens)), default=0)
+
+
+def required_years(text: str) -> Optional[int]:
+    """
+    Minimum years of experience stated in a requirement, if any.
+    """
+    match = YEARS_RE.search(text.lower())
+    return int(match.group(1)) if match else None
+
+
+def resume_years(text: str, reference_year: int) -> float:
+    """
+    Estimate years of experience from explicit mentions and date ranges.
+    Overlapping date ranges are merged so parallel roles are not double counted.
+    """
+    lowered = text.lower()
+    stated = max((int(years) for years in YEARS_RE.findall(lowered)), default=0)
+
+    ranges = []
+    for start, end in YEAR_RANGE_RE.findall(lowered):
+        end_year = reference_year if not end.isdigit() else int(end)
+        if int(start) <= end_year <= reference_year:
+            ranges.append((int(start), end_year))
+
+    covered = 0
+    current_start, current_end = None, None
+    for start, end in sorted(ranges):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                covered += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        covered += current_end - current_start
+
+    return max(stated, covered)
+
+
+def _as_list(value) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [str(item) for item in value]
+
+
+class ResumeFeatures:
+    """
+    The job-independent side of scoring one resume: its tokens, years of
+    experience and education level. Computed once, it is shared by the
+    scorers of many jobs (MatchScorer.score_features).
+    """
+
+    def __init__(self, resume_text: str, reference_year: Optional[int] = None):
+        self.reference_year = reference_year or datetime.now().year
+        self.tokens = tokenize(resume_text)
+        self.token_set = set(self.tokens)
+        self.years = resume_years(resume_text, self.reference_year)
+        self.education_level = education_level(self.token_set)
+        self._skills = None
+
+    def canonical_skills(self, taxonomy) -> set:
+        """
+        Canonical taxonomy skills found in the resume, extracted on first use.
+        """
+        if self._skills is None or self._skills[0] is not taxonomy:
+            self._skills = (taxonomy, taxonomy.extract_tokens(self.tokens))
+        return self._skills[1]
+
+
+class MatchScorer:
+    """
+    Scores resumes against one job analysis without calling an LLM.
+
+    The job side is compiled once in the constructor, so scoring a pool of
+    resumes against the same job only tokenizes each resume and does set
+    lookups. A skill is credited when it or any of its synonyms matches, or
+    when the skill taxonomy finds its canonical skill under any alias
+    ("k8s" for Kubernetes); matched skills and gaps use canonical names.
+
+    Scores follow the match_scores fields of the resume optimization task:
+    technical_skills, experience_relevance, education_requirements and
+    overall_fit, each 0-100.
+    """
+
+    def __init__(self, job_analysis: Dict[str, Any], reference_year: Optional[int] = None,
+                 synonyms: Optional[Dict[str, List[str]]] = None,
+                 weights: Optional[Dict[str, float]] = None, taxonomy=None):
+        # Imported here: the taxonomy module tokenizes with this module
+        from src.resume_crew.taxonomy import get_taxonomy
+
+        self.reference_year = reference_year or datetime.now().year
+        self.weights = weights or {}
+        self.taxonomy = taxonomy if taxonomy is not None else get_taxonomy()
+
+        seen = set()
+        self.required_skills = self._compile_skills(
+            job_analysis.get("required_skills") or job_analysis.get("skills"), synonyms, seen
+        )
+        self.preferred_skills = self._compile_skills(job_analysis.get("preferred_skills"), synonyms, seen)
+        self.uses_taxonomy = any(
+            canonicals for _, _, canonicals in self.required_skills + self.preferred_skills
+        )
+        variants = [tokens for _, skill_variants, _ in self.required_skills + self.preferred_skills
+                    for tokens in skill_variants]
+        self.max_ngram = max(
+            (len(tokens) for tokens in variants if len(tokens) <= MAX_PHRASE_TOKENS),
+            default=1
+        )
+        self.phrase_starts = frozenset(
+            tokens[0] for tokens in variants if 1 < len(tokens) <= MAX_PHRASE_TOKENS
+        )
+
+        responsibilities = _as_list(
+            job_analysis.get("key_responsibilities") or job_analysis.get("responsibilities")
+        )
+        self.responsibility_terms = frozenset(
+            token for item in responsibilities for token in content_tokens(item)
+        )
+
+        experience_text = " ".join(_as_list(
+            job_analysis.get("required_experience") or job_analysis.get("experience")
+        ))
+        self.min_years = required_years(experience_text)
+
+        education_text = " ".join(
+            _as_list(job_analysis.get("education"))
+            + _as_list(job_analysis.get("required_qualifications"))
+            + [experience_text]
+        )
+        self.education_level = education_level(tokenize(education_text))
+
+    @classmethod
+    def from_profile(cls, profile, reference_year: Optional[int] = None, taxonomy=None) -> "MatchScorer":
+        """
+        Build a scorer from a stored JobProfile: its normalized skills, synonyms and weights.
+        """
+        return cls(profile.to_job_analysis(), reference_year=reference_year,
+                   synonyms=profile.synonyms, weights=profile.weights, taxonomy=taxonomy)
+
+    def _compile_skills(self, skills, synonyms: Optional[Dict[str, List[str]]], seen: set
+                        ) -> List[Tuple[str, Tuple[Tuple[str, ...], ...], Tuple[str, ...]]]:
+        """
+        Compile skills to (label, token variants, canonical skills): the
+        skill's own tokens followed by the tokens of each of its synonyms,
+        and the taxonomy skills any of those names resolve to. Skills that
+        resolve to an already compiled canonical skill are dropped.
+        """
+        synonyms = synonyms or {}
+        compiled = []
+        for skill in _as_list(skills):
+            names = [skill] + synonyms.get(skill, [])
+            variants = tuple(tokens for tokens in (content_tokens(name) for name in names) if tokens)
+            canonicals = ()
+            if self.taxonomy is not None:
+                canonicals = tuple(dict.fromkeys(
+                    canonical for canonical in map(self.taxonomy.canonical, names) if canonical
+                ))
+            key = canonicals[0] if canonicals else skill.lower()
+            if variants and key not in seen:
+                seen.add(key)
+                compiled.append((skill, variants, canonicals))
+        return compiled
+
+    def _ngrams(self, tokens: List[str]) -> set:
+        """
+        Multi-token n-grams of the resume, only at positions where a skill phrase can start.
+        """
+        starts = self.phrase_starts
+        grams = set()
+        if not starts:
+            return grams
+        lengths = range(2, self.max_ngram + 1)
+        for i, token in enumerate(tokens):
+            if token in starts:
+                for n in lengths:
+                    grams.add(tuple(tokens[i:i + n]))
+        return grams
+
+    @staticmethod
+    def _skill_credit(tokens: Tuple[str, ...], token_set: set, ngrams: set) -> float:
+        """
+        Credit in [0, 1] for one skill: 1 for an exact phrase match, partial
+        credit for token coverage.
+        """
+        if len(tokens) == 1:
+            return 1.0 if tokens[0] in token_set else 0.0
+        coverage = sum(1 for token in tokens if token in token_set) / len(tokens)
+        if len(tokens) > MAX_PHRASE_TOKENS:
+            return coverage
+        if tokens in ngrams:
+            return 1.0
+        return 0.6 * coverage if coverage >= 0.5 else 0.0
+
+    def score(self, resume_text: str) -> Dict[str, Any]:
+        """
+        Score one resume, returning match_scores plus matched and missing skills.
+        """
+        return self.score_features(ResumeFeatures(resume_text, self.reference_year))
+
+    def score_features(self, features: ResumeFeatures) -> Dict[str, Any]:
+        """
+        Score an already prepared resume; see score. Preparing once and
+        scoring against many jobs skips re-tokenizing the resume per job.
+        """
+        tokens = features.tokens
+        token_set = features.token_set
+        ngrams = self._ngrams(tokens)
+        resume_skills = features.canonical_skills(self.taxonomy) if self.uses_taxonomy else set()
+
+        matched, missing = [], []
+        earned, possible = 0.0, 0.0
+        for skills, default_weight in ((self.required_skills, 1.0),
+                                       (self.preferred_skills, PREFERRED_SKILL_WEIGHT)):
+            for label, variants, canonicals in skills:
+                if any(canonical in resume_skills for canonical in canonicals):
+                    credit = 1.0
+                else:
+                    credit = max(self._skill_credit(tokens, token_set, ngrams) for tokens in variants)
+                weight = self.weights.get(label, default_weight)
+                earned += weight * credit
+                possible += weight
+                (matched if credit >= 0.5 else missing).append(canonicals[0] if canonicals else label)
+
+        if self.responsibility_terms:
+            relevance = len(self.responsibility_terms & token_set) / len(self.responsibility_terms)
+        else:
+            relevance = None
+
+        technical = earned / possible if possible else (relevance if relevance is not None else 0.0)
+
+        years = features.years
+        if self.min_years:
+            years_fit = min(1.0, years / self.min_years)
+        else:
+            years_fit = 1.0 if years else 0.5
+        experience = years_fit if relevance is None else 0.5 * years_fit + 0.5 * relevance
+
+        level = features.education_level
+        if self.education_level:
+            education = min(1.0, level / self.education_level)
+        else:
+            education = 1.0
+
+        match_scores = {
+            "technical_skills": round(100 * technical),
+            "experience_relevance": round(100 * experience),
+            "education_requirements": round(100 * education),
+        }
+        match_scores["overall_fit"] = round(sum(
+            OVERALL_WEIGHTS[name] * match_scores[name] for name in OVERALL_WEIGHTS
+        ))
+
+        return {
+            "match_scores": match_scores,
+            "matched_skills": matched,
+            "skill_gaps": missing,
+            "years_of_experience": years,
+            "analysis": "Match score calculation completed"
+        }
@@ -0,0 +1,436 @@
+"""
+Semantic matching: resume and job requirement embeddings in a memory-mapped vector store
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.resume_crew.compaction import split_sections
+from src.resume_crew.index import QUERY_FIELD_WEIGHTS
+from src.resume_crew.registry import Singleton
+from src.resume_crew.scoring import _as_list, content_tokens
+
+DEFAULT_EMBEDDING_DIR = ".cache/embeddings"
+
+EMBEDDING_BACKENDS = ("hashing", "sentence-transformers")
+
+DEFAULT_SENTENCE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Vector width of the hashing embedder
+HASHING_DIM = 512
+
+# Bump when the hashing features change, so stored vectors are not reused
+HASHING_VERSION = 1
+
+# Resume sections are embedded in chunks of at most this many words
+CHUNK_WORDS = 80
+
+# Texts per embedder call
+EMBED_BATCH = 256
+
+# Stored vectors multiplied per block during a search, bounding the memory read at once
+SEARCH_BLOCK_ROWS = 65536
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    content_hash TEXT PRIMARY KEY,
+    row INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS documents (
+    candidate TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    candidate TEXT NOT NULL,
+    row INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_candidate ON chunks (candidate);
+"""
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class HashingEmbedder:
+    """
+    Deterministic embedder without a model: content tokens and their
+    character trigrams are hashed into a fixed-width signed vector. Word
+    forms ("deploy", "deployed", "deployments") land close together, but
+    paraphrases with no shared words do not; use a sentence model for those.
+    """
+
+    def __init__(self, dim: int = HASHING_DIM):
+        self.dim = dim
+        self.name = f"hashing-v{HASHING_VERSION}-{dim}"
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        features = []
+        for token in content_tokens(text):
+            features.append((token, 1.0))
+            padded = f"#{token}#"
+            features.extend((padded[i:i + 3], 0.5) for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows, columns, values = [], [], []
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                digest = zlib.crc32(feature.encode("utf-8"))
+                rows.append(row)
+                columns.append(digest % self.dim)
+                # The top bit picks the sign, so colliding features tend to cancel out
+                values.append(weight if digest & 0x80000000 else -weight)
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(vectors, (np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64)),
+                  np.array(values, dtype=np.float32))
+        return _normalize(vectors)
+
+
+class SentenceTransformerEmbedder:
+    """
+    Local CPU sentence embedding model from the optional
+    sentence-transformers package (pip install sentence-transformers).
+    The model is loaded on first use.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_SENTENCE_MODEL):
+        self.model_name = model_name
+        self.name = f"st-{model_name}"
+        self._model = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "EMBEDDING_BACKEND=sentence-transformers needs the sentence-transformers package "
+                    "(pip install sentence-transformers)"
+                ) from e
+            self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model
+
+    @property
+    def dim(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = self.model.encode(list(texts), batch_size=64, convert_to_numpy=True, normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def embedder_from_env():
+    """
+    The embedder named by EMBEDDING_BACKEND ("hashing" by default, or
+    "sentence-transformers" with the model in EMBEDDING_MODEL).
+    """
+    backend = os.getenv("EMBEDDING_BACKEND") or "hashing"
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"EMBEDDING_BACKEND must be one of {', '.join(EMBEDDING_BACKENDS)}, got {backend!r}")
+    if backend == "hashing":
+        return HashingEmbedder()
+    return SentenceTransformerEmbedder(os.getenv("EMBEDDING_MODEL") or DEFAULT_SENTENCE_MODEL)
+
+
+# Embedder, created from the environment on first use
+_embedder = Singleton(embedder_from_env)
+get_embedder = _embedder.get
+
+
+def configure_embedder(embedder=None) -> None:
+    """
+    Set the embedder explicitly (None reads EMBEDDING_BACKEND again on next use).
+    """
+    if embedder is None:
+        _embedder.reset()
+    else:
+        _embedder.configure(embedder)
+
+
+class EmbeddingStore:
+    """
+    Embeddings keyed by the hash of the embedded text.
+
+    Vectors are appended to a float32 file (vectors.f32) and read back as a
+    memory-mapped matrix; an SQLite table maps content hashes to rows. Text
+    that was embedded before, by this or an earlier run, is never embedded
+    again. Each embedder gets its own directory, as vectors from different
+    models are not comparable.
+    """
+
+    def __init__(self, directory: Optional[str] = None, embedder=None):
+        self.embedder = embedder or get_embedder()
+        base = Path(directory or os.getenv("EMBEDDING_DIR") or DEFAULT_EMBEDDING_DIR)
+        self.directory = base / re.sub(r"[^A-Za-z0-9.-]+", "_", self.embedder.name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = self.directory / "vectors.f32"
+        self.conn = sqlite3.connect(str(self.directory / "index.sqlite"))
+        self.conn.executescript(SCHEMA)
+        self.dim = self.embedder.dim
+        self._rows = dict(self.conn.execute("SELECT content_hash, row FROM embeddings"))
+        # Vectors are written before their keys, so rows left by an interrupted
+        # write are never referenced and new rows go after them
+        size = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+        self.count = size // (4 * self.dim)
+        self._matrix = None
+        self.embedded = 0
+
+    def close(self) -> None:
+        self._matrix = None
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Every stored vector as a read-only (count, dim) memory map.
+        """
+        if self._matrix is None:
+            if not self.count:
+                return np.zeros((0, self.dim), dtype=np.float32)
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(self.count, self.dim))
+        return self._matrix
+
+    def rows(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Matrix rows of the texts' vectors, embedding only texts not stored yet.
+        """
+        hashes = [_content_hash(text) for text in texts]
+        missing = {}
+        for content_hash, text in zip(hashes, texts):
+            if content_hash not in self._rows:
+                missing.setdefault(content_hash, text)
+
+        if missing:
+            pending = list(missing.items())
+            with open(self.vectors_path, "ab") as f:
+                f.truncate(self.count * 4 * self.dim)
+                for start in range(0, len(pending), EMBED_BATCH):
+                    batch = pending[start:start + EMBED_BATCH]
+                    vectors = np.asarray(self.embedder.embed([text for _, text in batch]), dtype=np.float32)
+                    f.write(np.ascontiguousarray(vectors).tobytes())
+            new_rows = {content_hash: self.count + index for index, (content_hash, _) in enumerate(pending)}
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO embeddings (content_hash, row) VALUES (?, ?)",
+                                      new_rows.items())
+            self._rows.update(new_rows)
+            self.count += len(pending)
+            self.embedded += len(pending)
+            self._matrix = None
+
+        return np.array([self._rows[content_hash] for content_hash in hashes], dtype=np.int64)
+
+    def similarities(self, queries: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarities (len(queries), len(rows)) of unit query vectors
+        against stored rows, one block of the memory map at a time.
+        """
+        result = np.zeros((len(queries), len(rows)), dtype=np.float32)
+        if not len(rows):
+            return result
+        matrix = self.matrix
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        for start in range(0, int(sorted_rows[-1]) + 1, SEARCH_BLOCK_ROWS):
+            lo, hi = np.searchsorted(sorted_rows, [start, start + SEARCH_BLOCK_ROWS])
+            if lo == hi:
+                continue
+            block = np.asarray(matrix[start:start + SEARCH_BLOCK_ROWS])
+            result[:, order[lo:hi]] = queries @ block[sorted_rows[lo:hi] - start].T
+        return result
+
+
+def resume_chunks(text: str) -> List[str]:
+    """
+    Split resume text into section chunks of at most CHUNK_WORDS words.
+    Chunks after the first of a section repeat the section title.
+    """
+    chunks = []
+    for section in split_sections(text):
+        title = section["title"]
+        lines, words = [], 0
+        for line in section["lines"]:
+            line_words = len(line.split())
+            if lines and words + line_words > CHUNK_WORDS:
+                chunks.append("\n".join(lines))
+                lines, words = ([title], len(title.split())) if title else ([], 0)
+            lines.append(line)
+            words += line_words
+        if lines:
+            chunks.append("\n".join(lines))
+    return chunks
+
+
+def requirement_items(job_analysis: Any) -> List[Tuple[str, float]]:
+    """
+    (text, weight) of every skill and responsibility in a job analysis (or JobProfile).
+    """
+    if hasattr(job_analysis, "to_job_analysis"):
+        job_analysis = job_analysis.to_job_analysis()
+    items = {}
+    for field, weight in QUERY_FIELD_WEIGHTS:
+        for item in _as_list(job_analysis.get(field)):
+            item = str(item).strip()
+            if item:
+                items[item] = max(items.get(item, 0.0), weight)
+    return list(items.items())
+
+
+class SemanticIndex:
+    """
+    Resume chunks in an EmbeddingStore, searched by job requirement.
+
+    A resume's score for a job is the weighted mean, over the job's
+    requirement items, of the best cosine similarity between the item and
+    any chunk of the resume, scaled to 0-100. Required skills weigh most,
+    then preferred skills, then responsibilities. The similarities of every
+    item against every chunk come from one matrix product per block of the
+    memory-mapped vectors.
+    """
+
+    def __init__(self, directory: Optional[str] = None, embedder=None):
+        self.store = EmbeddingStore(directory, embedder)
+        self.conn = self.store.conn
+
+    def close(self) -> None:
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def add_many(self, documents: Iterable[Tuple[str, str]], prune: bool = False) -> Dict[str, Any]:
+        """
+        Index (candidate, resume text) pairs. Unchanged resumes are skipped
+        and the chunks of changed ones embedded in batches; with prune,
+        candidates not in documents are removed.
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "embedded": 0}
+        known = dict(self.conn.execute("SELECT candidate, content_hash FROM documents"))
+        embedded_before = self.store.embedded
+        seen = set()
+        changed = []
+        for candidate, text in documents:
+            seen.add(candidate)
+            content_hash = _content_hash(text)
+            if known.get(candidate) == content_hash:
+                stats["unchanged"] += 1
+                continue
+            stats["updated" if candidate in known else "added"] += 1
+            changed.append((candidate, content_hash, resume_chunks(text)))
+
+        rows = self.store.rows([chunk for _, _, chunks in changed for chunk in chunks])
+        with self.conn:
+            position = 0
+            for candidate, content_hash, chunks in changed:
+                self.conn.execute("DELETE FROM chunks WHERE candidate = ?", (candidate,))
+                self.conn.executemany(
+                    "INSERT INTO chunks (candidate, row) VALUES (?, ?)",
+                    ((candidate, int(row)) for row in rows[position:position + len(chunks)])
+                )
+                self.conn.execute("INSERT OR REPLACE INTO documents (candidate, content_hash) VALUES (?, ?)",
+                                  (candidate, content_hash))
+                position += len(chunks)
+            if prune:
+                for candidate in known.keys() - seen:
+                    self.conn.execute("DELETE FROM chunks WHERE candidate = ?", (candidate,))
+                    self.conn.execute("DELETE FROM documents WHERE candidate = ?", (candidate,))
+                    stats["removed"] += 1
+        stats["embedded"] = self.store.embedded - embedded_before
+        return stats
+
+    def add(self, candidate: str, text: str) -> None:
+        """
+        Index one resume.
+        """
+        self.add_many([(candidate, text)])
+
+    def update_directory(self, directory: str) -> Dict[str, Any]:
+        """
+        Bring the index in sync with all resume files below a directory.
+        """
+        from src.resume_crew.tools import ResumeAnalysisTools, find_resume_files
+
+        documents, errors = [], []
+        for path in find_resume_files(directory):
+            parsed = ResumeAnalysisTools.analyze_resume(path)
+            if parsed["status"] == "success":
+                documents.append((path, parsed["content"]))
+            else:
+                errors.append({"resume_path": path, "error": parsed["error"]})
+        stats = self.add_many(documents, prune=True)
+        stats["errors"] = errors
+        return stats
+
+    def score_job(self, job_analysis: Any, candidates: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Semantic fit (0-100) of every indexed resume, or of the given candidates, for a job.
+        """
+        items = requirement_items(job_analysis)
+        if candidates is None:
+            pairs = self.conn.execute("SELECT candidate, row FROM chunks ORDER BY candidate").fetchall()
+        else:
+            candidates = list(dict.fromkeys(candidates))
+            pairs = []
+            for start in range(0, len(candidates), 500):
+                batch = candidates[start:start + 500]
+                pairs.extend(self.conn.execute(
+                    f"SELECT candidate, row FROM chunks WHERE candidate IN ({','.join('?' * len(batch))})", batch
+                ))
+            pairs.sort(key=lambda pair: pair[0])
+        if not items or not pairs:
+            return {}
+
+        names, starts = [], []
+        for position, (candidate, _) in enumerate(pairs):
+            if not names or names[-1] != candidate:
+                names.append(candidate)
+                starts.append(position)
+        rows = np.array([row for _, row in pairs], dtype=np.int64)
+
+        weights = np.array([weight for _, weight in items], dtype=np.float32)
+        # Requirement items are cached like resume chunks, so a repeated job embeds nothing
+        query_rows = self.store.rows([text for text, _ in items])
+        queries = np.asarray(self.store.matrix[query_rows])
+        similarities = self.store.similarities(queries, rows)
+        best = np.maximum.reduceat(similarities, np.array(starts, dtype=np.int64), axis=1)
+        scores = weights @ np.clip(best, 0.0, 1.0) / weights.sum() * 100
+        return {name: round(float(score), 1) for name, score in zip(names, scores)}
+
+    def search_job(self, job_analysis: Any, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Return the top-k (candidate, semantic fit) pairs for a job analysis.
+        """
+        scores = self.score_job(job_analysis)
+        if not scores:
+            return []
+        names = list(scores)
+        values = np.fromiter(scores.values(), dtype=np.float32, count=len(names))
+        k = min(top_k, len(names))
+        top = np.argpartition(-values, k - 1)[:k]
+        top = top[np.argsort(-values[top], kind="stable")]
+        return [(names[index], float(values[index])) for index in top]
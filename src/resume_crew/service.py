@@ -0,0 +1,266 @@
+"""
+Long-running HTTP service for resume matching with warm agents and caches
+"""
+
+import base64
+import hashlib
+import json
+import queue
+import threading
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from src.resume_crew.agents import JobAnalyzer, ResumeAnalyzer
+from src.resume_crew.profiles import get_profile_cache, load_job_profile
+from src.resume_crew.runner import get_task_cache, run_resume_optimization
+from src.resume_crew.scoring import MatchScorer
+from src.resume_crew.tools import SUPPORTED_RESUME_SUFFIXES, JobAnalysisTools, ResumeAnalysisTools
+from src.resume_crew.web import get_session
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_POOL_SIZE = 4
+DEFAULT_UPLOAD_DIR = ".cache/uploads"
+DEFAULT_COMPANY_NAME = "the company"
+MAX_BODY_BYTES = 20 * 1024 * 1024
+
+
+class RequestError(ValueError):
+    """
+    A /match request body that cannot be served as given (answered with 400).
+    """
+
+
+class AgentPool:
+    """
+    Fixed set of pre-built agents handed out one run at a time.
+
+    CrewAI agents keep per-run executor state, so an agent is never shared
+    by two concurrent runs; callers wait when every agent is busy.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int):
+        self._agents = queue.Queue()
+        for _ in range(size):
+            self._agents.put(factory())
+
+    @contextmanager
+    def agent(self):
+        agent = self._agents.get()
+        try:
+            yield agent
+        finally:
+            self._agents.put(agent)
+
+
+class MatchService:
+    """
+    Matches a job posting against a resume using agents built once at startup.
+
+    The task output cache, job page cache, resume parse cache and pooled
+    HTTP session are set up before the first request. Concurrent requests
+    for the same job share a single job analysis run. Uploaded resumes are
+    deleted once no request in flight uses them.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, upload_dir: str = DEFAULT_UPLOAD_DIR):
+        self.job_analyzers = AgentPool(JobAnalyzer, pool_size)
+        self.resume_analyzers = AgentPool(ResumeAnalyzer, pool_size)
+        self.upload_dir = Path(upload_dir)
+        # A job's lock lives only while some request holds it
+        self._job_locks = weakref.WeakValueDictionary()
+        self._job_locks_guard = threading.Lock()
+        self._uploads = Counter()
+        self._uploads_guard = threading.Lock()
+
+        get_task_cache()
+        get_profile_cache()
+        JobAnalysisTools.get_fetch_cache()
+        ResumeAnalysisTools.get_parse_cache()
+        get_session()
+
+    def _job_lock(self, job_key: str) -> threading.Lock:
+        with self._job_locks_guard:
+            lock = self._job_locks.get(job_key)
+            if lock is None:
+                lock = self._job_locks[job_key] = threading.Lock()
+            return lock
+
+    @contextmanager
+    def resume_file(self, request: Dict[str, Any]):
+        """
+        Yield a resume path for a request: either resume_path, or an upload
+        (resume_text, or resume_base64 with resume_filename) saved under a
+        content-addressed name so repeated uploads hit the caches. An upload
+        is deleted when the last request using it finishes.
+        """
+        if request.get("resume_path"):
+            path = Path(request["resume_path"])
+            if not path.is_file():
+                raise RequestError(f"Resume file not found: {path}")
+            yield str(path)
+            return
+
+        if request.get("resume_text"):
+            data, suffix = request["resume_text"].encode("utf-8"), ".txt"
+        elif request.get("resume_base64"):
+            suffix = Path(request.get("resume_filename", "")).suffix.lower()
+            if suffix not in SUPPORTED_RESUME_SUFFIXES:
+                raise RequestError(f"resume_filename must end with one of {', '.join(SUPPORTED_RESUME_SUFFIXES)}")
+            try:
+                data = base64.b64decode(request["resume_base64"], validate=True)
+            except ValueError:
+                raise RequestError("resume_base64 is not valid base64")
+        else:
+            raise RequestError("Provide resume_path, resume_text or resume_base64")
+
+        path = self.upload_dir / f"{hashlib.sha256(data).hexdigest()}{suffix}"
+        with self._uploads_guard:
+            if not self._uploads[path]:
+                self.upload_dir.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+            self._uploads[path] += 1
+        try:
+            yield str(path)
+        finally:
+            with self._uploads_guard:
+                self._uploads[path] -= 1
+                if not self._uploads[path]:
+                    del self._uploads[path]
+                    path.unlink(missing_ok=True)
+
+    def analyze_job(self, job_url: Optional[str], job_text: Optional[str], company_name: str) -> Dict[str, Any]:
+        """
+        Load the job profile for a posting URL or text. URLs are fetched
+        through the job page cache; the job analysis only runs for a posting
+        without a stored profile.
+        """
+        if not job_text and not job_url:
+            raise RequestError("Provide job_url or job_text")
+
+        job_key = hashlib.sha256(f"{job_url}\0{job_text}\0{company_name}".encode("utf-8")).hexdigest()
+        with self._job_lock(job_key), self.job_analyzers.agent() as agent:
+            return load_job_profile(job_url or "", company_name, job_text=job_text, agent=agent)
+
+    def match(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle one /match request body and return the response payload.
+        """
+        started = time.perf_counter()
+        company_name = request.get("company_name") or DEFAULT_COMPANY_NAME
+        with self.resume_file(request) as resume_path:
+            return self._match(request, company_name, resume_path, started)
+
+    def _match(self, request: Dict[str, Any], company_name: str, resume_path: str, started: float) -> Dict[str, Any]:
+        job_url = request.get("job_url")
+
+        job_record = self.analyze_job(job_url, request.get("job_text"), company_name)
+        profile = job_record["profile"]
+        job_analysis = job_record["parsed"] if job_record["parsed"] is not None else job_record["raw"]
+        job_seconds = time.perf_counter() - started
+
+        with self.resume_analyzers.agent() as agent:
+            resume_record = run_resume_optimization(
+                job_url or "", company_name, resume_path, profile or job_analysis, agent=agent
+            )
+
+        local_scores = None
+        if profile is not None:
+            resume = ResumeAnalysisTools.analyze_resume(resume_path)
+            if resume["status"] == "success":
+                local_scores = MatchScorer.from_profile(profile).score(resume["content"])
+
+        return {
+            "status": "success",
+            "resume_path": resume_path,
+            "job_analysis": job_analysis,
+            "resume_optimization": resume_record["parsed"] if resume_record["parsed"] is not None else resume_record["raw"],
+            "local_scores": local_scores,
+            "compaction": resume_record.get("compaction"),
+            "cached": {"job_analysis": job_record["cached"], "resume_optimization": resume_record["cached"]},
+            "timings": {
+                "job_analysis_seconds": round(job_seconds, 3),
+                "total_seconds": round(time.perf_counter() - started, 3)
+            }
+        }
+
+
+class MatchRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON request handler: POST /match and GET /health.
+    """
+
+    service: MatchService = None
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status: int, payload: Dict[str, Any], close: bool = False) -> None:
+        body = json.dumps(payload, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reject(self, status: int, error: str) -> None:
+        """
+        Answer before the request body was read. The unread body would be
+        parsed as the next request on a kept-alive connection, so it is closed.
+        """
+        self._send_json(status, {"status": "error", "error": error}, close=True)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"status": "error", "error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        """
+        Only request payload problems are answered with 400; any failure
+        while matching, a ValueError from the crew included, is a 500.
+        """
+        if self.path != "/match":
+            self._reject(404, f"Unknown path: {self.path}")
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self._reject(400, "Invalid Content-Length")
+            return
+        if length < 0:
+            self._reject(400, "Invalid Content-Length")
+            return
+        if length > MAX_BODY_BYTES:
+            self._reject(413, "Request body too large")
+            return
+        try:
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError as e:
+                raise RequestError(f"Request body is not valid JSON: {e}")
+            if not isinstance(request, dict):
+                raise RequestError("Request body must be a JSON object")
+            self._send_json(200, self.service.match(request))
+        except RequestError as e:
+            self._send_json(400, {"status": "error", "error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"status": "error", "error": str(e)})
+
+
+def create_server(service: MatchService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Create a threaded HTTP server bound to a match service.
+    Each request runs in its own thread; the agent pools bound LLM concurrency.
+    """
+    handler = type("BoundMatchRequestHandler", (MatchRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
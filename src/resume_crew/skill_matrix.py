@@ -0,0 +1,261 @@
+"""
+NumPy-backed skill presence matrix across a candidate pool
+"""
+
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.resume_crew.scoring import MAX_PHRASE_TOKENS, PREFERRED_SKILL_WEIGHT, _as_list, content_tokens, tokenize
+
+# Resumes tokenized and matched per chunk, bounding peak memory
+DEFAULT_CHUNK_SIZE = 4096
+
+# Share of a long skill's tokens that must appear for it to count as present
+LONG_SKILL_COVERAGE = 0.5
+
+
+class SkillMatrix:
+    """
+    Boolean matrix of skills (columns) present in each resume (rows).
+
+    Columns are the required and preferred skills of a job analysis. Single
+    token skills are matched by token presence, short phrases by exact
+    n-gram match and long skill descriptions by token coverage, all computed
+    with array operations over a whole chunk of resumes at once. Skills the
+    skill taxonomy knows are labelled with their canonical name and also
+    count as present under any alias, as MatchScorer credits them.
+    """
+
+    def __init__(self, skills: List[str], required: np.ndarray, presence: np.ndarray,
+                 candidate_ids: List[Any]):
+        self.skills = skills
+        self.required = required
+        self.presence = presence
+        self.candidate_ids = candidate_ids
+        self.weights = np.where(required, 1.0, PREFERRED_SKILL_WEIGHT).astype(np.float32)
+
+    @classmethod
+    def build(cls, job_analysis: Dict[str, Any], texts: Iterable[str],
+              candidate_ids: Optional[Sequence[Any]] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, taxonomy=None) -> "SkillMatrix":
+        """
+        Build the matrix for a job analysis and an iterable of resume texts.
+        Candidate ids default to row numbers; the taxonomy defaults to get_taxonomy().
+        """
+        compiled = _CompiledSkills(job_analysis, taxonomy)
+        chunks = []
+        chunk = []
+        for text in texts:
+            chunk.append(text)
+            if len(chunk) >= chunk_size:
+                chunks.append(compiled.match(chunk))
+                chunk = []
+        if chunk or not chunks:
+            chunks.append(compiled.match(chunk))
+
+        presence = np.concatenate(chunks, axis=0)
+        if candidate_ids is None:
+            candidate_ids = list(range(presence.shape[0]))
+        return cls(compiled.labels, compiled.required, presence, list(candidate_ids))
+
+    def scores(self) -> np.ndarray:
+        """
+        Weighted skill coverage per candidate, 0-100 (preferred skills count half).
+        """
+        total = self.weights.sum()
+        if not total:
+            return np.zeros(len(self.candidate_ids), dtype=np.float32)
+        return 100 * (self.presence @ self.weights) / total
+
+    def coverage(self) -> Dict[str, float]:
+        """
+        Share of the pool that has each skill.
+        """
+        if not self.candidate_ids:
+            return {skill: 0.0 for skill in self.skills}
+        share = self.presence.mean(axis=0)
+        return {skill: float(value) for skill, value in zip(self.skills, share)}
+
+    def gaps(self, row: int, include_preferred: bool = False) -> List[str]:
+        """
+        Skills missing from one candidate's resume.
+        """
+        missing = ~self.presence[row]
+        if not include_preferred:
+            missing &= self.required
+        return [self.skills[col] for col in np.flatnonzero(missing)]
+
+    def rank(self, top_k: Optional[int] = None, min_score: float = 0) -> List[Tuple[Any, float]]:
+        """
+        Candidates ordered by weighted skill coverage, best first.
+        """
+        scores = self.scores()
+        order = np.argsort(-scores, kind="stable")
+        order = order[scores[order] >= min_score]
+        if top_k is not None:
+            order = order[:top_k]
+        return [(self.candidate_ids[row], float(scores[row])) for row in order]
+
+    def summary(self, top_k: Optional[int] = None) -> Dict[str, Any]:
+        """
+        JSON-serializable pool summary: per-skill coverage and ranked candidates with their gaps.
+        """
+        scores = self.scores()
+        rows = np.argsort(-scores, kind="stable")
+        if top_k is not None:
+            rows = rows[:top_k]
+        return {
+            "skills": self.skills,
+            "coverage": self.coverage(),
+            "candidates": [
+                {
+                    "candidate": self.candidate_ids[row],
+                    "skill_score": round(float(scores[row]), 1),
+                    "skill_gaps": self.gaps(row)
+                }
+                for row in rows
+            ]
+        }
+
+
+class _CompiledSkills:
+    """
+    Job skills compiled into token ids and phrase hashes for array matching.
+    """
+
+    def __init__(self, job_analysis: Dict[str, Any], taxonomy=None):
+        # Imported here: the taxonomy module tokenizes with the scoring module
+        from src.resume_crew.taxonomy import get_taxonomy
+
+        required = _as_list(job_analysis.get("required_skills") or job_analysis.get("skills"))
+        preferred = _as_list(job_analysis.get("preferred_skills"))
+        self.taxonomy = taxonomy if taxonomy is not None else get_taxonomy()
+
+        # Same keys as MatchScorer: a skill resolving to an already seen canonical skill is dropped
+        self.labels = []
+        required_flags = []
+        skill_tokens = []
+        self.canonical = []
+        seen = set()
+        for labels, is_required in ((required, True), (preferred, False)):
+            for label in labels:
+                tokens = content_tokens(label)
+                canonical = self.taxonomy.canonical(label) if self.taxonomy is not None else None
+                key = canonical or label.lower()
+                if tokens and key not in seen:
+                    seen.add(key)
+                    self.labels.append(canonical or label)
+                    required_flags.append(is_required)
+                    skill_tokens.append(tokens)
+                    if canonical:
+                        self.canonical.append((len(self.labels) - 1, canonical))
+        self.required = np.array(required_flags, dtype=bool)
+
+        # Token id 0 marks tokens that belong to no skill and document boundaries
+        self.vocab = {}
+        for tokens in skill_tokens:
+            for token in tokens:
+                self.vocab.setdefault(token, len(self.vocab) + 1)
+        self.base = len(self.vocab) + 1
+
+        vocab_size = self.base
+        self.single = [(col, self.vocab[tokens[0]]) for col, tokens in enumerate(skill_tokens)
+                       if len(tokens) == 1]
+
+        # Short phrases: one hash per n-gram length, sorted for searchsorted lookups.
+        # Skills with the same tokens ("CI/CD", "CI CD") share a hash: the first one is
+        # matched and the others copy its presence (shared_phrases).
+        self.phrases = {}
+        self.shared_phrases = []
+        first_col = {}
+        for col, tokens in enumerate(skill_tokens):
+            if 1 < len(tokens) <= MAX_PHRASE_TOKENS:
+                ids = [self.vocab[token] for token in tokens]
+                phrase_hash = self._hash(ids)
+                if phrase_hash in first_col:
+                    self.shared_phrases.append((col, first_col[phrase_hash]))
+                    continue
+                first_col[phrase_hash] = col
+                self.phrases.setdefault(len(tokens), []).append((phrase_hash, col))
+        for n, entries in self.phrases.items():
+            entries.sort()
+            self.phrases[n] = (
+                np.array([h for h, _ in entries], dtype=np.int64),
+                np.array([col for _, col in entries], dtype=np.int64)
+            )
+
+        # Long skill descriptions: token incidence matrix for coverage
+        long_skills = [(col, tokens) for col, tokens in enumerate(skill_tokens)
+                       if len(tokens) > MAX_PHRASE_TOKENS]
+        self.long_cols = np.array([col for col, _ in long_skills], dtype=np.int64)
+        self.long_incidence = np.zeros((vocab_size, len(long_skills)), dtype=np.float32)
+        self.long_lengths = np.zeros(len(long_skills), dtype=np.float32)
+        for j, (_, tokens) in enumerate(long_skills):
+            unique = {self.vocab[token] for token in tokens}
+            self.long_incidence[list(unique), j] = 1
+            self.long_lengths[j] = len(unique)
+
+    def _hash(self, ids: List[int]) -> int:
+        value = 0
+        for token_id in ids:
+            value = value * self.base + token_id
+        return value
+
+    def match(self, texts: List[str]) -> np.ndarray:
+        """
+        Presence matrix (len(texts) x skills) for one chunk of resumes.
+        """
+        presence = np.zeros((len(texts), len(self.labels)), dtype=bool)
+        if not texts or not self.labels:
+            return presence
+
+        # Concatenate the chunk into one id stream with a 0 between documents
+        vocab_get = self.vocab.get
+        extract = self.taxonomy.extract_tokens if self.canonical else None
+        ids = []
+        lengths = []
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            if extract is not None:
+                found = extract(tokens)
+                for col, canonical in self.canonical:
+                    if canonical in found:
+                        presence[row, col] = True
+            doc_ids = list(map(vocab_get, tokens, repeat(0)))
+            doc_ids.append(0)
+            ids.extend(doc_ids)
+            lengths.append(len(doc_ids))
+        ids = np.array(ids, dtype=np.int64)
+        rows = np.repeat(np.arange(len(texts)), lengths)
+
+        known = ids > 0
+        token_presence = np.zeros((len(texts), self.base), dtype=bool)
+        token_presence[rows[known], ids[known]] = True
+
+        for col, token_id in self.single:
+            presence[:, col] |= token_presence[:, token_id]
+
+        for n, (hashes, cols) in self.phrases.items():
+            windows = len(ids) - n + 1
+            if windows <= 0:
+                continue
+            window_hash = np.zeros(windows, dtype=np.int64)
+            valid = np.ones(windows, dtype=bool)
+            for k in range(n):
+                part = ids[k:k + windows]
+                window_hash = window_hash * self.base + part
+                valid &= part > 0
+            hit = valid & np.isin(window_hash, hashes)
+            positions = np.flatnonzero(hit)
+            matched_cols = cols[np.searchsorted(hashes, window_hash[positions])]
+            presence[rows[positions], matched_cols] = True
+        for col, first in self.shared_phrases:
+            presence[:, col] |= presence[:, first]
+
+        if len(self.long_cols):
+            covered = token_presence.astype(np.float32) @ self.long_incidence
+            presence[:, self.long_cols] |= covered >= LONG_SKILL_COVERAGE * self.long_lengths
+
+        return presence
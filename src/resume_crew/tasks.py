@@ -2,15 +2,30 @@
 Tasks for Resume Optimization Crew
 """
 
+import json
+
 from crewai import Task
+from src.resume_crew.profiles import JobProfile
 
-def create_job_analysis_task(agent, job_url, company_name):
+def create_job_analysis_task(agent, job_url, company_name, job_text=None):
     """
     Create a task for job analysis.
+    
+    When job_text is given (the posting text, already fetched or pasted),
+    it is embedded in the description instead of pointing at job_url.
     """
+    if job_text:
+        job_source = f"""the following job posting for {company_name}:
+        
+        {job_text}
+        
+        Extract"""
+    else:
+        job_source = f"the job posting at {job_url} for {company_name} and extract"
+    
     return Task(
         description=f"""
-        Analyze the job posting at {job_url} for {company_name} and extract:
+        Analyze {job_source}:
         
         1. Job title and level
         2. Required skills (technical and soft skills)
@@ -37,13 +52,41 @@ def create_job_analysis_task(agent, job_url, company_name):
         """
     )
 
-def create_resume_optimization_task(agent, job_url, company_name, resume_path):
+def create_resume_optimization_task(agent, job_url, company_name, resume_path, job_analysis=None, resume_text=None):
     """
     Create a task for resume optimization.
+    
+    When job_analysis is given (a JobProfile, or the output of the job
+    analysis task, parsed or raw), it is embedded in the description so the
+    task can run without the job analysis task in the same crew. When
+    resume_text is given (usually the compacted resume), it is embedded
+    instead of pointing at resume_path.
     """
+    if resume_text:
+        resume_source = f"""the candidate's resume ({resume_path}) below and:
+        
+        {resume_text}
+        
+        Then"""
+    else:
+        resume_source = f"the candidate's resume from {resume_path} and"
+    
+    if isinstance(job_analysis, JobProfile):
+        job_context = f"""Use the following job profile (normalized skills, synonyms and experience requirements):
+        
+        {job_analysis.prompt_context()}"""
+    elif job_analysis is not None:
+        if not isinstance(job_analysis, str):
+            job_analysis = json.dumps(job_analysis, indent=2)
+        job_context = f"""Use the following job analysis results:
+        
+        {job_analysis}"""
+    else:
+        job_context = "Use the job analysis results from the previous task."
+    
     return Task(
         description=f"""
-        Based on the job analysis for {company_name}, analyze the candidate's resume from {resume_path} and:
+        Based on the job analysis for {company_name}, analyze {resume_source}:
         
         1. Calculate a match score (0-100) for:
            - Technical skills match
@@ -61,7 +104,7 @@ def create_resume_optimization_task(agent, job_url, company_name, resume_path):
         
         4. Suggest specific action items to improve the resume
         
-        Use the job analysis results from the previous task.
+        {job_context}
         """,
         agent=agent,
         expected_output="""
@@ -0,0 +1,140 @@
+"""
+Skill taxonomy: canonical skill names and aliases compiled into a token-level matcher
+"""
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.resume_crew.registry import Singleton
+from src.resume_crew.scoring import tokenize
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).parent / "data" / "skill_taxonomy.json"
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with their aliases.
+
+    Every name and alias is tokenized like resume text and compiled into a
+    single Aho-Corasick automaton over tokens, so all canonical skills in a
+    text are found in one pass over its tokens regardless of taxonomy size.
+    Skills whose own name is an ordinary word ("Go", "R", "Swift") set
+    match_name to false: free text only matches their aliases, while
+    canonical() still resolves the bare name.
+    """
+
+    def __init__(self, skills: Dict[str, Dict[str, Any]]):
+        self.skills = skills
+        self._lookup: Dict[Tuple[str, ...], str] = {}
+        patterns: Dict[Tuple[str, ...], str] = {}
+        for name, entry in skills.items():
+            for alias, matchable in [(name, entry.get("match_name", True))] + [
+                (alias, True) for alias in entry.get("aliases", [])
+            ]:
+                tokens = tuple(tokenize(alias))
+                if not tokens:
+                    continue
+                self._lookup.setdefault(tokens, name)
+                if matchable:
+                    patterns.setdefault(tokens, name)
+        self._compile(patterns)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "SkillTaxonomy":
+        """
+        Load a taxonomy file ({"skills": {name: {"aliases": [...]}}}), by default the packaged one.
+        """
+        with open(path or DEFAULT_TAXONOMY_PATH, "r", encoding="utf-8") as f:
+            return cls(json.load(f)["skills"])
+
+    def _compile(self, patterns: Dict[Tuple[str, ...], str]) -> None:
+        """
+        Build the goto trie, failure links and merged outputs.
+        """
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[str, ...]] = [()]
+        for tokens, name in patterns.items():
+            node = 0
+            for token in tokens:
+                child = goto[node].get(token)
+                if child is None:
+                    child = len(goto)
+                    goto[node][token] = child
+                    goto.append({})
+                    outputs.append(())
+                node = child
+            outputs[node] += (name,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and token not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(token, 0)
+                fail[child] = target if target != child else 0
+                outputs[child] += outputs[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def extract_tokens(self, tokens: Iterable[str]) -> Set[str]:
+        """
+        Canonical skills mentioned in an already tokenized text.
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        root = goto[0]
+        found = set()
+        node = 0
+        for token in tokens:
+            if node == 0:
+                node = root.get(token, 0)
+            else:
+                while True:
+                    child = goto[node].get(token)
+                    if child is not None:
+                        node = child
+                        break
+                    if node == 0:
+                        break
+                    node = fail[node]
+            if outputs[node]:
+                found.update(outputs[node])
+        return found
+
+    def extract(self, text: str) -> Set[str]:
+        """
+        Canonical skills mentioned in a text.
+        """
+        return self.extract_tokens(tokenize(text))
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """
+        Canonical name of a skill name or alias, None when it is not in the taxonomy.
+        """
+        return self._lookup.get(tuple(tokenize(skill)))
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+
+def taxonomy_from_env() -> Optional[SkillTaxonomy]:
+    """
+    Load the taxonomy at SKILL_TAXONOMY_PATH (default: the packaged
+    taxonomy). An empty SKILL_TAXONOMY_PATH disables it.
+    """
+    path = os.getenv("SKILL_TAXONOMY_PATH", str(DEFAULT_TAXONOMY_PATH))
+    return SkillTaxonomy.load(path) if path else None
+
+
+# Skill taxonomy, loaded on first use (None disables normalization)
+_taxonomy = Singleton(taxonomy_from_env)
+configure_taxonomy = _taxonomy.configure
+get_taxonomy = _taxonomy.get
@@ -2,41 +2,235 @@
 Tools for Resume Optimization Agents
 """
 
-import requests
-from bs4 import BeautifulSoup
 import json
+import os
+import threading
+import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
-import PyPDF2
+from typing import Dict, Iterator, List, Any, Optional
 import io
+from src.resume_crew.cache import FetchCache, ParseCache
+from src.resume_crew.instrumentation import span
+from src.resume_crew.registry import Singleton
+from src.resume_crew.scoring import MatchScorer
+
+# PyPDF2, lxml and requests are imported by the code paths that
+# use them, so parsing a text resume never loads them.
+
+SUPPORTED_RESUME_SUFFIXES = ('.pdf', '.txt', '.md')
+
+def find_resume_files(directory: str) -> List[str]:
+    """
+    Find all supported resume files below a directory, sorted by path.
+    """
+    return sorted(
+        str(path) for path in Path(directory).rglob("*")
+        if path.is_file() and path.suffix.lower() in SUPPORTED_RESUME_SUFFIXES
+    )
+
+@lru_cache(maxsize=None)
+def pdf_parser_version() -> str:
+    """
+    Version tag of the PDF extraction code, part of every PDF parse cache key.
+    """
+    import PyPDF2
+    # Bump the trailing number whenever PDF text extraction changes
+    return f"pypdf2-{PyPDF2.__version__}/2"
+
+# Separator between pages in extracted PDF text
+PDF_PAGE_SEPARATOR = "\f"
+
+# Documents shorter than this are never split across worker processes
+PDF_PARALLEL_MIN_PAGES = 16
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+def iter_pdf_pages(pdf_reader, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the extracted text of each page in [start, stop), one page at a time.
+    """
+    pages = pdf_reader.pages
+    stop = len(pages) if stop is None else min(stop, len(pages))
+    for index in range(start, stop):
+        yield pages[index].extract_text() or ""
+
+def _extract_page_range(args) -> List[str]:
+    """
+    Extract a range of pages in a worker process.
+    """
+    import PyPDF2
+    path, start, stop = args
+    return list(iter_pdf_pages(PyPDF2.PdfReader(path), start, stop))
+
+def process_context():
+    """
+    Multiprocessing context for worker pools. Workers come from a fork
+    server (or are spawned) rather than forked from the caller, whose other
+    threads (crew event handlers, HTTP servers) may hold locks at fork time.
+    """
+    import multiprocessing
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+def _iter_pdf_pages_parallel(file_path: Path, page_count: int, workers: int) -> Iterator[str]:
+    """
+    Yield page texts in order while page ranges are extracted in a process pool.
+    Closing the generator early cancels the ranges that have not started yet.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    chunk = max(1, -(-page_count // (workers * 2)))
+    ranges = [(str(file_path), start, min(start + chunk, page_count))
+              for start in range(0, page_count, chunk)]
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=process_context())
+    try:
+        for texts in pool.map(_extract_page_range, ranges):
+            yield from texts
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 class JobAnalysisTools:
     """Tools for job analysis agent."""
     
+    # Job page cache, built from the environment on first use; None disables it
+    _fetch_cache = Singleton(FetchCache.from_env)
+    configure_fetch_cache = _fetch_cache.configure
+    get_fetch_cache = _fetch_cache.get
+    # A URL's lock lives only while some fetch holds it
+    _url_locks = weakref.WeakValueDictionary()
+    _url_locks_guard = threading.Lock()
+    
+    @classmethod
+    def _url_lock(cls, job_url: str) -> threading.Lock:
+        with cls._url_locks_guard:
+            lock = cls._url_locks.get(job_url)
+            if lock is None:
+                lock = cls._url_locks[job_url] = threading.Lock()
+            return lock
+    
     @staticmethod
     def extract_job_details(job_url: str) -> Dict[str, Any]:
         """
         Extract job details from a job posting URL.
+        
+        Pages are fetched through the pooled session and cached: within the
+        cache TTL no request is made, and stale entries are revalidated with
+        a conditional request so an unchanged page is not downloaded or
+        parsed again. Concurrent callers for the same URL share one fetch.
+        
+        Only the posting body is kept (see html_text.extract_page_text);
+        raw_bytes and text_bytes report the page and extracted text sizes.
         """
-        try:
-            response = requests.get(job_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract text content
-            text_content = soup.get_text()
-            
+        with span("extract_job_details", url=job_url) as stage:
+            try:
+                with JobAnalysisTools._url_lock(job_url):
+                    details = JobAnalysisTools._fetch_job_page(job_url)
+            except Exception as e:
+                details = {
+                    "url": job_url,
+                    "error": str(e),
+                    "status": "error"
+                }
+            stage.update(
+                bytes=details.get("bytes_downloaded", 0),
+                raw_bytes=details.get("raw_bytes", 0),
+                text_bytes=details.get("text_bytes", 0),
+                chars=len(details.get("content") or ""),
+                cache=details.get("cache"),
+                status="ok" if details["status"] == "success" else "error"
+            )
+            return details
+    
+    @staticmethod
+    def _fetch_job_page(job_url: str) -> Dict[str, Any]:
+        """
+        Fetch a job page, using and refreshing the page cache.
+        """
+        cache = JobAnalysisTools.get_fetch_cache()
+        cache_key = FetchCache.key_for(job_url) if cache else None
+        entry = cache.get(cache_key) if cache else None
+        now = time.time()
+        
+        if entry is not None and cache.is_fresh(entry, now):
+            if JobAnalysisTools._refresh_extraction(entry):
+                cache.put(cache_key, entry)
             return {
                 "url": job_url,
-                "content": text_content,
+                "content": entry["content"],
+                "raw_bytes": entry.get("raw_bytes", 0),
+                "text_bytes": len(entry["content"].encode("utf-8")),
+                "cache": "hit",
                 "status": "success"
             }
-        except Exception as e:
+        
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        from src.resume_crew.web import REQUEST_TIMEOUT, get_session
+        response = get_session().get(job_url, headers=headers, timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code == 304 and entry is not None:
+            entry["fetched_at"] = now
+            JobAnalysisTools._refresh_extraction(entry)
+            cache.put(cache_key, entry)
             return {
                 "url": job_url,
-                "error": str(e),
-                "status": "error"
+                "content": entry["content"],
+                "raw_bytes": entry.get("raw_bytes", 0),
+                "text_bytes": len(entry["content"].encode("utf-8")),
+                "cache": "revalidated",
+                "status": "success"
             }
+        
+        response.raise_for_status()
+        from src.resume_crew.html_text import extract_page_text, extraction_mode
+        # Only a declared charset is passed on: requests assumes Latin-1 otherwise
+        encoding = response.encoding if "charset" in response.headers.get("Content-Type", "").lower() else None
+        extracted = extract_page_text(response.content, encoding=encoding, mode=extraction_mode())
+        
+        if cache:
+            cache.put(cache_key, {
+                "url": job_url,
+                "body": response.text,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content": extracted["content"],
+                "extractor": extracted["extractor"],
+                "raw_bytes": extracted["raw_bytes"],
+                "fetched_at": now
+            })
+        
+        return {
+            "url": job_url,
+            "content": extracted["content"],
+            "raw_bytes": extracted["raw_bytes"],
+            "text_bytes": extracted["text_bytes"],
+            "cache": "miss",
+            "bytes_downloaded": len(response.content),
+            "status": "success"
+        }
+    
+    @staticmethod
+    def _refresh_extraction(entry: Dict[str, Any]) -> bool:
+        """
+        Re-extract a cached page stored by another extraction mode or version
+        from its stored body, without fetching it again. Returns whether the
+        entry changed.
+        """
+        from src.resume_crew.html_text import extract_page_text, extraction_mode, extractor_tag
+        mode = extraction_mode()
+        if entry.get("extractor") == extractor_tag(mode):
+            return False
+        extracted = extract_page_text(entry["body"], mode=mode)
+        entry.update(content=extracted["content"], extractor=extracted["extractor"], raw_bytes=extracted["raw_bytes"])
+        return True
     
     @staticmethod
     def analyze_requirements(job_content: str) -> Dict[str, Any]:
@@ -56,6 +250,11 @@ class JobAnalysisTools:
 class ResumeAnalysisTools:
     """Tools for resume analysis agent."""
     
+    # Parsed PDF cache, built from the environment on first use; None disables it
+    _parse_cache = Singleton(ParseCache.from_env)
+    configure_parse_cache = _parse_cache.configure
+    get_parse_cache = _parse_cache.get
+    
     @staticmethod
     def analyze_resume(resume_path: str = "knowledge/CV_Mohan.txt") -> Dict[str, Any]:
         """
@@ -95,25 +294,98 @@ class ResumeAnalysisTools:
             }
     
     @staticmethod
-    def _parse_pdf_resume(file_path: Path) -> Dict[str, Any]:
+    def _parse_pdf_resume(file_path: Path, max_pages: Optional[int] = None,
+                          max_chars: Optional[int] = None,
+                          workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Parse PDF resume file.
+        
+        Pages are extracted one at a time and joined once at the end, stopping
+        early after max_pages pages or max_chars characters (resume signal is
+        at the front). Long documents can be split across worker processes.
+        Limits default to PDF_MAX_PAGES / PDF_MAX_CHARS / PDF_WORKERS.
+        Results are cached by file content, so an unchanged PDF is only parsed once.
         """
+        with span("_parse_pdf_resume", resume_path=str(file_path)) as stage:
+            result = ResumeAnalysisTools._extract_pdf_resume(file_path, max_pages, max_chars, workers)
+            stage.update(
+                bytes=result.get("bytes", 0),
+                chars=len(result.get("content") or ""),
+                pages_extracted=result.get("pages_extracted"),
+                cached=result.get("cached"),
+                status="ok" if result["status"] == "success" else "error"
+            )
+            return result
+    
+    @staticmethod
+    def _extract_pdf_resume(file_path: Path, max_pages: Optional[int], max_chars: Optional[int],
+                            workers: Optional[int]) -> Dict[str, Any]:
+        """
+        Extract the text of a PDF resume for _parse_pdf_resume, through the parse cache.
+        """
+        max_pages = max_pages if max_pages is not None else _env_int("PDF_MAX_PAGES")
+        max_chars = max_chars if max_chars is not None else _env_int("PDF_MAX_CHARS")
+        workers = workers if workers is not None else (_env_int("PDF_WORKERS") or 1)
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text_content = ""
-                
-                for page in pdf_reader.pages:
-                    text_content += page.extract_text()
-                
+            data = file_path.read_bytes()
+            
+            cache = ResumeAnalysisTools.get_parse_cache()
+            parser_version = f"{pdf_parser_version()}|pages={max_pages}|chars={max_chars}"
+            cache_key = ParseCache.key_for(data, parser_version) if cache else None
+            cached = cache.get(cache_key) if cache else None
+            if cached is not None:
                 return {
                     "resume_path": str(file_path),
-                    "content": text_content,
+                    "content": cached["content"],
                     "file_type": "pdf",
-                    "pages": len(pdf_reader.pages),
+                    "pages": cached["pages"],
+                    "pages_extracted": cached["pages_extracted"],
+                    "truncated": cached["truncated"],
+                    "bytes": len(data),
+                    "cached": True,
                     "status": "success"
                 }
+            
+            import PyPDF2
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+            page_count = len(pdf_reader.pages)
+            pages_to_read = min(page_count, max_pages) if max_pages else page_count
+            
+            if workers > 1 and pages_to_read >= PDF_PARALLEL_MIN_PAGES:
+                page_texts = _iter_pdf_pages_parallel(file_path, pages_to_read, workers)
+            else:
+                page_texts = iter_pdf_pages(pdf_reader, 0, pages_to_read)
+            
+            parts = []
+            chars = 0
+            truncated = pages_to_read < page_count
+            for text in page_texts:
+                if max_chars and chars + len(text) >= max_chars:
+                    parts.append(text[:max_chars - chars])
+                    truncated = True
+                    break
+                parts.append(text)
+                chars += len(text) + len(PDF_PAGE_SEPARATOR)
+            page_texts.close()
+            text_content = PDF_PAGE_SEPARATOR.join(parts)
+            
+            entry = {
+                "content": text_content,
+                "pages": page_count,
+                "pages_extracted": len(parts),
+                "truncated": truncated
+            }
+            if cache:
+                cache.put(cache_key, entry)
+            
+            return {
+                "resume_path": str(file_path),
+                **entry,
+                "file_type": "pdf",
+                "bytes": len(data),
+                "cached": False,
+                "status": "success"
+            }
         except Exception as e:
             return {
                 "resume_path": str(file_path),
@@ -147,16 +419,10 @@ class ResumeAnalysisTools:
     def calculate_match_score(resume_content: str, job_requirements: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate match score between resume and job requirements.
+        Scoring is local and deterministic; use MatchScorer directly to score
+        many resumes against the same job without recompiling it.
         """
-        # This would typically use NLP/LLM to calculate scores
-        # For now, return a sample structure
-        return {
-            "technical_skills_score": 75,
-            "experience_score": 80,
-            "education_score": 90,
-            "overall_score": 82,
-            "analysis": "Match score calculation completed"
-        }
+        return MatchScorer(job_requirements).score(resume_content)
 
 class CompanyResearchTools:
     """Tools for company research agent."""
@@ -0,0 +1,38 @@
+"""
+Shared HTTP session for fetching job postings
+"""
+
+from src.resume_crew.registry import Singleton
+
+# (connect, read) timeouts in seconds for every outgoing request
+REQUEST_TIMEOUT = (5, 30)
+
+USER_AGENT = "resume-optimization-crew/0.1"
+
+def new_session() -> "requests.Session":
+    """
+    Create a pooled session: connections are kept alive and reused across
+    requests; transient gateway errors are retried with backoff.
+    """
+    # Imported here: requests is only needed once a page is fetched
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET", "HEAD")
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+# The process-wide pooled session, created on first use
+_session = Singleton(new_session)
+get_session = _session.get
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental re-scoring through the artifact graph
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew.artifacts import ArtifactGraph, build_job_profile, build_resume_match
+from src.resume_crew.cache import ArtifactCache
+from src.resume_crew.tools import JobAnalysisTools
+
+JOB_URL = "https://example.com/job"
+
+def respond(role, description):
+    if role == "Job Requirements Analyst":
+        return {"job_title": "Engineer", "required_skills": ["Python", "Kubernetes"]}
+    return {"match_scores": {"overall": 70}, "skill_gaps": ["Kubernetes"]}
+
+def run(cache, job_text, resume_path):
+    """
+    One single-mode pass: job profile, then match scores for one resume.
+    Returns the names of the rebuilt artifacts.
+    """
+    graph = ArtifactGraph(cache)
+    job_record = build_job_profile(graph, JOB_URL, "Example", job_text=job_text)
+    build_resume_match(graph, JOB_URL, "Example", resume_path, job_record["profile"])
+    return [name.split(":")[0] for name in graph.rebuilt]
+
+def test_only_stale_stages_are_rebuilt():
+    """
+    Unchanged inputs rebuild nothing; a revised resume re-scores without
+    re-analyzing the job; an edited posting re-analyzes the job and re-scores
+    without re-parsing the resume.
+    """
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(respond) as crew:
+        resume_path = Path(tmp) / "resume.txt"
+        resume_path.write_text("Python developer")
+        cache = ArtifactCache(Path(tmp) / "artifacts")
+        first = run(cache, "Python engineer wanted", str(resume_path))
+        unchanged = run(cache, "Python engineer wanted", str(resume_path))
+        resume_path.write_text("Python and Kubernetes developer")
+        revised_resume = run(cache, "Python engineer wanted", str(resume_path))
+        jobs_before_edit = crew.kickoffs["Job Requirements Analyst"]
+        edited_job = run(cache, "Senior Python engineer wanted", str(resume_path))
+
+    assert first == ["job_profile", "resume_text", "match_scores"]
+    assert unchanged == []
+    assert revised_resume == ["resume_text", "match_scores"]
+    assert jobs_before_edit == 1
+    # The edited posting compiles to the same profile, so the scores stay valid
+    assert edited_job == ["job_profile"]
+    assert crew.kickoffs == {"Job Requirements Analyst": 2, "Resume Optimization Specialist": 2}
+
+def test_report_follows_the_company_name():
+    """
+    A new company name reuses the stored scores but still re-renders final_report.md.
+    """
+    import main
+
+    original_extract = JobAnalysisTools.extract_job_details
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(respond):
+        Path(tmp, "Jane_Doe.txt").write_text("Python developer")
+        JobAnalysisTools.extract_job_details = staticmethod(
+            lambda job_url: {"status": "success", "content": "Python engineer wanted"}
+        )
+        os.chdir(tmp)
+        try:
+            reports = []
+            for company in ("Acme", "Globex"):
+                main.main(["--job-url", JOB_URL, "--company", company, "--resume", "Jane_Doe.txt"])
+                reports.append(Path("output", "final_report.md").read_text(encoding="utf-8"))
+        finally:
+            os.chdir(original_cwd)
+            JobAnalysisTools.extract_job_details = original_extract
+
+    assert "**Target Position:** Engineer, Acme" in reports[0]
+    assert "**Target Position:** Engineer, Globex" in reports[1]
+
+if __name__ == "__main__":
+    with isolated():
+        test_only_stale_stages_are_rebuilt()
+        test_report_follows_the_company_name()
+    print("🎉 Artifact graph tests completed!")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for batch mode: one job posting against a pool of resumes
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew.batch import collect_resumes, overall_fit, run_batch
+from src.resume_crew.cache import FetchCache
+from src.resume_crew.html_text import extractor_tag
+from src.resume_crew.tools import JobAnalysisTools, ResumeAnalysisTools
+
+JOB_URL = "https://example.com/jobs/1"
+
+def respond(role, description):
+    """Analyzes the posting and scores ana's resume highest."""
+    if role == "Job Requirements Analyst":
+        return {"job_title": "Platform Engineer", "required_skills": ["Python", "Kubernetes"]}
+    return {"match_scores": {"overall_fit": 90 if "ana.txt" in description else 40}, "skill_gaps": []}
+
+def test_batch_parses_each_resume_once():
+    """
+    Every resume is parsed once for the skill matrix and the same record
+    feeds the LLM stage; results are ranked by overall fit.
+    """
+    original_analyze = ResumeAnalysisTools.analyze_resume
+    parses = []
+
+    def counting_analyze(resume_path):
+        parses.append(resume_path)
+        return original_analyze(resume_path)
+
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(respond) as crew:
+        cache = FetchCache(str(Path(tmp) / "pages"), ttl=3600)
+        cache.put(FetchCache.key_for(JOB_URL), {
+            "url": JOB_URL, "body": "", "content": "Platform Engineer: Python, Kubernetes",
+            "extractor": extractor_tag("lean"), "fetched_at": 4102444800
+        })
+        JobAnalysisTools.configure_fetch_cache(cache)
+        pool = Path(tmp) / "resumes"
+        pool.mkdir()
+        for name, text in (("ana", "Python and Kubernetes"), ("ben", "Python only"), ("cai", "Go services")):
+            (pool / f"{name}.txt").write_text(text)
+        resume_paths = collect_resumes(str(pool))
+
+        ResumeAnalysisTools.analyze_resume = staticmethod(counting_analyze)
+        try:
+            ranking = run_batch(JOB_URL, "Example", resume_paths, Path(tmp) / "output", max_workers=2)
+        finally:
+            ResumeAnalysisTools.analyze_resume = original_analyze
+        matrix = json.loads((Path(tmp) / "output" / "skill_matrix.json").read_text())
+
+    assert sorted(parses) == sorted(resume_paths)
+    assert crew.kickoffs == {"Job Requirements Analyst": 1, "Resume Optimization Specialist": 3}
+    assert Path(ranking[0]["resume_path"]).name == "ana.txt" and overall_fit(ranking[0]) == 90
+    assert all(record["status"] == "success" for record in ranking)
+    assert matrix["coverage"]["Kubernetes"] == 1 / 3
+
+if __name__ == "__main__":
+    with isolated():
+        test_batch_parses_each_resume_once()
+    print("🎉 Batch tests completed!")
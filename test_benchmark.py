@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the benchmark suite
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+import benchmark
+
+def test_small_benchmark_run():
+    """
+    A scaled-down run reports throughput and peak memory for the selected benchmarks.
+    """
+    original_min_seconds = benchmark.MIN_PASS_SECONDS
+    benchmark.MIN_PASS_SECONDS = 0
+    try:
+        current = benchmark.run_benchmarks(scale=0.05, only=["parse_text", "match_scoring", "crew_end_to_end"])
+    finally:
+        benchmark.MIN_PASS_SECONDS = original_min_seconds
+
+    assert set(current["results"]) == {"parse_text", "match_scoring", "crew_end_to_end"}
+    assert current["sizes"]["text_resumes"] == 10
+    for result in current["results"].values():
+        assert result["items_per_second"] > 0
+        assert result["peak_memory_mb"] >= 0
+    assert benchmark.compare(current, current) == []
+
+def test_regressions_are_reported():
+    """
+    Throughput drops and memory growth beyond the tolerance are regressions; small noise is not.
+    """
+    baseline = {"version": benchmark.BASELINE_VERSION, "scale": 1.0, "results": {
+        "parse_pdf": {"items_per_second": 500.0, "peak_memory_mb": 10.0},
+        "report": {"items_per_second": 3000.0, "peak_memory_mb": 1.0},
+    }}
+    current = {"version": benchmark.BASELINE_VERSION, "scale": 1.0, "results": {
+        "parse_pdf": {"items_per_second": 300.0, "peak_memory_mb": 10.5},
+        "report": {"items_per_second": 2900.0, "peak_memory_mb": 2.0},
+        "fetch_job_page": {"items_per_second": 1.0, "peak_memory_mb": 100.0},
+    }}
+    regressions = benchmark.compare(current, baseline, tolerance=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("parse_pdf: 300.0/s")
+    assert regressions[1].startswith("report: 2.0 MB")
+
+    try:
+        benchmark.compare(current, {**baseline, "scale": 2.0})
+        assert False, "baselines at another scale must not be compared"
+    except ValueError:
+        pass
+
+def test_missing_or_mismatched_baseline_fails():
+    """
+    Without a comparable baseline the run exits non-zero unless it records one.
+    """
+    original_min_seconds = benchmark.MIN_PASS_SECONDS
+    benchmark.MIN_PASS_SECONDS = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = Path(tmp) / "benchmarks" / "baseline.json"
+        args = ["--only", "parse_text", "--scale", "0.05", "--baseline", str(baseline),
+                "--output", str(Path(tmp) / "results.json")]
+        try:
+            missing = benchmark.main(args)
+            saved = benchmark.main(args + ["--save-baseline"])
+            recorded = json.loads(baseline.read_text())
+            mismatched = benchmark.main(args[:3] + ["0.1"] + args[4:])
+        finally:
+            benchmark.MIN_PASS_SECONDS = original_min_seconds
+
+    assert (missing, saved, mismatched) == (1, 0, 1)
+    assert recorded["scale"] == 0.05 and set(recorded["results"]) == {"parse_text"}
+
+def test_tracked_baseline_covers_every_benchmark():
+    """
+    The committed baseline is recorded at scale 1 for the current benchmark version.
+    """
+    baseline = json.loads(Path(benchmark.DEFAULT_BASELINE_PATH).read_text())
+    assert (baseline["version"], baseline["scale"]) == (benchmark.BASELINE_VERSION, 1.0)
+    assert set(baseline["sizes"]) == set(benchmark.CORPUS_SIZES)
+
+if __name__ == "__main__":
+    test_small_benchmark_run()
+    test_regressions_are_reported()
+    test_missing_or_mismatched_baseline_fails()
+    test_tracked_baseline_covers_every_benchmark()
+    print("🎉 Benchmark tests completed!")
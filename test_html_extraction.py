@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for lean HTML-to-text extraction of job pages
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated
+from src.resume_crew.cache import FetchCache
+from src.resume_crew.html_text import extract_page_text, extractor_tag
+from src.resume_crew.tools import JobAnalysisTools
+
+CAREERS_PAGE = b"""<html><head><title>Careers</title><style>.c{color:red}</style></head><body>
+<header class="site-header"><a href="/">Home</a><a href="/jobs">Jobs</a></header>
+<nav><a href="/about">About us</a></nav>
+<div id="cookie-consent">We use cookies to improve your experience. <button>Accept all</button></div>
+<div class="page has-sidebar">
+  <article>
+    <header><h1>Senior Python Engineer</h1></header>
+    <div class="job-description">
+      <p>Build   data
+         services in Python.</p>
+      <ul><li>Kubernetes</li><li>Google Cloud</li></ul>
+    </div>
+    <div class="share-bar">Share this job on LinkedIn</div>
+  </article>
+  <aside>Similar jobs: Frontend Engineer</aside>
+</div>
+<footer>Copyright Acme Corp</footer>
+<script>var tracking = {"page": "job"};</script>
+</body></html>"""
+
+def test_lean_extraction_keeps_only_the_posting():
+    """
+    Scripts, navigation, cookie banners, share bars and footers are dropped;
+    the posting keeps its title, paragraphs and bullets with whitespace collapsed.
+    """
+    extracted = extract_page_text(CAREERS_PAGE)
+
+    assert extracted["content"] == (
+        "Senior Python Engineer\nBuild data services in Python.\n- Kubernetes\n- Google Cloud"
+    )
+    assert extracted["raw_bytes"] == len(CAREERS_PAGE)
+    assert extracted["text_bytes"] == len(extracted["content"].encode("utf-8"))
+    assert extracted["extractor"] == extractor_tag("lean")
+
+    full = extract_page_text(CAREERS_PAGE, mode="full")
+    assert "cookies" in full["content"] and "Copyright" in full["content"]
+    assert full["text_bytes"] > extracted["text_bytes"]
+
+def test_pages_without_a_main_container_use_the_body():
+    """
+    Simple pages fall back to the body text, and undeclared UTF-8 is decoded as such.
+    """
+    page = "<html><body><h1>Data Engineer</h1><p>Zürich, hybrid</p></body></html>".encode("utf-8")
+    assert extract_page_text(page)["content"] == "Data Engineer\nZürich, hybrid"
+    assert extract_page_text(b"   ")["content"] == ""
+
+def test_cached_pages_are_re_extracted_when_the_mode_changes():
+    """
+    A cached page extracted another way is re-extracted from its stored body without a fetch.
+    """
+    job_url = "https://example.com/jobs/1"
+    original_mode = os.environ.get("JOB_PAGE_EXTRACTION")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FetchCache(tmp, ttl=3600)
+        cache.put(FetchCache.key_for(job_url), {
+            "url": job_url,
+            "body": CAREERS_PAGE.decode("utf-8"),
+            "content": "stale full-page text",
+            "extractor": "full",
+            "fetched_at": 4102444800
+        })
+        JobAnalysisTools.configure_fetch_cache(cache)
+        os.environ["JOB_PAGE_EXTRACTION"] = "lean"
+        try:
+            details = JobAnalysisTools.extract_job_details(job_url)
+            stored = cache.get(FetchCache.key_for(job_url))
+        finally:
+            if original_mode is None:
+                os.environ.pop("JOB_PAGE_EXTRACTION", None)
+            else:
+                os.environ["JOB_PAGE_EXTRACTION"] = original_mode
+
+    assert details["status"] == "success" and details["cache"] == "hit"
+    assert details["content"].startswith("Senior Python Engineer")
+    assert details["raw_bytes"] == len(CAREERS_PAGE)
+    assert stored["extractor"] == extractor_tag("lean")
+
+if __name__ == "__main__":
+    with isolated():
+        test_lean_extraction_keeps_only_the_posting()
+        test_pages_without_a_main_container_use_the_body()
+        test_cached_pages_are_re_extracted_when_the_mode_changes()
+    print("🎉 HTML extraction tests completed!")
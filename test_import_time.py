@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for the import-time budget of the resume tools
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Seconds allowed for `import src.resume_crew.tools` in a fresh interpreter
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "0.3"))
+
+HEAVY_MODULES = ("crewai", "PyPDF2", "bs4", "lxml", "requests", "numpy")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import src.resume_crew.tools
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(m for m in sys.modules if "." not in m)}))
+"""
+
+def import_probe(code=PROBE):
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).parent,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def test_tools_import_is_within_budget():
+    """
+    Importing the tools module stays fast and loads none of the heavy dependencies.
+    """
+    # Best of three runs smooths out a cold disk cache
+    probes = [import_probe() for _ in range(3)]
+    loaded = set(probes[0]["modules"]).intersection(HEAVY_MODULES)
+    assert not loaded, f"heavy modules loaded at import: {sorted(loaded)}"
+    best = min(probe["seconds"] for probe in probes)
+    assert best < IMPORT_BUDGET_SECONDS, f"import took {best:.3f}s (budget {IMPORT_BUDGET_SECONDS}s)"
+
+def test_cli_help_does_not_load_crewai():
+    """
+    Printing the CLI help must not import the LLM stack.
+    """
+    code = ("import sys, json\nsys.argv = ['main.py', '--help']\nimport main\n"
+            "try:\n    main.parse_args()\nexcept SystemExit:\n    pass\n"
+            "print(json.dumps({'modules': sorted(m for m in sys.modules if '.' not in m)}))")
+    loaded = set(import_probe(code)["modules"]).intersection(HEAVY_MODULES)
+    assert not loaded, f"heavy modules loaded by --help: {sorted(loaded)}"
+
+if __name__ == "__main__":
+    test_tools_import_is_within_budget()
+    test_cli_help_does_not_load_crewai()
+    print("🎉 Import time tests completed!")
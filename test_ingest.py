@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test script for bulk resume ingestion
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.resume_crew.ingest import ingest_directory, load_store
+
+def test_ingest_records_errors_and_resumes():
+    """
+    Broken files are recorded as errors, and a second run only parses changed
+    files and the ones that failed.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "archive"
+        (archive / "2024").mkdir(parents=True)
+        (archive / "alice.txt").write_text("Python engineer")
+        (archive / "2024" / "bob.md").write_text("# Bob\nData analyst")
+        (archive / "2024" / "broken.pdf").write_bytes(b"not a pdf")
+        (archive / "notes.docx").write_text("ignored")
+        store = Path(tmp) / "resumes.jsonl"
+
+        stats = ingest_directory(str(archive), str(store), workers=2)
+        assert (stats["total"], stats["ingested"], stats["errors"]) == (3, 2, 1)
+        records = load_store(store)
+        assert records[str(archive / "2024" / "broken.pdf")]["status"] == "error"
+        assert records[str(archive / "alice.txt")]["content"] == "Python engineer"
+
+        # Simulate an interrupted write, then change one file
+        with open(store, "a") as f:
+            f.write('{"resume_path": "trunc')
+        (archive / "alice.txt").write_text("Python and Go engineer")
+        os.utime(archive / "alice.txt", (0, 1))
+
+        stats = ingest_directory(str(archive), str(store), workers=2)
+        assert (stats["skipped"], stats["ingested"], stats["errors"]) == (1, 1, 1)
+        assert load_store(store)[str(archive / "alice.txt")]["content"] == "Python and Go engineer"
+        assert all(json.loads(line) for line in store.read_text().splitlines()[-1:])
+
+if __name__ == "__main__":
+    test_ingest_records_errors_and_resumes()
+    print("🎉 Ingestion tests completed!")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for per-stage instrumentation
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew import runner
+from src.resume_crew.instrumentation import Tracer, configure_tracer
+from src.resume_crew.tools import ResumeAnalysisTools
+
+def test_spans_are_written_and_totalled():
+    """
+    Spans become JSON lines, exceptions mark them as errors, and totals add up per stage.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_path = Path(tmp) / "trace.jsonl"
+        tracer = Tracer(str(trace_path))
+        with tracer.span("fetch", url="https://example.com") as stage:
+            stage["bytes"] = 100
+        with tracer.span("fetch") as stage:
+            stage["bytes"] = 50
+        try:
+            with tracer.span("save_results"):
+                raise OSError("disk full")
+        except OSError:
+            pass
+        tracer.close()
+
+        lines = [json.loads(line) for line in trace_path.read_text().splitlines()]
+
+    assert [line["name"] for line in lines] == ["fetch", "fetch", "save_results"]
+    assert lines[0]["url"] == "https://example.com" and lines[0]["bytes"] == 100
+    assert lines[2]["status"] == "error"
+    assert {line["run_id"] for line in lines} == {tracer.run_id}
+    assert tracer.totals["fetch"]["count"] == 2 and tracer.totals["fetch"]["bytes"] == 150
+    assert tracer.totals["save_results"]["errors"] == 1
+    table = tracer.summary_table()
+    assert "fetch" in table and "save_results" in table
+
+def test_task_and_parse_stages_are_traced():
+    """
+    A crew task records its token usage, and parsing a PDF records the bytes read.
+    """
+    tracer = Tracer()
+    configure_tracer(tracer)
+    usage = {"prompt_tokens": 1200, "completion_tokens": 300, "total_tokens": 1500}
+    with FakeCrew({"job_title": "Engineer"}, token_usage=usage):
+        runner.run_job_analysis("https://example.com/job", "Example", job_text="Python engineer")
+    with tempfile.TemporaryDirectory() as tmp:
+        broken = Path(tmp) / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+        ResumeAnalysisTools._parse_pdf_resume(broken)
+
+    task_stage = next(name for name in tracer.totals if name.startswith("task:"))
+    assert tracer.totals[task_stage]["total_tokens"] == 1500
+    assert tracer.totals[task_stage]["prompt_tokens"] == 1200
+    assert tracer.totals["_parse_pdf_resume"]["errors"] == 1
+
+def test_library_tracer_writes_no_file_unless_asked():
+    """
+    Outside the command line, spans stay in memory unless TRACE_PATH names a file.
+    """
+    original = os.environ.pop("TRACE_PATH", None)
+    try:
+        default = Tracer.from_env()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["TRACE_PATH"] = str(Path(tmp) / "trace.jsonl")
+            configured = Tracer.from_env()
+    finally:
+        os.environ.pop("TRACE_PATH", None)
+        if original is not None:
+            os.environ["TRACE_PATH"] = original
+
+    assert default.path is None
+    assert configured.path.name == "trace.jsonl"
+
+if __name__ == "__main__":
+    with isolated():
+        test_spans_are_written_and_totalled()
+        test_task_and_parse_stages_are_traced()
+        test_library_tracer_writes_no_file_unless_asked()
+    print("🎉 Instrumentation tests completed!")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for the job page fetch cache against a local HTTP stub server
+"""
+
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated
+from src.resume_crew.cache import FetchCache
+from src.resume_crew.tools import JobAnalysisTools
+
+JOB_PAGE = b"<html><body><h1>Senior Python Engineer</h1><p>Kubernetes, GCP</p></body></html>"
+ETAG = '"job-v1"'
+
+class StubJobHandler(BaseHTTPRequestHandler):
+    """Serves one job page with an ETag and answers conditional requests."""
+
+    requests_seen = []
+
+    def do_GET(self):
+        conditional = self.headers.get("If-None-Match") == ETAG
+        StubJobHandler.requests_seen.append("conditional" if conditional else "full")
+        if conditional:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(JOB_PAGE)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(JOB_PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+def test_job_page_fetch_cache():
+    """
+    Fresh entries skip the network, stale entries are revalidated with 304.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubJobHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    job_url = f"http://127.0.0.1:{server.server_address[1]}/jobs/1"
+    StubJobHandler.requests_seen = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FetchCache(tmp, ttl=3600)
+        JobAnalysisTools.configure_fetch_cache(cache)
+        try:
+            first = JobAnalysisTools.extract_job_details(job_url)
+            assert first["status"] == "success"
+            assert first["cache"] == "miss"
+            assert "Senior Python Engineer" in first["content"]
+
+            second = JobAnalysisTools.extract_job_details(job_url)
+            assert second["cache"] == "hit"
+            assert StubJobHandler.requests_seen == ["full"]
+
+            cache.ttl = 0
+            third = JobAnalysisTools.extract_job_details(job_url)
+            assert third["cache"] == "revalidated"
+            assert third["content"] == first["content"]
+            assert StubJobHandler.requests_seen == ["full", "conditional"]
+            assert not JobAnalysisTools._url_locks
+        finally:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == "__main__":
+    with isolated():
+        test_job_page_fetch_cache()
+    print("🎉 Job fetch cache tests completed!")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for persisted job profiles
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated
+import src.resume_crew.profiles as profiles
+from src.resume_crew.cache import JobProfileCache
+from src.resume_crew.profiles import JobProfile, load_job_profile
+from src.resume_crew.scoring import MatchScorer
+
+JOB_ANALYSIS = {
+    "job_title": "Cloud Engineer",
+    "required_skills": ["Google Cloud Platform (GCP)", "Python", "python", "Cloud databases (e.g. BigQuery, Spanner)"],
+    "preferred_skills": ["Terraform", "Python"],
+    "required_experience": "5+ years building cloud services; Bachelor's degree in CS",
+    "key_responsibilities": ["Design data pipelines"]
+}
+
+def test_profile_normalizes_skills():
+    """
+    Skills are deduplicated, parenthesized alternatives become synonyms and
+    weights and experience requirements are precomputed.
+    """
+    profile = JobProfile.from_analysis(JOB_ANALYSIS, "https://example.com/job", "abc")
+    assert profile.required_skills == ["Google Cloud Platform", "Python", "Cloud databases"]
+    assert profile.preferred_skills == ["Terraform"]
+    assert profile.synonyms == {"Google Cloud Platform": ["GCP"], "Cloud databases": ["BigQuery", "Spanner"]}
+    assert profile.weights["Python"] == 1.0 and profile.weights["Terraform"] == 0.5
+    assert (profile.min_years, profile.education_level) == (5, 2)
+    assert "skill_synonyms" in profile.prompt_context()
+
+def test_scorer_credits_synonyms():
+    """
+    A resume naming only the synonym gets full credit for the skill.
+    """
+    profile = JobProfile.from_analysis(JOB_ANALYSIS, "https://example.com/job", "abc")
+    scored = MatchScorer.from_profile(profile, reference_year=2024).score(
+        "Python developer on GCP with BigQuery. Terraform. 2016 - present. B.Tech"
+    )
+    assert scored["skill_gaps"] == []
+    assert scored["match_scores"]["technical_skills"] == 100
+
+def test_job_analysis_runs_once_per_posting_version():
+    """
+    The stored profile answers repeat requests; changed posting text is re-analyzed.
+    """
+    calls = []
+
+    def fake_run_job_analysis(job_url, company_name, verbose=False, job_text=None, agent=None):
+        calls.append(job_text)
+        return {"agent": "Job Requirements Analyst", "raw": json.dumps(JOB_ANALYSIS),
+                "parsed": JOB_ANALYSIS, "cached": False}
+
+    original = profiles.run_job_analysis
+    profiles.run_job_analysis = fake_run_job_analysis
+    with tempfile.TemporaryDirectory() as tmp:
+        profiles.configure_profile_cache(JobProfileCache(tmp))
+        try:
+            first = load_job_profile("https://example.com/job", "Example", job_text="Cloud Engineer v1")
+            second = load_job_profile("https://example.com/job", "Example", job_text="Cloud Engineer v1")
+            changed = load_job_profile("https://example.com/job", "Example", job_text="Cloud Engineer v2")
+        finally:
+            profiles.run_job_analysis = original
+
+    assert calls == ["Cloud Engineer v1", "Cloud Engineer v2"]
+    assert (first["cached"], second["cached"], changed["cached"]) == (False, True, False)
+    assert second["profile"] == first["profile"]
+    assert second["parsed"] == JOB_ANALYSIS
+
+if __name__ == "__main__":
+    with isolated():
+        test_profile_normalizes_skills()
+        test_scorer_credits_synonyms()
+        test_job_analysis_runs_once_per_posting_version()
+    print("🎉 Job profile tests completed!")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the local match scorer
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew.artifacts import configure_artifact_cache
+from src.resume_crew.batch import run_pipeline
+from src.resume_crew.cache import ArtifactCache, FetchCache, JobProfileCache
+from src.resume_crew.html_text import extractor_tag
+from src.resume_crew.profiles import configure_profile_cache
+from src.resume_crew.scoring import MatchScorer, resume_years
+from src.resume_crew.tools import JobAnalysisTools, ResumeAnalysisTools
+
+JOB_ANALYSIS = {
+    "job_title": "Senior Backend Engineer",
+    "required_skills": ["Python", "Kubernetes", "Google Cloud Platform", "SQL"],
+    "preferred_skills": ["Terraform", "Go"],
+    "required_experience": "5+ years of backend development, Bachelor's degree in Computer Science",
+    "key_responsibilities": ["Design scalable microservices", "Mentor engineers"],
+}
+
+STRONG_RESUME = """
+Jane Doe - Senior Software Engineer
+Experience: Acme Corp 2016 - 2024. Built Python microservices on Google Cloud Platform
+and Kubernetes, designed scalable APIs backed by SQL databases, mentor engineers.
+Tooling: Terraform. Education: Bachelor of Science in Computer Science.
+"""
+
+WEAK_RESUME = """
+John Roe - Graphic Designer
+Experience: 2021 - 2023 designing brochures in Photoshop.
+Education: Diploma in Visual Arts.
+"""
+
+def test_scores_are_deterministic_and_ranked():
+    """
+    The stronger resume scores higher on every field and scores repeat exactly.
+    """
+    scorer = MatchScorer(JOB_ANALYSIS, reference_year=2024)
+    strong = scorer.score(STRONG_RESUME)
+    weak = scorer.score(WEAK_RESUME)
+
+    assert strong == scorer.score(STRONG_RESUME)
+    for field in ("technical_skills", "experience_relevance", "education_requirements", "overall_fit"):
+        assert 0 <= weak["match_scores"][field] <= strong["match_scores"][field] <= 100
+    assert strong["match_scores"]["overall_fit"] > weak["match_scores"]["overall_fit"]
+    assert strong["skill_gaps"] == ["Go"]
+    assert "Kubernetes" in weak["skill_gaps"]
+
+def test_calculate_match_score_uses_local_scorer():
+    """
+    The agent tool returns the same match_scores as the scorer.
+    """
+    result = ResumeAnalysisTools.calculate_match_score(STRONG_RESUME, JOB_ANALYSIS)
+    assert set(result["match_scores"]) == {
+        "technical_skills", "experience_relevance", "education_requirements", "overall_fit"
+    }
+
+def test_resume_years_merges_overlapping_ranges():
+    """
+    Overlapping roles count once; open ranges end at the reference year.
+    """
+    assert resume_years("2010 - 2015, 2013 - 2018, 2020 - Present", 2024) == 12
+
+def test_pipeline_counts_the_llm_calls_it_made():
+    """
+    A warm rerun reuses the job profile and the shortlisted matches, so it
+    reports no LLM calls made and every task as avoided.
+    """
+    job_url = "https://example.com/jobs/1"
+
+    def respond(role, description):
+        if role == "Job Requirements Analyst":
+            return JOB_ANALYSIS
+        return {"match_scores": {"overall_fit": 80}, "skill_gaps": ["Go"]}
+
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(respond) as crew:
+        fetch_cache = FetchCache(str(Path(tmp) / "pages"), ttl=3600)
+        fetch_cache.put(FetchCache.key_for(job_url), {
+            "url": job_url, "body": "", "content": "Senior Backend Engineer: Python, Kubernetes",
+            "extractor": extractor_tag("lean"), "fetched_at": 4102444800
+        })
+        JobAnalysisTools.configure_fetch_cache(fetch_cache)
+        configure_profile_cache(JobProfileCache(str(Path(tmp) / "profiles")))
+        configure_artifact_cache(ArtifactCache(str(Path(tmp) / "artifacts")))
+        resume_paths = []
+        for name, text in (("jane", STRONG_RESUME), ("john", WEAK_RESUME), ("ana", STRONG_RESUME + " Go")):
+            path = Path(tmp) / f"{name}.txt"
+            path.write_text(text)
+            resume_paths.append(str(path))
+
+        run = lambda: run_pipeline(job_url, "Example", resume_paths, Path(tmp) / "output", top_k=2, max_workers=1)
+        cold, warm = run(), run()
+
+    assert sum(crew.kickoffs.values()) == 3
+    assert (cold["llm_calls_made"], cold["llm_calls_avoided"]) == (3, 1)
+    assert (warm["llm_calls_made"], warm["llm_calls_avoided"]) == (0, 4)
+
+if __name__ == "__main__":
+    with isolated():
+        test_scores_are_deterministic_and_ranked()
+        test_calculate_match_score_uses_local_scorer()
+        test_resume_years_merges_overlapping_ranges()
+        test_pipeline_counts_the_llm_calls_it_made()
+    print("🎉 Match scoring tests completed!")
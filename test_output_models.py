@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for typed task outputs and the repair parse path
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.resume_crew.models import JobAnalysis, ResumeOptimization, parse_output
+
+def test_plain_json_is_validated():
+    """
+    Plain JSON validates in one pass and unknown fields are kept.
+    """
+    job = parse_output('{"job_title": "Data Engineer", "required_skills": ["Python", "SQL"], "location": "Remote"}', JobAnalysis)
+    assert job.job_title == "Data Engineer"
+    assert job.required_skills == ["Python", "SQL"]
+    assert job.model_dump(exclude_unset=True)["location"] == "Remote"
+
+def test_malformed_outputs_are_repaired():
+    """
+    Fenced JSON, surrounding prose, trailing commas, short score names and
+    loosely typed fields are all repaired instead of dropped.
+    """
+    raw = """Here is the report:
+```json
+{
+  "match_scores": {"technical": "85/100", "experience": 70, "education": "90%", "overall": 78.5,},
+  "skill_gaps": "Kubernetes",
+  "action_items": [{"action": "Quantify impact"}, "Add GCP projects"],
+}
+```
+Let me know if you need anything else."""
+    report = parse_output(raw, ResumeOptimization)
+    assert report is not None
+    scores = report.match_scores
+    assert (scores.technical_skills, scores.experience_relevance,
+            scores.education_requirements, scores.overall_fit) == (85, 70, 90, 78.5)
+    assert report.skill_gaps == ["Kubernetes"]
+    assert report.action_items == ["Quantify impact", "Add GCP projects"]
+    assert report.model_dump(exclude_unset=True)["match_scores"]["overall_fit"] == 78.5
+
+def test_unparseable_output_returns_none():
+    """
+    Output without a JSON object is reported as unparsed.
+    """
+    assert parse_output("I could not analyze this posting.", JobAnalysis) is None
+    assert parse_output("", ResumeOptimization) is None
+
+def test_objects_without_the_required_fields_are_unparsed():
+    """
+    Any JSON object is not a successful parse: the fields the pipeline
+    relies on (required_skills, match_scores.overall_fit) must be present.
+    """
+    assert parse_output("{}", JobAnalysis) is None
+    assert parse_output('{"job_title": "Data Engineer"}', JobAnalysis) is None
+    assert parse_output('{"required_skills": []}', JobAnalysis).required_skills == []
+    assert parse_output("{}", ResumeOptimization) is None
+    assert parse_output('{"match_scores": {"technical": 80}}', ResumeOptimization) is None
+    assert parse_output('{"match_scores": {"overall": "n/a"}}', ResumeOptimization) is None
+
+if __name__ == "__main__":
+    test_plain_json_is_validated()
+    test_malformed_outputs_are_repaired()
+    test_unparseable_output_returns_none()
+    test_objects_without_the_required_fields_are_unparsed()
+    print("🎉 Output model tests completed!")
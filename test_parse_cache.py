@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the parsed resume cache
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+import PyPDF2
+
+from fixtures import isolated, make_pdf
+from src.resume_crew.cache import ParseCache
+from src.resume_crew.tools import ResumeAnalysisTools
+
+def test_pdf_parse_is_cached():
+    """
+    A second parse of an unchanged PDF must not touch the PDF parser.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "resume.pdf"
+        pdf_path.write_bytes(make_pdf(["Python Engineer", "Kubernetes GCP"]))
+        ResumeAnalysisTools.configure_parse_cache(ParseCache(Path(tmp) / "cache"))
+        original_reader = PyPDF2.PdfReader
+        try:
+            first = ResumeAnalysisTools.analyze_resume(str(pdf_path))
+            assert first["status"] == "success"
+            assert first["cached"] is False
+            assert "Python Engineer" in first["content"]
+
+            def fail(*args, **kwargs):
+                raise AssertionError("PDF parser should not run on a cache hit")
+            PyPDF2.PdfReader = fail
+
+            second = ResumeAnalysisTools.analyze_resume(str(pdf_path))
+            assert second["cached"] is True
+            assert second["content"] == first["content"]
+            assert second["pages"] == 2
+        finally:
+            PyPDF2.PdfReader = original_reader
+
+def test_cache_evicts_least_recently_used():
+    """
+    Writes beyond max_bytes evict the entries that were used longest ago.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        entry = {"content": "x" * 50, "pages": 1}
+        cache = ParseCache(tmp)
+        cache.put("a", entry)
+        entry_size = (Path(tmp) / f"a{ParseCache.SUFFIX}").stat().st_size
+
+        cache = ParseCache(tmp, max_bytes=2 * entry_size)
+        time.sleep(0.01)
+        cache.put("b", entry)
+        time.sleep(0.01)
+        assert cache.get("a") == entry
+        time.sleep(0.01)
+        cache.put("c", entry)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == entry
+        assert cache.get("c") == entry
+        assert ParseCache.key_for(b"data", "v1") != ParseCache.key_for(b"data", "v2")
+
+def test_overwriting_an_entry_does_not_grow_the_cache():
+    """
+    Rewriting a key replaces its size in the tracked total instead of adding to it.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        entry = {"content": "x" * 50, "pages": 1}
+        cache = ParseCache(tmp)
+        cache.put("a", entry)
+        entry_size = (Path(tmp) / f"a{ParseCache.SUFFIX}").stat().st_size
+
+        cache = ParseCache(tmp, max_bytes=10 * entry_size)
+        cache.put("b", entry)
+        for _ in range(3):
+            cache.put("a", entry)
+
+        assert cache.get("b") == entry
+        assert cache._size == 2 * entry_size
+
+if __name__ == "__main__":
+    with isolated():
+        test_pdf_parse_is_cached()
+        test_cache_evicts_least_recently_used()
+        test_overwriting_an_entry_does_not_grow_the_cache()
+    print("🎉 Parse cache tests completed!")
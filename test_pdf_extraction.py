@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming PDF extraction with cutoffs and worker processes
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated, make_pdf
+from src.resume_crew.tools import PDF_PAGE_SEPARATOR, ResumeAnalysisTools
+
+def test_pdf_extraction_cutoffs_and_parallel_pages():
+    """
+    Cutoffs stop extraction early; parallel extraction keeps page order.
+    """
+    pages = [f"Page {i} experience" for i in range(20)]
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "portfolio.pdf"
+        pdf_path.write_bytes(make_pdf(pages))
+
+        full = ResumeAnalysisTools._parse_pdf_resume(pdf_path)
+        assert full["content"].split(PDF_PAGE_SEPARATOR) == pages
+        assert (full["pages"], full["pages_extracted"], full["truncated"]) == (20, 20, False)
+
+        by_pages = ResumeAnalysisTools._parse_pdf_resume(pdf_path, max_pages=3)
+        assert by_pages["content"].split(PDF_PAGE_SEPARATOR) == pages[:3]
+        assert by_pages["truncated"] is True
+
+        by_chars = ResumeAnalysisTools._parse_pdf_resume(pdf_path, max_chars=25)
+        assert len(by_chars["content"]) == 25
+        assert by_chars["pages_extracted"] == 2
+
+        parallel = ResumeAnalysisTools._parse_pdf_resume(pdf_path, workers=2)
+        assert parallel["content"] == full["content"]
+
+if __name__ == "__main__":
+    with isolated():
+        test_pdf_extraction_cutoffs_and_parallel_pages()
+    print("🎉 PDF extraction tests completed!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for the process-wide singleton registry
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated
+from src.resume_crew.registry import Singleton, preserved
+
+def test_singleton_is_built_once_and_can_be_configured():
+    """
+    The object is built from the environment on first use; configure() wins, reset() rebuilds.
+    """
+    built = []
+    singleton = Singleton(lambda: built.append(len(built)) or f"from env {len(built)}")
+
+    assert singleton.get() == "from env 1" and singleton.get() == "from env 1"
+    singleton.configure(None)
+    assert singleton.get() is None
+    singleton.reset()
+    assert singleton.get() == "from env 2" and len(built) == 2
+
+def test_preserved_restores_existing_and_resets_new_singletons():
+    """
+    Singletons are put back on exit, including ones first created inside the block.
+    """
+    existing = Singleton(lambda: "from env")
+    existing.configure("configured")
+    with preserved():
+        existing.configure("inside")
+        created = Singleton(lambda: "from env")
+        created.configure("inside")
+
+    assert existing.get() == "configured"
+    assert not created.configured and created.get() == "from env"
+
+if __name__ == "__main__":
+    with isolated():
+        test_singleton_is_built_once_and_can_be_configured()
+        test_preserved_restores_existing_and_resets_new_singletons()
+    print("🎉 Registry tests completed!")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for templated report rendering and batch export
+"""
+
+import csv
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from main import generate_markdown_report
+from src.resume_crew import reports
+from src.resume_crew.reports import candidate_name, export_reports, render_report
+from src.resume_crew.results import ResultsStore, match_row
+
+JOB_URL = "https://careers.example.com/jobs/42"
+
+OPTIMIZATION = {
+    "match_scores": {"technical_skills": 85, "experience_relevance": 62, "education_requirements": 40, "overall_fit": 74},
+    "skill_gaps": ["Terraform", "<Kafka>"],
+    "optimization_suggestions": ["Quantify the migration"],
+    "action_items": ["Add a skills section"],
+}
+
+JOB_ANALYSIS = {"job_title": "Platform Engineer", "required_skills": ["Python"], "location": "Remote"}
+
+def record(candidate, overall_fit=74, job_url=JOB_URL):
+    output = {**OPTIMIZATION, "match_scores": {**OPTIMIZATION["match_scores"], "overall_fit": overall_fit}}
+    return match_row(job_url, candidate, output, company_name="Acme", job_title="Platform Engineer")
+
+def test_report_uses_the_match_not_hardcoded_names():
+    """
+    Candidate, company and role come from the record; the job section only appears with a job analysis.
+    """
+    markdown = render_report(record("knowledge/Jane_Doe_Resume.pdf"), "md", date="May 1, 2026")
+    with_job = render_report(record("knowledge/Jane_Doe_Resume.pdf"), "md", job_analysis=JOB_ANALYSIS)
+    html = render_report(record("jane.pdf"), "html")
+
+    assert markdown.startswith("# Resume Analysis Report: Jane Doe vs Platform Engineer")
+    assert "**Target Position:** Platform Engineer, Acme" in markdown
+    assert "| **Technical Skills** | 85/100 | ✅ Excellent |" in markdown
+    assert "| **Education Requirements** | 40/100 | ❌ Needs Improvement |" in markdown
+    assert "1. **Terraform**" in markdown and "May 1, 2026" in markdown
+    assert "Job Analysis" not in markdown
+    assert "- **Location:** Remote" in with_job and "- Python" in with_job
+    assert "Google" not in with_job and "Abhishek" not in with_job
+    assert "<li>&lt;Kafka&gt;</li>" in html and "<Kafka>" not in html
+    assert candidate_name("resumes/john-smith_cv.txt") == "john smith"
+
+def test_single_run_report_from_task_outputs():
+    """
+    final_report.md is rendered from the saved task outputs, unparsed raw text included.
+    """
+    result_data = {"tasks_output": [
+        {"agent": "Job Requirements Analyst", "raw": '```json\n{"job_title": "Data Engineer", "required_skills": ["SQL"]}\n```'},
+        {"agent": "Resume Optimization Specialist", "parsed": OPTIMIZATION},
+    ]}
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_markdown_report(result_data, Path(tmp), "resumes/Ana_Lima.pdf", JOB_URL, "Acme")
+        content = (Path(tmp) / "final_report.md").read_text(encoding="utf-8")
+
+    assert content.startswith("# Resume Analysis Report: Ana Lima vs Data Engineer")
+    assert "**Overall Match Score:** 74/100" in content
+
+def test_export_streams_reports_and_summary():
+    """
+    Every stored match gets a report per format in its job's directory, plus one summary.csv line.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        with ResultsStore(str(Path(tmp) / "results.sqlite")) as store:
+            store.save_many(
+                [record(f"resumes/candidate_{index}.pdf", index) for index in range(30)]
+                + [record("resumes/other.pdf", 50, job_url="https://careers.example.com/jobs/7")]
+            )
+            stats = export_reports(store.iter_results(), Path(tmp) / "reports",
+                                   job_analyses={JOB_URL: JOB_ANALYSIS})
+            job_only = list(store.iter_results(JOB_URL, chunk_size=7))
+        job_dirs = sorted(path.name for path in (Path(tmp) / "reports").iterdir() if path.is_dir())
+        files = list((Path(tmp) / "reports").rglob("*.html"))
+        with open(stats["summary"], newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+    assert stats["reports"] == 31 and stats["files"] == 62
+    assert len(job_dirs) == 2 and all(name.startswith("platform-engineer-") for name in job_dirs)
+    assert len(files) == 31
+    assert len(rows) == 31 and rows[0]["skill_gaps"] == "Terraform; <Kafka>"
+    assert len(job_only) == 30 and [row["overall_fit"] for row in job_only[:2]] == [29, 28]
+
+def test_template_dir_override():
+    """
+    REPORT_TEMPLATE_DIR replaces the packaged templates.
+    """
+    original = os.environ.get("REPORT_TEMPLATE_DIR")
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "report.md.j2").write_text("{{ report.candidate_name }}: {{ report.scores.overall_fit|score }}\n")
+        os.environ["REPORT_TEMPLATE_DIR"] = tmp
+        try:
+            content = render_report(record("Jane_Doe.pdf"), "md")
+        finally:
+            if original is None:
+                del os.environ["REPORT_TEMPLATE_DIR"]
+            else:
+                os.environ["REPORT_TEMPLATE_DIR"] = original
+            reports._environment.cache_clear()
+
+    assert content == "Jane Doe: 74\n"
+
+if __name__ == "__main__":
+    test_report_uses_the_match_not_hardcoded_names()
+    test_single_run_report_from_task_outputs()
+    test_export_streams_reports_and_summary()
+    test_template_dir_override()
+    print("🎉 Report tests completed!")
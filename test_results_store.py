@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQLite results store
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew.batch import optimize_resumes
+from src.resume_crew.results import ResultsStore, ResultsWriter, configure_results_store, match_row
+
+JOB_URL = "https://example.com/jobs/1"
+
+def optimization(overall_fit, gaps=()):
+    return {
+        "match_scores": {"technical_skills": overall_fit, "overall_fit": overall_fit},
+        "skill_gaps": list(gaps),
+        "optimization_suggestions": ["Quantify impact"]
+    }
+
+def test_rows_are_upserted_and_queried_by_job_and_candidate():
+    """
+    One row per (job, candidate, scorer), updated in place; top-N queries use the job index.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        with ResultsStore(str(Path(tmp) / "results.sqlite")) as store:
+            store.save_many([
+                match_row(JOB_URL, "alice.pdf", optimization(55, ["Go"]), mode="batch"),
+                match_row(JOB_URL, "bob.pdf", optimization(80), mode="batch"),
+                match_row(JOB_URL, "carol.pdf", None, mode="batch"),
+                match_row(JOB_URL, "alice.pdf", optimization(40), scored_by="local"),
+                match_row("https://example.com/jobs/2", "alice.pdf", optimization(90), mode="batch"),
+            ])
+            store.save(match_row(JOB_URL, "alice.pdf", optimization(85, ["Kubernetes"]), seconds=1.5, total_tokens=900))
+
+            top = store.top_for_job(JOB_URL, limit=2)
+            local = store.top_for_job(JOB_URL, scored_by="local")
+            alice = store.for_candidate("alice.pdf")
+            count = len(store)
+            plan = " ".join(row[-1] for row in store.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM results WHERE job_url = ? AND scored_by = ? "
+                "ORDER BY overall_fit DESC LIMIT 50", (JOB_URL, "llm")
+            ))
+            unparsed = store.conn.execute("SELECT status FROM results WHERE candidate = 'carol.pdf'").fetchone()[0]
+
+    assert count == 5
+    assert [row["candidate"] for row in top] == ["alice.pdf", "bob.pdf"]
+    assert top[0]["overall_fit"] == 85 and top[0]["skill_gaps"] == ["Kubernetes"]
+    assert top[0]["suggestions"] == ["Quantify impact"] and top[0]["total_tokens"] == 900
+    assert [row["overall_fit"] for row in local] == [40]
+    assert [row["overall_fit"] for row in alice] == [90, 85, 40]
+    assert unparsed == "unparsed"
+    assert "idx_results_job_fit" in plan and "TEMP B-TREE" not in plan
+
+def test_writer_flushes_in_batches():
+    """
+    Rows are written once a batch fills up, and the rest on flush.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        with ResultsStore(str(Path(tmp) / "results.sqlite")) as store:
+            writer = ResultsWriter(store, batch_size=3)
+            for index in range(5):
+                writer.add(match_row(JOB_URL, f"{index}.pdf", optimization(index)))
+            written_before_flush = len(store)
+            writer.flush()
+            assert len(store) == 5 and writer.written == 5
+    assert written_before_flush == 3
+    ResultsWriter(None).add(match_row(JOB_URL, "ignored.pdf", None))
+
+def test_batch_runs_write_to_the_store():
+    """
+    Every scored resume of a batch run lands in the store with its scores and gaps.
+    """
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(optimization(72, ["Terraform"])):
+        resume_paths = []
+        for name in ("dana", "eli"):
+            path = Path(tmp) / f"{name}.txt"
+            path.write_text(f"{name} - Python engineer")
+            resume_paths.append(str(path))
+        with ResultsStore(str(Path(tmp) / "results.sqlite")) as store:
+            configure_results_store(store)
+            optimize_resumes(JOB_URL, "Example", {"job_title": "Engineer", "required_skills": ["Python"]},
+                             resume_paths, Path(tmp) / "results.jsonl", max_workers=2)
+            rows = store.top_for_job(JOB_URL)
+
+    assert sorted(row["candidate"] for row in rows) == sorted(resume_paths)
+    assert all(row["overall_fit"] == 72 and row["skill_gaps"] == ["Terraform"] for row in rows)
+    assert all(row["job_title"] == "Engineer" and row["mode"] == "batch" for row in rows)
+
+if __name__ == "__main__":
+    with isolated():
+        test_rows_are_upserted_and_queried_by_job_and_candidate()
+        test_writer_flushes_in_batches()
+        test_batch_runs_write_to_the_store()
+    print("🎉 Results store tests completed!")
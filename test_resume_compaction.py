@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test script for token-budgeted resume compaction
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew import runner
+from src.resume_crew.compaction import compact_resume, estimate_tokens, split_sections, strip_page_furniture
+
+JOB = {
+    "required_skills": ["Kubernetes", "Python"],
+    "key_responsibilities": ["Operate cloud infrastructure"]
+}
+
+RESUME = """Jane Doe
+Platform Engineer
+jane@example.com
+
+EXPERIENCE
+Acme Corp, 2019-2023
+Ran Kubernetes clusters and wrote Python automation for cloud infrastructure
+
+INTERESTS
+Chess, hiking, baking sourdough, long-distance cycling and amateur astronomy
+Chess, hiking, baking sourdough, long-distance cycling and amateur astronomy
+
+EDUCATION
+B.Sc. Computer Science, 2019
+"""
+
+def test_page_headers_and_footers_are_stripped():
+    """
+    Lines repeated at the edges of every page go, keeping the first header; page numbers go too.
+    """
+    pages = [
+        "Jane Doe | Resume\nEXPERIENCE\nAcme Corp\nConfidential\nPage 1 of 2",
+        "Jane Doe | Resume\nGlobex\nSKILLS\nPython\nConfidential\nPage 2 of 2"
+    ]
+    text = strip_page_furniture("\f".join(pages))
+    assert text.splitlines() == ["Jane Doe | Resume", "EXPERIENCE", "Acme Corp", "Globex", "SKILLS", "Python"]
+
+def test_sections_are_detected_and_deduplicated():
+    """
+    Headings start sections, and a repeated line is kept once.
+    """
+    sections = split_sections(RESUME)
+    assert [section["title"] for section in sections] == [None, "EXPERIENCE", "INTERESTS", "EDUCATION"]
+    assert len(sections[2]["lines"]) == 2
+
+def test_budget_keeps_relevant_sections():
+    """
+    Under a tight budget the contact section and the job-relevant experience survive.
+    """
+    full = compact_resume(RESUME, JOB, max_tokens=1000)
+    assert full["sections"] == ["EXPERIENCE", "INTERESTS", "EDUCATION"]
+    assert full["tokens_saved"] > 0
+
+    tight = compact_resume(RESUME, JOB, max_tokens=50)
+    assert tight["content"].startswith("Jane Doe")
+    assert "Kubernetes" in tight["content"]
+    assert "sourdough" not in tight["content"]
+    assert "INTERESTS" in tight["sections_dropped"]
+    assert tight["compacted_tokens"] <= 50
+    assert tight["tokens_saved"] == estimate_tokens(RESUME) - tight["compacted_tokens"]
+
+def test_pinned_sections_are_limited():
+    """
+    Only the unheaded preamble and contact or summary sections are pinned,
+    within a quarter of the budget; a leading titled section is ranked.
+    """
+    filler = "\n".join(f"Organized team event number {index} for the office" for index in range(40))
+    leading_interests = f"INTERESTS\n{filler}\n\nSKILLS\nKubernetes, Python"
+    ranked = compact_resume(leading_interests, JOB, max_tokens=100)
+    assert "Kubernetes, Python" in ranked["content"]
+
+    long_preamble = f"Jane Doe\n{filler}\n\nSKILLS\nKubernetes, Python"
+    capped = compact_resume(long_preamble, JOB, max_tokens=200)
+    preamble = capped["content"].split("\n\n")[0]
+    assert preamble.startswith("Jane Doe") and estimate_tokens(preamble) <= 50
+    assert "Kubernetes, Python" in capped["content"]
+
+    headingless = compact_resume(f"Jane Doe\n{filler}", JOB, max_tokens=200)
+    assert 150 < headingless["compacted_tokens"] <= 200
+
+def test_overlong_first_line_is_cut_not_dropped():
+    """
+    A section whose first line alone exceeds the budget keeps the part that fits,
+    so a one-line resume never compacts to nothing.
+    """
+    one_line = "Jane Doe, platform engineer: " + "Kubernetes and Python services at scale, " * 200
+    compacted = compact_resume(one_line, JOB, max_tokens=100)
+    assert compacted["content"].startswith("Jane Doe, platform engineer")
+    assert 90 <= compacted["compacted_tokens"] <= 100
+
+    long_summary = f"Jane Doe\n\nSUMMARY\n{one_line}\n\nSKILLS\nKubernetes, Python"
+    pinned = compact_resume(long_summary, JOB, max_tokens=200)
+    assert "SUMMARY" in pinned["sections"] and "Kubernetes, Python" in pinned["content"]
+    assert pinned["compacted_tokens"] <= 200
+
+def test_optimization_task_embeds_compacted_resume():
+    """
+    The optimization prompt carries the compacted resume text and the record reports the savings.
+    """
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew({"match_scores": {"overall": 80}}) as crew:
+        resume_path = Path(tmp) / "jane.txt"
+        resume_path.write_text(RESUME)
+        record = runner.run_resume_optimization("https://example.com/job", "Example", str(resume_path), JOB)
+
+    description = crew.descriptions[-1]
+    assert "Ran Kubernetes clusters" in description
+    assert description.count("amateur astronomy") == 1
+    assert record["compaction"]["tokens_saved"] > 0
+    assert "content" not in record["compaction"]
+
+if __name__ == "__main__":
+    with isolated():
+        test_page_headers_and_footers_are_stripped()
+        test_sections_are_detected_and_deduplicated()
+        test_budget_keeps_relevant_sections()
+        test_pinned_sections_are_limited()
+        test_overlong_first_line_is_cut_not_dropped()
+        test_optimization_task_embeds_compacted_resume()
+    print("🎉 Resume compaction tests completed!")
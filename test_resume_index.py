@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the incremental resume index
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.resume_crew.index import ResumeIndex
+
+JOB_ANALYSIS = {
+    "required_skills": ["Kubernetes", "Python"],
+    "preferred_skills": ["Terraform"],
+}
+
+def test_index_search_and_incremental_update():
+    """
+    Only changed files are re-indexed and BM25 ranks the best match first.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        resumes = Path(tmp) / "resumes"
+        resumes.mkdir()
+        (resumes / "alice.txt").write_text("Python and Kubernetes engineer. Terraform modules.")
+        (resumes / "bob.txt").write_text("Python data analyst.")
+        (resumes / "carol.md").write_text("Pastry chef.")
+
+        with ResumeIndex(Path(tmp) / "index.sqlite") as index:
+            stats = index.update_directory(str(resumes))
+            assert stats["added"] == 3
+            assert len(index) == 3
+
+            results = index.search_job(JOB_ANALYSIS, top_k=2)
+            assert [Path(path).name for path, _ in results] == ["alice.txt", "bob.txt"]
+
+            assert index.update_directory(str(resumes))["unchanged"] == 3
+
+            (resumes / "bob.txt").write_text("Python, Kubernetes and Terraform platform engineer.")
+            os.utime(resumes / "bob.txt", (0, 1))
+            (resumes / "carol.md").unlink()
+            stats = index.update_directory(str(resumes))
+            assert (stats["updated"], stats["unchanged"], stats["removed"]) == (1, 1, 1)
+            assert Path(index.search_job(JOB_ANALYSIS, top_k=1)[0][0]).name in ("alice.txt", "bob.txt")
+            assert len(index) == 2
+
+if __name__ == "__main__":
+    test_index_search_and_incremental_update()
+    print("🎉 Resume index tests completed!")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for ranking one resume against many job postings
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew import runner
+from src.resume_crew.cache import JobProfileCache, TaskOutputCache
+from src.resume_crew.profiles import configure_profile_cache
+from src.resume_crew.roles import collect_jobs, run_role_matching
+from src.resume_crew.tools import ResumeAnalysisTools
+
+RESUME = "Backend engineer, 2016 - 2024. Python, Django, PostgreSQL, Docker."
+
+# Posting text -> the skills the stub job analysis reports for it
+POSTINGS = {
+    "Python Developer": ["Python", "Django", "PostgreSQL"],
+    "Platform Engineer": ["Python", "Docker", "Kubernetes"],
+    "iOS Developer": ["Swift", "Objective-C", "Xcode"],
+}
+
+def review_posting(role, description):
+    """Analyzes the stub postings and reviews resumes without an LLM."""
+    title = next(title for title in POSTINGS if title in description)
+    if role == "Job Requirements Analyst":
+        return {"job_title": title, "required_skills": POSTINGS[title]}
+    return {"match_scores": {"overall_fit": 90 if title == "Platform Engineer" else 70},
+            "skill_gaps": ["Kubernetes"] if title == "Platform Engineer" else []}
+
+def test_collect_jobs_from_manifests():
+    """
+    JSON and text manifests give job entries; duplicate postings are kept once.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = Path(tmp) / "jobs.txt"
+        manifest.write_text("# open roles\nhttps://a.example.com/1 Acme Corp\nhttps://b.example.com/2\nhttps://a.example.com/1\n")
+        jobs = collect_jobs(str(manifest))
+        json_manifest = Path(tmp) / "jobs.json"
+        json_manifest.write_text(json.dumps(["https://c.example.com/3", {"url": "https://d.example.com/4", "company": "Delta"}]))
+        json_jobs = collect_jobs(str(json_manifest))
+
+    assert [job["job_url"] for job in jobs] == ["https://a.example.com/1", "https://b.example.com/2"]
+    assert jobs[0]["company_name"] == "Acme Corp"
+    assert jobs[1]["company_name"] == "b.example.com"
+    assert [job["company_name"] for job in json_jobs] == ["c.example.com", "Delta"]
+
+def test_one_resume_ranked_against_many_roles():
+    """
+    The resume is parsed once, each posting is analyzed once (stored profiles
+    are reused on the next run), and only the top roles get an LLM review.
+    """
+    jobs = [
+        {"job_url": f"https://jobs.example.com/{index}", "company_name": "Example", "job_text": f"{title} wanted"}
+        for index, title in enumerate(POSTINGS)
+    ]
+    original_analyze = ResumeAnalysisTools.analyze_resume
+    parses = []
+
+    def counting_analyze(resume_path):
+        parses.append(resume_path)
+        return original_analyze(resume_path)
+
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(review_posting) as crew:
+        resume_path = Path(tmp) / "resume.txt"
+        resume_path.write_text(RESUME)
+        configure_profile_cache(JobProfileCache(Path(tmp) / "profiles"))
+        ResumeAnalysisTools.analyze_resume = staticmethod(counting_analyze)
+        try:
+            summary = run_role_matching(str(resume_path), jobs, Path(tmp) / "output", top_k=2, max_workers=2)
+            assert (Path(tmp) / "output" / "role_ranking.json").exists()
+            rerun = run_role_matching(str(resume_path), jobs, Path(tmp) / "output", top_k=1, max_workers=2)
+            kickoffs = crew.kickoffs.copy()
+
+            # With the task cache on, a repeated review is a cache hit rather than an LLM call
+            runner.configure_task_cache(TaskOutputCache(Path(tmp) / "tasks"))
+            run_role_matching(str(resume_path), jobs, Path(tmp) / "output", top_k=1, max_workers=2)
+            cached_rerun = run_role_matching(str(resume_path), jobs, Path(tmp) / "output", top_k=1, max_workers=2)
+        finally:
+            ResumeAnalysisTools.analyze_resume = original_analyze
+
+    assert parses == [str(resume_path)] * 4
+    assert kickoffs == {"Job Requirements Analyst": 3, "Resume Optimization Specialist": 3}
+
+    ranking = summary["ranking"]
+    assert [entry["job_title"] for entry in ranking] == ["Platform Engineer", "Python Developer", "iOS Developer"]
+    assert ranking[0]["llm_review"]["overall_fit"] == 90
+    assert ranking[0]["skill_gaps"] == ["Kubernetes"]
+    assert ranking[1]["local_overall_fit"] > ranking[0]["local_overall_fit"]
+    assert ranking[2]["llm_review"] is None
+    assert "Swift" in ranking[2]["skill_gaps"] and not ranking[2]["matched_skills"]
+    assert summary["llm_calls_made"] == 5 and summary["llm_calls_avoided"] == 1
+
+    assert rerun["profiles_reused"] == 3
+    assert rerun["llm_calls_made"] == 1 and rerun["llm_calls_avoided"] == 5
+    assert crew.kickoffs["Resume Optimization Specialist"] == 4
+    assert cached_rerun["llm_calls_made"] == 0 and cached_rerun["llm_calls_avoided"] == 6
+
+if __name__ == "__main__":
+    with isolated():
+        test_collect_jobs_from_manifests()
+        test_one_resume_ranked_against_many_roles()
+    print("🎉 Role matching tests completed!")
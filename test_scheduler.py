@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test script for the crew scheduler against a local fake LLM endpoint
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+import src.resume_crew.batch as batch_module
+from fixtures import FakeCrew, isolated
+from src.resume_crew.artifacts import configure_artifact_cache
+from src.resume_crew.cache import ArtifactCache
+from src.resume_crew.runner import estimate_optimization_tokens
+from src.resume_crew.scheduler import RESERVED_TOKENS_PER_CALL, CrewScheduler, TokenBucket
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Answers completions, rejecting every third request with a 429."""
+
+    lock = threading.Lock()
+    request_count = 0
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_POST(self):
+        cls = FakeLLMHandler
+        with cls.lock:
+            cls.request_count += 1
+            rejected = cls.request_count % 3 == 0
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(0.02)
+            if rejected:
+                self.send_response(429)
+                self.send_header("Retry-After", "0.01")
+                self.end_headers()
+                return
+            payload = json.dumps({"choices": [{"message": {"content": body["prompt"].upper()}}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+def test_scheduler_caps_concurrency_and_retries_429():
+    """
+    All jobs finish despite 429s, and never more than max_concurrency run at once.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLMHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/v1/completions"
+
+    def complete(prompt):
+        response = requests.post(endpoint, json={"prompt": prompt}, timeout=5)
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+
+    try:
+        scheduler = CrewScheduler(max_concurrency=3, base_delay=0.01)
+        finished = []
+        results = scheduler.run(
+            complete, [f"resume {i}" for i in range(12)],
+            on_result=lambda item, result, error: finished.append(item)
+        )
+        assert results == [f"RESUME {i}" for i in range(12)]
+        assert len(finished) == 12
+        assert scheduler.stats["rate_limited"] > 0
+        assert scheduler.stats["failed"] == 0
+        assert FakeLLMHandler.max_in_flight <= 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_token_bucket_limits_rate():
+    """
+    Once the burst capacity is used up, acquisitions wait for the refill rate.
+    """
+    async def drain():
+        bucket = TokenBucket(rate_per_minute=1200, capacity=5)
+        start = time.monotonic()
+        for _ in range(10):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(drain()) >= 0.2
+
+def test_token_estimates_are_settled_with_reported_usage():
+    """
+    Estimates follow the prompt size; once a job reports its usage the bucket
+    is refunded (cache hits cost nothing) or charged the overrun.
+    """
+    job_analysis = {"job_title": "Engineer", "required_skills": ["Python"]}
+    estimate = estimate_optimization_tokens(job_analysis, "x" * 400)
+    assert estimate == len(json.dumps(job_analysis, indent=2)) // 4 + 1 + 100 + RESERVED_TOKENS_PER_CALL
+    assert estimate_optimization_tokens(job_analysis, "x" * 10**6) < estimate + 10**5 // 4
+
+    def timed(records, estimate):
+        scheduler = CrewScheduler(max_concurrency=1, tokens_per_minute=6000)
+        start = time.monotonic()
+        scheduler.run(lambda record: record, records, estimate_tokens=lambda _: estimate)
+        return time.monotonic() - start, scheduler.stats
+
+    # 100 tokens/s with a 6000 token burst: without refunds the second 5000 token job would wait 40s
+    refunded, stats = timed([{"total_tokens": 100}, {"cached": True, "total_tokens": 900}, {"total_tokens": 50}], 5000)
+    assert refunded < 0.5
+    assert (stats["estimated_tokens"], stats["reported_tokens"]) == (15000, 150)
+
+    # An overrun leaves the bucket 40 tokens in debt, so the next job waits about 0.5s for the refill
+    charged, _ = timed([{"total_tokens": 6040}, {"total_tokens": 10}], 10)
+    assert charged >= 0.4
+
+def test_cached_batch_rerun_leaves_the_token_bucket_alone():
+    """
+    Re-running an unchanged batch reuses every match: no tokens are reported
+    or charged, and the rows do not repeat the first run's time and tokens.
+    """
+    schedulers = []
+
+    class RecordingScheduler(CrewScheduler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            schedulers.append(self)
+
+    job_analysis = {"job_title": "Engineer", "required_skills": ["Python"]}
+    answer = {"match_scores": {"overall_fit": 70}, "skill_gaps": [], "optimization_suggestions": []}
+    original = batch_module.CrewScheduler, os.environ.get("LLM_TOKENS_PER_MINUTE")
+    batch_module.CrewScheduler = RecordingScheduler
+    try:
+        with tempfile.TemporaryDirectory() as tmp, FakeCrew(answer, token_usage={"total_tokens": 1500}) as crew:
+            configure_artifact_cache(ArtifactCache(str(Path(tmp) / "artifacts")))
+            resume_paths = []
+            for name in ("ana", "ben", "cai"):
+                path = Path(tmp) / f"{name}.txt"
+                path.write_text(f"{name} - Python engineer")
+                resume_paths.append(str(path))
+            run = lambda: batch_module.optimize_resumes(
+                "https://example.com/jobs/1", "Example", job_analysis, resume_paths,
+                Path(tmp) / "results.jsonl", max_workers=1
+            )
+            run()
+            # The bucket holds one estimate, so charging a cached rerun 1500 tokens a resume would stall it
+            os.environ["LLM_TOKENS_PER_MINUTE"] = str(estimate_optimization_tokens(job_analysis))
+            start = time.monotonic()
+            rerun = run()
+            elapsed = time.monotonic() - start
+    finally:
+        batch_module.CrewScheduler = original[0]
+        if original[1] is None:
+            os.environ.pop("LLM_TOKENS_PER_MINUTE", None)
+        else:
+            os.environ["LLM_TOKENS_PER_MINUTE"] = original[1]
+
+    first, second = (scheduler.stats for scheduler in schedulers)
+    assert first["reported_tokens"] == 4500 and second["reported_tokens"] == 0
+    assert sum(crew.kickoffs.values()) == 3 and elapsed < 1
+    assert all(record["cached"] and record["total_tokens"] == 0 and record["seconds"] is None for record in rerun)
+
+if __name__ == "__main__":
+    with isolated():
+        test_scheduler_caps_concurrency_and_retries_429()
+        test_token_bucket_limits_rate()
+        test_token_estimates_are_settled_with_reported_usage()
+        test_cached_batch_rerun_leaves_the_token_bucket_alone()
+    print("🎉 Scheduler tests completed!")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test script for embedding-based semantic matching
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated
+from src.resume_crew.batch import blend_semantic_fit
+from src.resume_crew.semantic import (
+    EmbeddingStore, HashingEmbedder, SemanticIndex, configure_embedder, requirement_items, resume_chunks
+)
+
+# Paraphrases share a concept axis, so the stub "understands" them without a model
+CONCEPTS = {
+    "orchestration": ("kubernetes", "container orchestration", "k8s"),
+    "infrastructure": ("terraform", "infrastructure as code"),
+    "python": ("python", "django"),
+    "baking": ("pastry", "bread"),
+}
+
+class ConceptEmbedder:
+    """Deterministic stand-in for a sentence model: one axis per concept, counting embed calls."""
+
+    name = "concepts-test"
+    dim = len(CONCEPTS) + 1
+
+    def __init__(self):
+        self.texts = []
+
+    def embed(self, texts):
+        self.texts.extend(texts)
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            text = text.lower()
+            for column, phrases in enumerate(CONCEPTS.values()):
+                vectors[row, column] = sum(text.count(phrase) for phrase in phrases)
+            vectors[row, -1] = 0.1
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+JOB_ANALYSIS = {
+    "required_skills": ["Kubernetes", "Python"],
+    "preferred_skills": ["Terraform"],
+    "key_responsibilities": ["Run container orchestration for product teams"],
+}
+
+RESUMES = {
+    "ana.txt": "EXPERIENCE\nRan container orchestration on k8s for 40 services\nSKILLS\nDjango, infrastructure as code",
+    "ben.txt": "SKILLS\nPython, Django",
+    "cai.txt": "EXPERIENCE\nPastry chef, sourdough bread",
+}
+
+def test_hashing_embedder_is_deterministic_and_normalized():
+    """
+    The default backend needs no model: same text, same unit vector; shared word forms score higher.
+    """
+    embedder = HashingEmbedder(dim=256)
+    vectors = embedder.embed(["Deployed Kubernetes clusters", "deploying kubernetes cluster", "Pastry chef", ""])
+    again = HashingEmbedder(dim=256).embed(["Deployed Kubernetes clusters"])
+
+    assert vectors.shape == (4, 256) and vectors.dtype == np.float32
+    assert np.allclose(vectors[0], again[0])
+    assert np.allclose(np.linalg.norm(vectors[:3], axis=1), 1.0) and not vectors[3].any()
+    assert vectors[0] @ vectors[1] > 0.5 > vectors[0] @ vectors[2]
+
+def test_store_caches_embeddings_by_content_hash():
+    """
+    Text is embedded once, across store instances; vectors are read back through a float32 memory map.
+    """
+    embedder = ConceptEmbedder()
+    with tempfile.TemporaryDirectory() as tmp:
+        with EmbeddingStore(tmp, embedder) as store:
+            rows = store.rows(["python", "k8s", "python"])
+            first = np.array(store.matrix[rows])
+        with EmbeddingStore(tmp, embedder) as store:
+            again = store.rows(["k8s", "python", "terraform"])
+            matrix = store.matrix
+            reopened = np.array(matrix[again])
+
+    assert list(rows) == [0, 1, 0] and list(again) == [1, 0, 2]
+    assert embedder.texts == ["python", "k8s", "terraform"]
+    assert isinstance(matrix, np.memmap) and matrix.dtype == np.float32 and matrix.shape == (3, ConceptEmbedder.dim)
+    assert np.allclose(reopened[:2], first[[1, 0]])
+
+def test_semantic_search_finds_paraphrases_and_skips_unchanged_resumes():
+    """
+    A resume that paraphrases the requirements ranks first; re-indexing an unchanged pool embeds nothing.
+    """
+    embedder = ConceptEmbedder()
+    with tempfile.TemporaryDirectory() as tmp:
+        with SemanticIndex(tmp, embedder) as index:
+            stats = index.add_many(RESUMES.items())
+            results = index.search_job(JOB_ANALYSIS, top_k=2)
+            scores = index.score_job(JOB_ANALYSIS, ["cai.txt", "ben.txt"])
+            embedded = len(embedder.texts)
+            rerun = index.add_many(RESUMES.items())
+            assert len(embedder.texts) == embedded
+            pruned = index.add_many([("ana.txt", RESUMES["ana.txt"] + "\nPython")], prune=True)
+            count = len(index)
+
+    assert stats["added"] == 3 and stats["embedded"] == 4
+    assert [name for name, _ in results] == ["ana.txt", "ben.txt"]
+    assert results[0][1] > 80 > results[1][1]
+    assert set(scores) == {"cai.txt", "ben.txt"} and scores["cai.txt"] < 10
+    assert (rerun["unchanged"], rerun["embedded"]) == (3, 0)
+    assert (pruned["updated"], pruned["removed"], count) == (1, 2, 1)
+
+def test_chunks_and_requirement_items():
+    """
+    Long sections are chunked with their title repeated; duplicate requirements keep the highest weight.
+    """
+    text = "EXPERIENCE\n" + "\n".join(f"Built service number {index} with ten more words here" for index in range(20))
+    chunks = resume_chunks(text)
+    items = requirement_items({"required_skills": ["Python"], "preferred_skills": ["Python", "Go"]})
+
+    assert len(chunks) > 1 and all(chunk.startswith("EXPERIENCE") for chunk in chunks)
+    assert all(len(chunk.split()) <= 80 for chunk in chunks)
+    assert items == [("Python", 1.0), ("Go", 0.5)]
+
+def test_pipeline_blends_semantic_fit():
+    """
+    The semantic share is blended into the local overall fit; the keyword fit is kept.
+    """
+    local_results = [
+        {"resume_path": name, "match_scores": {"overall_fit": 50.0}, "status": "success"} for name in RESUMES
+    ] + [{"resume_path": "broken.pdf", "error": "unreadable", "status": "error"}]
+    parsed = [{"content": text} for text in RESUMES.values()] + [{"error": "unreadable"}]
+    with tempfile.TemporaryDirectory() as tmp:
+        original = os.environ.get("EMBEDDING_DIR")
+        os.environ["EMBEDDING_DIR"] = tmp
+        configure_embedder(ConceptEmbedder())
+        try:
+            blend_semantic_fit(local_results, parsed, JOB_ANALYSIS, 0.5)
+        finally:
+            if original is None:
+                del os.environ["EMBEDDING_DIR"]
+            else:
+                os.environ["EMBEDDING_DIR"] = original
+
+    ana, ben, cai, broken = (record.get("match_scores") for record in local_results)
+    assert ana["keyword_fit"] == 50.0 and ana["overall_fit"] == round(25 + ana["semantic_fit"] / 2, 1)
+    assert ana["overall_fit"] > ben["overall_fit"] > cai["overall_fit"]
+    assert broken is None
+
+if __name__ == "__main__":
+    with isolated():
+        test_hashing_embedder_is_deterministic_and_normalized()
+        test_store_caches_embeddings_by_content_hash()
+        test_semantic_search_finds_paraphrases_and_skips_unchanged_resumes()
+        test_chunks_and_requirement_items()
+        test_pipeline_blends_semantic_fit()
+    print("🎉 Semantic matching tests completed!")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTTP matching service
+"""
+
+import base64
+import http.client
+import json
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import isolated
+import src.resume_crew.profiles as profiles_module
+import src.resume_crew.service as service_module
+from src.resume_crew.cache import JobProfileCache
+from src.resume_crew.profiles import JobProfile, configure_profile_cache
+from src.resume_crew.service import MAX_BODY_BYTES, MatchService, create_server
+
+JOB_ANALYSIS = {
+    "job_title": "Backend Engineer",
+    "required_skills": ["Python", "SQL"],
+    "preferred_skills": ["Kubernetes"]
+}
+
+def post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_match_endpoint_runs_requests_concurrently():
+    """
+    /match accepts job text with uploaded or path resumes, reuses pooled agents,
+    analyzes the job once, and serves overlapping requests in parallel.
+    Uploads and per-job locks do not outlive the requests.
+    """
+    agents_seen = set()
+    job_analyses = []
+
+    def fake_job_analysis(job_url, company_name, verbose=False, job_text=None, agent=None):
+        agents_seen.add(id(agent))
+        job_analyses.append(job_text)
+        assert "Backend Engineer" in job_text
+        return {"agent": agent.role, "raw": json.dumps(JOB_ANALYSIS), "parsed": JOB_ANALYSIS, "cached": False}
+
+    def fake_resume_optimization(job_url, company_name, resume_path, job_analysis, verbose=False, agent=None):
+        agents_seen.add(id(agent))
+        assert isinstance(job_analysis, JobProfile)
+        time.sleep(0.3)
+        return {"agent": agent.role, "raw": "{}", "parsed": {"resume_path": resume_path}, "cached": False}
+
+    original = profiles_module.run_job_analysis, service_module.run_resume_optimization
+    profiles_module.run_job_analysis = fake_job_analysis
+    service_module.run_resume_optimization = fake_resume_optimization
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_profile_cache(JobProfileCache(str(Path(tmp) / "profiles")))
+            resume = Path(tmp) / "resume.txt"
+            resume.write_text("Python and SQL developer with Kubernetes experience")
+            service = MatchService(pool_size=2, upload_dir=str(Path(tmp) / "uploads"))
+            server = create_server(service, "127.0.0.1", 0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"http://127.0.0.1:{server.server_port}/match"
+            try:
+                requests = [
+                    {"job_text": "Backend Engineer: Python, SQL", "resume_path": str(resume)},
+                    {"job_text": "Backend Engineer: Python, SQL", "resume_text": "Java developer"},
+                    {"job_text": "Backend Engineer: Python, SQL", "resume_filename": "cv.md",
+                     "resume_base64": base64.b64encode(b"# CV\nSQL analyst").decode("ascii")},
+                ]
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=3) as pool:
+                    responses = list(pool.map(lambda payload: post(url, payload), requests))
+                elapsed = time.perf_counter() - start
+
+                assert all(status == 200 for status, _ in responses), responses
+                assert len(job_analyses) == 1
+                # Two resume agents: three 0.3s runs finish in two rounds, not three
+                assert elapsed < 0.85, elapsed
+                assert len(agents_seen) <= 4
+                first = responses[0][1]
+                assert set(first["local_scores"]["matched_skills"]) == {"Python", "SQL", "Kubernetes"}
+                assert responses[1][1]["resume_path"].endswith(".txt")
+                assert responses[2][1]["resume_path"].endswith(".md")
+                assert not list((Path(tmp) / "uploads").iterdir()) and not service._job_locks
+
+                status, error = post(url, {"resume_text": "no job"})
+                assert status == 400 and error["status"] == "error"
+            finally:
+                server.shutdown()
+                server.server_close()
+    finally:
+        profiles_module.run_job_analysis, service_module.run_resume_optimization = original
+
+def test_error_statuses_and_early_rejections():
+    """
+    Payload problems are 400s, failures while matching are 500s, and
+    rejections sent before the body was read close the connection.
+    """
+    def failing_resume_optimization(*args, **kwargs):
+        raise ValueError("could not convert the model answer")
+
+    original = profiles_module.run_job_analysis, service_module.run_resume_optimization
+    profiles_module.run_job_analysis = lambda *args, agent=None, **kwargs: {
+        "agent": agent.role, "raw": json.dumps(JOB_ANALYSIS), "parsed": JOB_ANALYSIS, "cached": False
+    }
+    service_module.run_resume_optimization = failing_resume_optimization
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            service = MatchService(pool_size=1, upload_dir=str(Path(tmp) / "uploads"))
+            server = create_server(service, "127.0.0.1", 0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"http://127.0.0.1:{server.server_port}/match"
+            try:
+                crew_failure = post(url, {"job_text": "Backend Engineer", "resume_text": "Python"})
+                missing_resume = post(url, {"job_text": "Backend Engineer", "resume_path": str(Path(tmp) / "none.pdf")})
+
+                connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+                connection.request("POST", "/match", body=b"{not json")
+                malformed = connection.getresponse()
+                malformed.read()
+                kept_alive = malformed.getheader("Connection")
+
+                connection.putrequest("POST", "/match")
+                connection.putheader("Content-Length", str(MAX_BODY_BYTES + 1))
+                connection.endheaders()
+                too_large = connection.getresponse()
+                too_large.read()
+                connection.close()
+
+                connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+                connection.putrequest("POST", "/match")
+                connection.putheader("Content-Length", "-1")
+                connection.endheaders()
+                negative = connection.getresponse()
+                negative.read()
+                connection.close()
+                uploads_left = list((Path(tmp) / "uploads").iterdir())
+            finally:
+                server.shutdown()
+                server.server_close()
+    finally:
+        profiles_module.run_job_analysis, service_module.run_resume_optimization = original
+
+    assert crew_failure[0] == 500 and "model answer" in crew_failure[1]["error"]
+    assert missing_resume[0] == 400 and "not found" in missing_resume[1]["error"]
+    assert malformed.status == 400 and kept_alive is None
+    assert too_large.status == 413 and too_large.getheader("Connection") == "close"
+    assert negative.status == 400 and negative.getheader("Connection") == "close"
+    assert uploads_left == []
+
+if __name__ == "__main__":
+    with isolated():
+        test_match_endpoint_runs_requests_concurrently()
+        test_error_statuses_and_early_rejections()
+    print("🎉 Service tests completed!")
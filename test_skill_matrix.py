@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for the pool-wide skill matrix
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.resume_crew.scoring import MatchScorer
+from src.resume_crew.skill_matrix import SkillMatrix
+from src.resume_crew.taxonomy import SkillTaxonomy
+
+JOB_ANALYSIS = {
+    "required_skills": ["Python", "Google Cloud Platform", "Design scalable distributed data systems"],
+    "preferred_skills": ["Terraform"],
+}
+
+RESUMES = {
+    "alice": "Python developer on Google Cloud Platform, built distributed data systems. Terraform.",
+    "bob": "Python scripts. Worked at Google. Cloud enthusiast.",
+    "carol": "Accountant with Excel expertise.",
+}
+
+def test_skill_matrix_presence_gaps_and_ranking():
+    """
+    Phrases must match exactly, rows must not leak into each other, and
+    rankings follow weighted coverage.
+    """
+    # An empty taxonomy isolates the array matching from alias lookups
+    matrix = SkillMatrix.build(JOB_ANALYSIS, RESUMES.values(), candidate_ids=list(RESUMES), chunk_size=2,
+                               taxonomy=SkillTaxonomy({}))
+
+    assert matrix.presence.shape == (3, 4)
+    assert matrix.presence[0].all()
+    assert matrix.gaps(1) == ["Google Cloud Platform", "Design scalable distributed data systems"]
+    assert matrix.gaps(2, include_preferred=True) == matrix.skills
+    assert [candidate for candidate, _ in matrix.rank()] == ["alice", "bob", "carol"]
+    assert matrix.rank(min_score=50) == [("alice", 100.0)]
+    assert matrix.coverage()["Python"] == 2 / 3
+
+def test_skill_matrix_agrees_with_match_scorer_on_aliases():
+    """
+    A resume naming a skill by a taxonomy alias ("k8s") has no gap for it in
+    the matrix either; both outputs use the canonical name.
+    """
+    job_analysis = {"required_skills": ["Kubernetes", "Python", "K8s"], "preferred_skills": ["Terraform"]}
+    resumes = ["Ran k8s clusters with Python", "Python only"]
+    matrix = SkillMatrix.build(job_analysis, resumes)
+    scorer = MatchScorer(job_analysis)
+
+    assert matrix.skills == ["Kubernetes", "Python", "Terraform"]
+    for row, text in enumerate(resumes):
+        assert matrix.gaps(row, include_preferred=True) == scorer.score(text)["skill_gaps"]
+    assert matrix.gaps(0) == [] and matrix.gaps(1) == ["Kubernetes"]
+
+def test_skills_with_the_same_tokens_are_both_credited():
+    """
+    Skills that normalize to the same phrase ("CI/CD", "CI CD") and that
+    the taxonomy does not merge are each present when the phrase appears.
+    """
+    job_analysis = {"required_skills": ["CI/CD", "Python"], "preferred_skills": ["CI CD"]}
+    resumes = ["Built CI/CD pipelines in Python", "Python only"]
+    matrix = SkillMatrix.build(job_analysis, resumes, taxonomy=SkillTaxonomy({}))
+
+    assert matrix.skills == ["CI/CD", "Python", "CI CD"]
+    assert matrix.gaps(0, include_preferred=True) == []
+    assert matrix.gaps(1, include_preferred=True) == ["CI/CD", "CI CD"]
+    assert matrix.scores()[0] == 100
+
+if __name__ == "__main__":
+    test_skill_matrix_presence_gaps_and_ranking()
+    test_skill_matrix_agrees_with_match_scorer_on_aliases()
+    test_skills_with_the_same_tokens_are_both_credited()
+    print("🎉 Skill matrix tests completed!")
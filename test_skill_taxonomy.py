@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for the skill taxonomy and its compiled matcher
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.resume_crew.scoring import MatchScorer
+from src.resume_crew.taxonomy import SkillTaxonomy
+
+def test_extracts_canonical_skills_in_one_pass():
+    """
+    Aliases, multi-token names and overlapping matches resolve to canonical
+    skills; names that are ordinary words only match through their aliases.
+    """
+    taxonomy = SkillTaxonomy.load()
+    found = taxonomy.extract(
+        "Ran k8s on Google Cloud Platform, wrote PL/SQL and golang services. Go-getter, free to go."
+    )
+    assert {"Kubernetes", "Google Cloud Platform", "SQL", "Go"} <= found
+    assert "Go" not in taxonomy.extract("Go-getter who is free to go")
+    assert taxonomy.canonical("GCP") == "Google Cloud Platform"
+    assert taxonomy.canonical("go") == "Go"
+    assert taxonomy.canonical("Underwater basket weaving") is None
+
+def test_custom_taxonomy_with_shared_prefixes():
+    """
+    Patterns sharing prefixes and suffixes are all reported (failure links).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "taxonomy.json"
+        path.write_text(json.dumps({"skills": {
+            "Data Engineering": {"aliases": ["big data engineering"]},
+            "Big Data": {"aliases": []},
+            "Engineering Management": {"aliases": ["engineering manager"]}
+        }}))
+        taxonomy = SkillTaxonomy.load(str(path))
+    assert taxonomy.extract("big data engineering manager") == {
+        "Data Engineering", "Big Data", "Engineering Management"
+    }
+
+def test_scorer_uses_canonical_skills():
+    """
+    Job and resume aliases meet at the canonical skill, and gaps use canonical names.
+    """
+    job = {"required_skills": ["K8s", "Kubernetes", "GCP", "Python"], "preferred_skills": ["Golang"]}
+    scored = MatchScorer(job, reference_year=2024).score("Kubernetes and Google Cloud engineer, Python3.")
+    assert scored["matched_skills"] == ["Kubernetes", "Google Cloud Platform", "Python"]
+    assert scored["skill_gaps"] == ["Go"]
+
+def test_extraction_throughput():
+    """
+    Extraction handles megabytes of resume text per second.
+    """
+    taxonomy = SkillTaxonomy.load()
+    text = (Path(__file__).parent / "knowledge" / "CV_Mohan.txt").read_text() * 200
+    start = time.perf_counter()
+    taxonomy.extract(text)
+    megabytes_per_second = len(text) / 1e6 / (time.perf_counter() - start)
+    print(f"   {megabytes_per_second:.1f} MB/s")
+    assert megabytes_per_second > 1.0
+
+if __name__ == "__main__":
+    test_extracts_canonical_skills_in_one_pass()
+    test_custom_taxonomy_with_shared_prefixes()
+    test_scorer_uses_canonical_skills()
+    test_extraction_throughput()
+    print("🎉 Skill taxonomy tests completed!")
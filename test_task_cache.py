@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for memoized LLM task outputs
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from fixtures import FakeCrew, isolated
+from src.resume_crew import runner
+from src.resume_crew.cache import TaskOutputCache
+
+JOB_ANALYSIS = {"job_title": "Engineer", "required_skills": ["Python"]}
+
+def test_identical_task_is_served_from_cache():
+    """
+    The second identical job analysis is a cache hit and never reaches the crew.
+    """
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(JOB_ANALYSIS) as crew:
+        cache = TaskOutputCache(tmp)
+        runner.configure_task_cache(cache)
+        first = runner.run_job_analysis("https://example.com/job", "Example")
+        second = runner.run_job_analysis("https://example.com/job", "Example")
+        other = runner.run_job_analysis("https://example.com/other-job", "Example")
+
+    assert sum(crew.kickoffs.values()) == 2
+    assert (first["cached"], second["cached"], other["cached"]) == (False, True, False)
+    assert second["parsed"] == first["parsed"] == JOB_ANALYSIS
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_unparsed_output_is_not_cached():
+    """
+    An answer that fails to parse against the task's output model is not
+    cached: the rerun reaches the crew again and caches the valid answer.
+    """
+    answers = ["Sorry, I could not open the job page.", JOB_ANALYSIS]
+    with tempfile.TemporaryDirectory() as tmp, FakeCrew(lambda role, description: answers.pop(0)) as crew:
+        runner.configure_task_cache(TaskOutputCache(tmp))
+        failed = runner.run_job_analysis("https://example.com/flaky-job", "Example")
+        retried = runner.run_job_analysis("https://example.com/flaky-job", "Example")
+        cached = runner.run_job_analysis("https://example.com/flaky-job", "Example")
+
+    assert failed["parsed"] is None and failed["raw"].startswith("Sorry")
+    assert (retried["cached"], cached["cached"]) == (False, True)
+    assert cached["parsed"] == JOB_ANALYSIS
+    assert sum(crew.kickoffs.values()) == 2
+
+if __name__ == "__main__":
+    with isolated():
+        test_identical_task_is_served_from_cache()
+        test_unparsed_output_is_not_cached()
+    print("🎉 Task cache tests completed!")